@@ -8,13 +8,22 @@ Supports parallel downloads, fast interpolation, and optimized PNG exports.
 __version__ = "2.9.2"
 __author__ = "Radar Processing Team"
 
-from .processing.exporter import ExportConfig, MultiFormatExporter
-from .sources.arso import ARSORadarSource
-from .sources.chmi import CHMIRadarSource
-from .sources.dwd import DWDRadarSource
-from .sources.imgw import IMGWRadarSource
-from .sources.omsz import OMSZRadarSource
-from .sources.shmu import SHMURadarSource
+import importlib
+from typing import Any
+
+# Public classes are imported on first access (PEP 562) so that
+# `imeteo-radar fetch --source dwd` does not pay for importing every
+# source module and the exporter's matplotlib graph at startup.
+_LAZY_IMPORTS = {
+    "ExportConfig": ".processing.exporter",
+    "MultiFormatExporter": ".processing.exporter",
+    "ARSORadarSource": ".sources.arso",
+    "CHMIRadarSource": ".sources.chmi",
+    "DWDRadarSource": ".sources.dwd",
+    "IMGWRadarSource": ".sources.imgw",
+    "OMSZRadarSource": ".sources.omsz",
+    "SHMURadarSource": ".sources.shmu",
+}
 
 __all__ = [
     "SHMURadarSource",
@@ -26,3 +35,17 @@ __all__ = [
     "MultiFormatExporter",
     "ExportConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -7,8 +7,11 @@ Focused on DWD dmax product with simple fetch command.
 
 import argparse
 import gc
+import os
 import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext as _nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -18,74 +21,45 @@ from .core.logging import get_logger, setup_logging
 logger = get_logger(__name__)
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command-line argument parser"""
-    parser = argparse.ArgumentParser(
-        description="Weather radar data processor for DWD", prog="imeteo-radar"
-    )
-
-    # Global logging arguments
-    parser.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default="INFO",
-        help="Logging level (default: INFO)",
-    )
-    parser.add_argument(
-        "--log-format",
-        choices=["console", "json"],
-        default="console",
-        help="Log output format (default: console)",
-    )
+def _add_fetch_args(parser: argparse.ArgumentParser) -> None:
+    """Register arguments for the fetch command (single source download)."""
     parser.add_argument(
-        "--log-file",
-        type=Path,
-        help="Log to file (in addition to console)",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Fetch command - simplified for DWD dmax
-    fetch_parser = subparsers.add_parser(
-        "fetch", help="Download and process radar data to PNG"
-    )
-    fetch_parser.add_argument(
         "--source",
         choices=["dwd", "shmu", "chmi", "arso", "omsz", "imgw"],
         default="dwd",
         help="Radar source (DWD for Germany, SHMU for Slovakia, CHMI for Czechia, ARSO for Slovenia, OMSZ for Hungary, IMGW for Poland)",
     )
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--output", type=Path, help="Output directory (default: /tmp/iradar/{country}/)"
     )
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--backload", action="store_true", help="Enable backload of historical data"
     )
-    fetch_parser.add_argument("--hours", type=int, help="Number of hours to backload")
-    fetch_parser.add_argument(
+    parser.add_argument("--hours", type=int, help="Number of hours to backload")
+    parser.add_argument(
         "--from",
         dest="from_time",
         type=str,
         help="Start time for backload (YYYY-MM-DD HH:MM)",
     )
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--to",
         dest="to_time",
         type=str,
         help="End time for backload (YYYY-MM-DD HH:MM)",
     )
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--update-extent",
         action="store_true",
         help="Force update extent_index.json file",
     )
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--disable-upload",
         action="store_true",
         help="Disable upload to DigitalOcean Spaces (for local development only)",
     )
 
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--timeout",
         type=int,
         default=180,
@@ -93,7 +67,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
 
     # Reprocess count for non-backload mode
-    fetch_parser.add_argument(
+    parser.add_argument(
         "--reprocess-count",
         type=int,
         default=6,
@@ -104,225 +78,301 @@ def create_parser() -> argparse.ArgumentParser:
     # Cache and export format arguments (shared with composite)
     from .utils.cli_helpers import add_cache_args, add_export_format_args
 
-    add_cache_args(fetch_parser)
-    add_export_format_args(fetch_parser)
+    add_cache_args(parser)
+    add_export_format_args(parser)
 
-    # Extent command - generate extent information only
-    extent_parser = subparsers.add_parser(
-        "extent", help="Generate extent information JSON"
-    )
-    extent_parser.add_argument(
+
+def _add_extent_args(parser: argparse.ArgumentParser) -> None:
+    """Register arguments for the extent command (extent JSON only)."""
+    parser.add_argument(
         "--source",
         choices=["dwd", "shmu", "chmi", "arso", "omsz", "imgw", "all"],
         default="all",
         help="Radar source(s) to generate extent for",
     )
-    extent_parser.add_argument(
+    parser.add_argument(
         "--output", type=Path, help="Output directory (default: /tmp/iradar/{country}/)"
     )
 
-    # Composite command - merge multiple sources
-    composite_parser = subparsers.add_parser(
-        "composite", help="Generate composite radar images from multiple sources"
-    )
-    composite_parser.add_argument(
+
+def _add_composite_args(parser: argparse.ArgumentParser) -> None:
+    """Register arguments for the composite command (multi-source merge)."""
+    parser.add_argument(
         "--sources",
         type=str,
         default="dwd,shmu,chmi,omsz,arso,imgw",
         help="Comma-separated list of sources to merge (default: dwd,shmu,chmi,omsz,arso,imgw)",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--output",
         type=Path,
         default=Path("/tmp/iradar/composite"),
         help="Output directory (default: /tmp/iradar/composite/)",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--resolution",
         type=float,
         default=500.0,
         help="Target resolution in meters (default: 500)",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--backload", action="store_true", help="Enable backload of historical data"
     )
-    composite_parser.add_argument(
-        "--hours", type=int, help="Number of hours to backload"
-    )
-    composite_parser.add_argument(
+    parser.add_argument("--hours", type=int, help="Number of hours to backload")
+    parser.add_argument(
         "--from",
         dest="from_time",
         type=str,
         help='Start time for backload (format: "YYYY-MM-DD HH:MM")',
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--to",
         dest="to_time",
         type=str,
         help='End time for backload (format: "YYYY-MM-DD HH:MM")',
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--update-extent",
         action="store_true",
         help="Force update extent_index.json file",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--no-individual",
         action="store_true",
         help="Skip generating individual source images (only create composite)",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--timestamp-tolerance",
         type=int,
         default=2,
         help="Timestamp matching tolerance in minutes (default: 2)",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--require-arso",
         action="store_true",
         help="Fail if ARSO data cannot be matched (default: fallback to composite without ARSO)",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--min-core-sources",
         type=int,
         default=3,
         help="Minimum core sources (DWD,SHMU,CHMI,OMSZ,IMGW) required for composite (default: 3). "
         "Allows composite generation even when some sources are in outage.",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--max-data-age",
         type=int,
         default=30,
         help="Maximum age of data in minutes before source is considered in OUTAGE (default: 30).",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--reprocess-count",
         type=int,
         default=6,
         help="Number of recent timestamps to (re)process (default: 6 = 30 min). "
         "Allows automatic reprocessing when providers backload data after outages.",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --backload (default: 1 = serial). "
+        "Each worker builds its own composite, so memory grows per worker.",
+    )
+    parser.add_argument(
         "--timeout",
         type=int,
         default=180,
         help="Max execution time in seconds (default: 180). Exits cleanly on timeout.",
     )
-    composite_parser.add_argument(
+    parser.add_argument(
         "--disable-upload",
         action="store_true",
         help="Disable upload to DigitalOcean Spaces (for local development only)",
     )
 
     # Cache and export format arguments (shared with fetch)
-    add_cache_args(composite_parser)
-    add_export_format_args(composite_parser)
+    from .utils.cli_helpers import add_cache_args, add_export_format_args
 
-    # Cache management command
-    cache_parser = subparsers.add_parser(
-        "cache", help="Manage processed radar data cache"
-    )
-    cache_parser.add_argument(
+    add_cache_args(parser)
+    add_export_format_args(parser)
+
+
+def _add_cache_command_args(parser: argparse.ArgumentParser) -> None:
+    """Register arguments for the cache management command."""
+    parser.add_argument(
         "action",
         choices=["cleanup", "clear", "stats"],
         help="Action: cleanup (remove expired), clear (remove all), stats (show info)",
     )
-    cache_parser.add_argument(
+    parser.add_argument(
         "--cache-dir",
         type=Path,
         default=Path("/tmp/iradar-data"),
         help="Cache directory (default: /tmp/iradar-data)",
     )
-    cache_parser.add_argument(
+    parser.add_argument(
         "--cache-ttl",
         type=int,
         default=60,
         help="Cache TTL in minutes for cleanup (default: 60)",
     )
-    cache_parser.add_argument(
+    parser.add_argument(
         "--source",
         type=str,
         help="Only operate on specific source (e.g., arso, dwd)",
     )
-    cache_parser.add_argument(
+    parser.add_argument(
         "--no-s3",
         action="store_true",
         help="Skip S3 operations (local only)",
     )
 
-    # Transform cache command - manage precomputed transformation grids
-    transform_cache_parser = subparsers.add_parser(
-        "transform-cache",
-        help="Manage precomputed transformation grids for fast reprojection",
-    )
-    transform_cache_parser.add_argument(
+
+def _add_transform_cache_args(parser: argparse.ArgumentParser) -> None:
+    """Register arguments for the transform-cache command."""
+    parser.add_argument(
         "--precompute",
         action="store_true",
         help="Precompute transform grids for sources",
     )
-    transform_cache_parser.add_argument(
+    parser.add_argument(
         "--download-s3",
         action="store_true",
         help="Download transform grids from S3 to local cache",
     )
-    transform_cache_parser.add_argument(
+    parser.add_argument(
         "--clear-local",
         action="store_true",
         help="Clear local transform cache",
     )
-    transform_cache_parser.add_argument(
+    parser.add_argument(
         "--clear-s3",
         action="store_true",
         help="Clear S3 transform cache",
     )
-    transform_cache_parser.add_argument(
+    parser.add_argument(
         "--stats",
         action="store_true",
         help="Show transform cache statistics",
     )
-    transform_cache_parser.add_argument(
+    parser.add_argument(
         "--upload-s3",
         action="store_true",
         help="Upload precomputed grids to S3 (use with --precompute)",
     )
-    transform_cache_parser.add_argument(
+    parser.add_argument(
         "--source",
         choices=["dwd", "shmu", "chmi", "arso", "omsz", "imgw", "all"],
         default="all",
         help="Source to operate on (default: all)",
     )
 
-    # Coverage mask command - generate static coverage masks
-    coverage_parser = subparsers.add_parser(
-        "coverage-mask", help="Generate static coverage mask PNG files"
-    )
-    coverage_parser.add_argument(
+
+def _add_coverage_mask_args(parser: argparse.ArgumentParser) -> None:
+    """Register arguments for the coverage-mask command."""
+    parser.add_argument(
         "--source",
         choices=["dwd", "shmu", "chmi", "arso", "omsz", "imgw", "all"],
         default="all",
         help="Radar source to generate mask for (default: all)",
     )
-    coverage_parser.add_argument(
+    parser.add_argument(
         "--composite",
         action="store_true",
         help="Generate composite coverage mask (combining all sources)",
     )
-    coverage_parser.add_argument(
+    parser.add_argument(
         "--output",
         type=Path,
         default=Path("/tmp/iradar"),
         help="Base output directory (default: /tmp/iradar/) - masks saved alongside radar data",
     )
-    coverage_parser.add_argument(
+    parser.add_argument(
         "--resolution",
         type=float,
         default=500.0,
         help="Resolution for composite mask in meters (default: 500)",
     )
 
+
+# Subcommand name -> (help text, function registering its arguments)
+_COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "fetch": (
+        "Download and process radar data to PNG",
+        _add_fetch_args,
+    ),
+    "extent": (
+        "Generate extent information JSON",
+        _add_extent_args,
+    ),
+    "composite": (
+        "Generate composite radar images from multiple sources",
+        _add_composite_args,
+    ),
+    "cache": (
+        "Manage processed radar data cache",
+        _add_cache_command_args,
+    ),
+    "transform-cache": (
+        "Manage precomputed transformation grids for fast reprojection",
+        _add_transform_cache_args,
+    ),
+    "coverage-mask": (
+        "Generate static coverage mask PNG files",
+        _add_coverage_mask_args,
+    ),
+}
+
+
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Create command-line argument parser
+
+    Args:
+        command: If given, only this subcommand's arguments are registered;
+            the others are listed by name and help text only. Pass an empty
+            string to register no subcommand arguments at all.
+    """
+    parser = argparse.ArgumentParser(
+        description="Weather radar data processor for DWD", prog="imeteo-radar"
+    )
+
+    # Global logging arguments
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Logging level (default: INFO)",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["console", "json"],
+        default="console",
+        help="Log output format (default: console)",
+    )
+    parser.add_argument(
+        "--log-file",
+        type=Path,
+        help="Log to file (in addition to console)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    for name, (help_text, add_args) in _COMMANDS.items():
+        full = command is None or name == command
+        subparser = subparsers.add_parser(name, help=help_text, add_help=full)
+        if full:
+            add_args(subparser)
+
     return parser
 
 
+def _peek_command(argv: list[str] | None = None) -> str | None:
+    """Determine the requested subcommand without building every subparser."""
+    args, _ = create_parser(command="").parse_known_args(argv)
+    return args.command
+
+
 def parse_time_range(
     from_time: str | None, to_time: str | None, hours: int | None
 ) -> tuple[datetime, datetime]:
@@ -430,35 +480,57 @@ def save_extent_index(
     return save_extent(source_name, extent_data, force=force, upload_to_s3=True)
 
 
-def cleanup_old_files(output_dir: Path, max_age_hours: int = 6):
+def _delete_stale_file(path: str) -> bool:
+    """Delete a single stale output file, returning True if it was removed."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logger.warning(f"Failed to delete {os.path.basename(path)}: {e}")
+        return False
+
+
+def cleanup_old_files(output_dir: Path, max_age_hours: int = 6, max_workers: int = 32):
     """
     Clean up PNG files older than max_age_hours
 
+    Uses a single ``os.scandir`` pass and filters on the entry name before
+    stat-ing, so non-PNG entries (extent_index.json, AVIF variants,
+    subdirectories) never cost a syscall. Deletions are issued from a
+    thread pool so unlink latency overlaps on network-backed volumes.
+
     Args:
         output_dir: Directory containing PNG files
         max_age_hours: Maximum age in hours (default: 6)
+        max_workers: Maximum concurrent deletions (default: 32)
     """
-    if not output_dir.exists():
+    cutoff = time.time() - max_age_hours * 3600
+    stale_paths = []
+
+    try:
+        entries = os.scandir(output_dir)
+    except FileNotFoundError:
         return
 
-    current_time = time.time()
-    max_age_seconds = max_age_hours * 3600
-    deleted_count = 0
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".png"):
+                continue
 
-    for png_file in output_dir.glob("*.png"):
-        # Skip extent_index.json and other non-PNG files
-        if png_file.suffix != ".png":
-            continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    stale_paths.append(entry.path)
+            except FileNotFoundError:
+                continue
 
-        # Check file age
-        file_age = current_time - png_file.stat().st_mtime
+    if not stale_paths:
+        return
 
-        if file_age > max_age_seconds:
-            try:
-                png_file.unlink()
-                deleted_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to delete {png_file.name}: {e}")
+    workers = min(max_workers, len(stale_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        deleted_count = sum(executor.map(_delete_stale_file, stale_paths))
 
     if deleted_count > 0:
         logger.info(
@@ -580,7 +652,7 @@ def fetch_command(args) -> int:
         if args.backload:
             # Handle backload
             start, end = parse_time_range(args.from_time, args.to_time, args.hours)
-            from .utils.cli_helpers import output_exists
+            from .utils.cli_helpers import output_exists_many
 
             logger.info(
                 f"Backload period: {start.strftime('%Y-%m-%d %H:%M')} to {end.strftime('%Y-%m-%d %H:%M')}"
@@ -608,27 +680,26 @@ def fetch_command(args) -> int:
                 return 1
 
             # Filter out timestamps whose output already exists (local or S3)
-            timestamps_to_download = []
-            skipped_existing = 0
+            candidates = []
             for ts in available_timestamps:
                 try:
                     dt = parse_timestamp_to_datetime(ts, args.source)
                 except (ValueError, IndexError):
                     logger.debug(f"Skipping malformed timestamp: {ts}")
                     continue
-                unix_timestamp = int(dt.timestamp())
-                filename = f"{unix_timestamp}.png"
-                output_path = output_dir / filename
-
-                if output_exists(
-                    output_path,
-                    args.source,
-                    filename,
-                    uploader,
-                ):
-                    skipped_existing += 1
-                else:
-                    timestamps_to_download.append(ts)
+                candidates.append((ts, f"{int(dt.timestamp())}.png"))
+
+            filenames = [filename for _, filename in candidates]
+            exists = output_exists_many(
+                [output_dir / filename for filename in filenames],
+                args.source,
+                filenames,
+                uploader,
+            )
+            timestamps_to_download = [
+                ts for (ts, _), found in zip(candidates, exists) if not found
+            ]
+            skipped_existing = len(candidates) - len(timestamps_to_download)
 
             if skipped_existing > 0:
                 logger.info(
@@ -712,8 +783,15 @@ def fetch_command(args) -> int:
         else:
             # Fetch multiple recent timestamps with cache awareness
             # This handles irregular provider uploads by checking multiple timestamps
-            from .utils.cli_helpers import init_cache_from_args, output_exists
-            from .utils.timestamps import is_timestamp_in_cache
+            from .utils.cli_helpers import (
+                init_cache_from_args,
+                output_exists,
+                record_outputs,
+            )
+            from .utils.timestamps import (
+                build_normalized_cache,
+                is_timestamp_in_cache,
+            )
 
             reprocess_count = getattr(args, "reprocess_count", 6)
             logger.info(f"Fetching up to {reprocess_count} recent timestamps...")
@@ -737,7 +815,7 @@ def fetch_command(args) -> int:
             timestamps_from_cache = []
 
             if cache:
-                cached_ts_set = set(
+                cached_ts_set = build_normalized_cache(
                     cache.get_available_timestamps(args.source, product)
                 )
                 for ts in available_timestamps[:reprocess_count]:
@@ -809,6 +887,7 @@ def fetch_command(args) -> int:
                         extent=extent,
                         config=export_config,
                     )
+                    record_outputs(path for path, _ in variants.values())
 
                     processed_count += 1
 
@@ -865,6 +944,7 @@ def fetch_command(args) -> int:
                         extent=extent,
                         config=export_config,
                     )
+                    record_outputs(path for path, _ in variants.values())
 
                     logger.info(f"Saved (from cache): {len(variants)} variants")
                     processed_count += 1
@@ -921,7 +1001,8 @@ def main():
 
     load_dotenv()  # Loads from .env in current directory or parents
 
-    parser = create_parser()
+    # Only build the full argument set for the subcommand being run
+    parser = create_parser(command=_peek_command())
     args = parser.parse_args()
 
     if not args.command:
@@ -934,6 +1015,7 @@ def main():
         level=args.log_level,
         structured=(args.log_format == "json"),
         log_file=log_file,
+        queued=True,
     )
 
     from .core.retry import ExecutionTimeout, ExecutionTimeoutError
@@ -6,12 +6,24 @@ Separated into its own module to keep cli.py manageable.
 """
 
 import gc
+import heapq
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .core.logging import get_logger
-from .utils.timestamps import is_timestamp_in_cache, normalize_timestamp
+from .utils.timestamps import (
+    TimestampFormat,
+    build_normalized_cache,
+    is_timestamp_in_cache,
+    normalize_timestamp,
+    parse_timestamp,
+    timestamp_to_unix,
+)
 
 logger = get_logger(__name__)
 
@@ -58,14 +70,13 @@ def _detect_source_outages(
         - availability: Dict[str, bool] - source_name -> is_available (True) or in_outage (False)
         - reasons: Dict[str, str] - source_name -> reason for outage (if any)
     """
-    from datetime import datetime, timedelta
-
-    import pytz
+    from datetime import UTC
 
     availability = {}
     reasons = {}
-    now = datetime.now(pytz.UTC)
-    max_age = timedelta(minutes=max_data_age_minutes)
+    # Ages are plain epoch-second arithmetic; no datetime/timedelta objects
+    now = time.time()
+    max_age_seconds = max_data_age_minutes * 60
 
     logger.info("Checking source availability...")
 
@@ -91,17 +102,15 @@ def _detect_source_outages(
             if not ts_str:
                 continue
 
-            try:
-                # Parse timestamp (format: YYYYMMDDHHMMSS or YYYYMMDDHHMM)
-                dt = datetime.strptime(ts_str[:12], "%Y%m%d%H%M")
-                dt = pytz.UTC.localize(dt)
-
-                if newest_dt is None or dt > newest_dt:
-                    newest_dt = dt
-                    newest_ts = ts_str
-            except ValueError:
+            # Parse timestamp (format: YYYYMMDDHHMMSS or YYYYMMDDHHMM)
+            dt = parse_timestamp(ts_str[:12], TimestampFormat.SHORT)
+            if dt is None:
                 continue
 
+            if newest_dt is None or dt > newest_dt:
+                newest_dt = dt
+                newest_ts = ts_str
+
         if newest_dt is None:
             # No valid timestamps - OUTAGE
             availability[source_name] = False
@@ -112,11 +121,11 @@ def _detect_source_outages(
             )
             continue
 
-        # Check data age
-        data_age = now - newest_dt
-        age_minutes = int(data_age.total_seconds() / 60)
+        # Check data age (timestamps are UTC; localize only the newest one)
+        data_age_seconds = now - newest_dt.replace(tzinfo=UTC).timestamp()
+        age_minutes = int(data_age_seconds / 60)
 
-        if data_age > max_age:
+        if data_age_seconds > max_age_seconds:
             # Stale data - OUTAGE
             availability[source_name] = False
             reasons[source_name] = (
@@ -240,6 +249,150 @@ def composite_command_impl(args: Any) -> int:
         return 1
 
 
+def _list_provider_timestamps(
+    source_name: str, source: Any, product: str, count: int
+) -> list[str]:
+    """Check a provider's connectivity and list its available timestamps.
+
+    Failures are logged and reported as an empty list so one unreachable
+    provider doesn't stop the others.
+
+    Args:
+        source_name: Source identifier (e.g. 'dwd')
+        source: Source instance
+        product: Product to list timestamps for
+        count: Number of recent timestamps to request
+
+    Returns:
+        Available timestamps (newest first), or [] if unavailable
+    """
+    try:
+        source.check_connectivity()
+    except ConnectionError as e:
+        logger.warning(f"{source_name.upper()}: Server unreachable, skipping: {e}")
+        return []
+
+    # Get available timestamps from provider (without downloading yet)
+    try:
+        available_timestamps = source.get_available_timestamps(
+            count=count,
+            products=[product],
+        )
+    except Exception as e:
+        logger.warning(f"{source_name.upper()}: Failed to get timestamps: {e}")
+        return []
+
+    if not available_timestamps:
+        logger.warning(f"{source_name.upper()}: No timestamps available from provider")
+        return []
+
+    return available_timestamps
+
+
+def _cache_downloaded_files(
+    source_name: str,
+    source: Any,
+    product: str,
+    downloaded_files: list[dict],
+    cache: Any,
+    max_workers: int = 4,
+) -> None:
+    """Process freshly downloaded files and store them in the processed cache.
+
+    Files are processed on a small thread pool so that file decoding, npz
+    compression and S3 upload overlap. The pool is kept small because each
+    worker holds one full radar array in memory.
+
+    Successfully cached entries are marked ``from_cache`` (so Pass 2 reads
+    them from the cache) and ``was_downloaded`` (for download statistics).
+
+    Args:
+        source_name: Source identifier (e.g. 'dwd')
+        source: Source instance providing process_to_array()
+        product: Product name used as cache key
+        downloaded_files: File info dicts from download_timestamps()
+        cache: ProcessedDataCache instance
+        max_workers: Maximum concurrent files (default: 4)
+    """
+    pending = [file_info for file_info in downloaded_files if file_info.get("path")]
+    if not pending:
+        return
+
+    def _cache_one(file_info: dict) -> None:
+        radar_data = source.process_to_array(file_info["path"])
+        cache.put(source_name, file_info["timestamp"], product, radar_data)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        future_to_info = {
+            executor.submit(_cache_one, file_info): file_info for file_info in pending
+        }
+        for future in as_completed(future_to_info):
+            file_info = future_to_info[future]
+            try:
+                future.result()
+                file_info["from_cache"] = True
+                file_info["was_downloaded"] = True
+            except Exception as e:
+                logger.debug(
+                    f"Could not cache {source_name} {file_info['timestamp']}: {e}"
+                )
+
+    gc.collect()
+
+
+@lru_cache(maxsize=1)
+def _get_window_count_kernel():
+    """Compile the window source-count kernel, or None without numba.
+
+    numba is imported lazily so the CLI does not pay for it on commands
+    that never match timestamps.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    import numpy as np
+
+    @njit(cache=True)
+    def _count_sources_in_windows(
+        pair_minutes, pair_sources, candidate_minutes, tolerance, n_sources
+    ):
+        """Count distinct sources within tolerance of each candidate.
+
+        pair_minutes/pair_sources hold one entry per (timestamp, source)
+        sorted by minute; candidate_minutes must be non-increasing, so the
+        window [lo, hi) only ever slides left.
+        """
+        counts = np.zeros(n_sources, dtype=np.int64)
+        result = np.empty(len(candidate_minutes), dtype=np.int64)
+        lo = hi = len(pair_minutes)
+        distinct = 0
+
+        for k in range(len(candidate_minutes)):
+            candidate = candidate_minutes[k]
+            while hi > 0 and pair_minutes[hi - 1] > candidate + tolerance:
+                hi -= 1
+                if hi >= lo:
+                    source = pair_sources[hi]
+                    counts[source] -= 1
+                    if counts[source] == 0:
+                        distinct -= 1
+            if lo > hi:
+                lo = hi
+            while lo > 0 and pair_minutes[lo - 1] >= candidate - tolerance:
+                lo -= 1
+                source = pair_sources[lo]
+                if counts[source] == 0:
+                    distinct += 1
+                counts[source] += 1
+            result[k] = distinct
+
+        return result
+
+    return _count_sources_in_windows
+
+
 def _find_multiple_common_timestamps(
     timestamp_groups: dict,
     sources: dict,
@@ -259,62 +412,125 @@ def _find_multiple_common_timestamps(
     Returns:
         List of (timestamp, source_files) tuples, most recent first
     """
-    from datetime import datetime, timedelta
+    import numpy as np
 
     if min_sources is None:
         min_sources = len(sources)
 
-    # Parse all timestamps to datetime
-    timestamp_datetimes = {}
+    # Parse all timestamps, keeping dict order for tie-breaking below
+    ts_strs = []
+    datetimes = []
     for ts_str in timestamp_groups.keys():
-        try:
-            dt = datetime.strptime(ts_str[:12], "%Y%m%d%H%M")
-            timestamp_datetimes[ts_str] = dt
-        except ValueError:
-            continue
-
-    # Sort by datetime (most recent first)
-    sorted_timestamps = sorted(
-        timestamp_datetimes.keys(), key=lambda x: timestamp_datetimes[x], reverse=True
+        dt = parse_timestamp(ts_str[:12], TimestampFormat.SHORT)
+        if dt is not None:
+            ts_strs.append(ts_str)
+            datetimes.append(dt)
+
+    if not ts_strs:
+        return []
+
+    # Minute offsets let each tolerance window be found by binary search
+    # instead of comparing every candidate against every timestamp
+    minutes = np.array(datetimes, dtype="datetime64[m]").astype(np.int64)
+    by_time = np.argsort(minutes, kind="stable")
+    sorted_minutes = minutes[by_time]
+
+    # Most recent first; equal times keep dict order (as a stable sort would)
+    candidates = np.argsort(-minutes, kind="stable")
+    candidate_minutes = minutes[candidates]
+    window_lo = np.searchsorted(
+        sorted_minutes, candidate_minutes - tolerance_minutes, side="left"
+    )
+    window_hi = np.searchsorted(
+        sorted_minutes, candidate_minutes + tolerance_minutes, side="right"
     )
 
-    tolerance = timedelta(minutes=tolerance_minutes)
+    minutes_list = minutes.tolist()
+
+    # Count distinct sources per window from per-source time arrays, so the
+    # file dicts below are only built for windows that can actually match
+    minutes_by_source = {}
+    for idx, ts_str in enumerate(ts_strs):
+        for source_name in timestamp_groups[ts_str]:
+            minutes_by_source.setdefault(source_name, []).append(minutes_list[idx])
+
+    # No window can hold more sources than have data at all
+    if len(minutes_by_source) < min_sources:
+        logger.debug(
+            f"Only {len(minutes_by_source)} sources have timestamps "
+            f"(need {min_sources}), no common timestamps possible"
+        )
+        return []
+
+    count_kernel = _get_window_count_kernel()
+    if count_kernel is not None:
+        # Single sliding-window pass over all (timestamp, source) pairs
+        pair_minutes = np.concatenate(
+            [np.array(m, dtype=np.int64) for m in minutes_by_source.values()]
+        )
+        pair_sources = np.repeat(
+            np.arange(len(minutes_by_source), dtype=np.int64),
+            [len(m) for m in minutes_by_source.values()],
+        )
+        pair_order = np.argsort(pair_minutes, kind="stable")
+        window_source_counts = count_kernel(
+            pair_minutes[pair_order],
+            pair_sources[pair_order],
+            candidate_minutes,
+            tolerance_minutes,
+            len(minutes_by_source),
+        )
+    else:
+        window_source_counts = np.zeros(len(candidates), dtype=np.int64)
+        for source_minutes in minutes_by_source.values():
+            source_minutes = np.sort(np.array(source_minutes, dtype=np.int64))
+            lo = np.searchsorted(
+                source_minutes, candidate_minutes - tolerance_minutes, side="left"
+            )
+            hi = np.searchsorted(
+                source_minutes, candidate_minutes + tolerance_minutes, side="right"
+            )
+            window_source_counts += hi > lo
+
+    by_time_list = by_time.tolist()
     results = []
     processed_windows = set()  # Track which time windows we've already matched
 
-    for candidate_ts in sorted_timestamps:
+    for candidate_idx, lo, hi, source_count in zip(
+        candidates.tolist(),
+        window_lo.tolist(),
+        window_hi.tolist(),
+        window_source_counts.tolist(),
+    ):
         if len(results) >= max_count:
             break
 
-        candidate_dt = timestamp_datetimes[candidate_ts]
+        # Not enough sources anywhere in this window
+        if source_count < min_sources:
+            continue
 
         # Skip if we already have a result within this time window
-        window_key = candidate_dt.strftime("%Y%m%d%H%M")
-        if window_key in processed_windows:
+        candidate_minute = minutes_list[candidate_idx]
+        if candidate_minute in processed_windows:
             continue
 
         sources_in_window = {}
 
-        # Find sources with data in this time window
-        for ts_str, ts_dt in timestamp_datetimes.items():
-            if abs(ts_dt - candidate_dt) <= tolerance:
-                for source_name, file_info in timestamp_groups[ts_str].items():
-                    if source_name not in sources_in_window:
-                        sources_in_window[source_name] = (ts_str, file_info, ts_dt)
-                    else:
-                        # Keep the closer timestamp
-                        existing_ts, existing_info, existing_dt = sources_in_window[
-                            source_name
-                        ]
-                        if abs(ts_dt - candidate_dt) < abs(existing_dt - candidate_dt):
-                            sources_in_window[source_name] = (ts_str, file_info, ts_dt)
+        # Find sources with data in this time window, visiting timestamps
+        # in dict order so ties resolve to the first one seen
+        for idx in sorted(by_time_list[lo:hi]):
+            distance = abs(minutes_list[idx] - candidate_minute)
+            for source_name, file_info in timestamp_groups[ts_strs[idx]].items():
+                existing = sources_in_window.get(source_name)
+                # Keep the closer timestamp
+                if existing is None or distance < existing[1]:
+                    sources_in_window[source_name] = (file_info, distance)
 
         # Check if we have enough sources
         if len(sources_in_window) >= min_sources:
-            processed_windows.add(window_key)
-            source_files = {
-                src: info for src, (_, info, _) in sources_in_window.items()
-            }
+            processed_windows.add(candidate_minute)
+            candidate_ts = ts_strs[candidate_idx]
+            source_files = {src: info for src, (info, _) in sources_in_window.items()}
             results.append((candidate_ts, source_files))
             logger.debug(
                 f"Found common timestamp {candidate_ts} with {len(source_files)} sources"
@@ -344,10 +560,6 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
     - Caches processed radar data to bridge timestamp gaps between fast/slow sources
     - ARSO (~7-8 min latency) data is cached so it can be matched with slower sources
     """
-    from datetime import datetime
-
-    import pytz
-
     from .processing.compositor import RadarCompositor
 
     # Get configuration from args
@@ -418,39 +630,34 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
         if not sources_with_cache:
             logger.info("  No cached data found (first run or cache cleared)")
 
+    # Probe all providers concurrently: connectivity checks and timestamp
+    # listing are independent network round-trips per source
+    with ThreadPoolExecutor(max_workers=max(len(sources), 1)) as executor:
+        futures = {
+            source_name: executor.submit(
+                _list_provider_timestamps,
+                source_name,
+                source,
+                product,
+                reprocess_count + 2,
+            )
+            for source_name, (source, product) in sources.items()
+        }
+        provider_timestamps = {
+            source_name: future.result() for source_name, future in futures.items()
+        }
+
     # Download fresh data from each source, SKIPPING cached timestamps
     for source_name, (source, product) in sources.items():
-        try:
-            source.check_connectivity()
-        except ConnectionError as e:
-            logger.warning(
-                f"{source_name.upper()}: Server unreachable, skipping: {e}"
-            )
+        available_timestamps = provider_timestamps[source_name]
+        if not available_timestamps:
             all_source_files[source_name] = []
             continue
 
         # Get cached timestamps for this source (reuse pre-fetched results)
-        cached_ts_set = set(cached_timestamps_by_source.get(source_name, []))
-
-        # Get available timestamps from provider (without downloading yet)
-        try:
-            available_timestamps = source.get_available_timestamps(
-                count=reprocess_count + 2,
-                products=[product],
-            )
-        except Exception as e:
-            logger.warning(
-                f"{source_name.upper()}: Failed to get timestamps: {e}"
-            )
-            all_source_files[source_name] = []
-            continue
-
-        if not available_timestamps:
-            logger.warning(
-                f"{source_name.upper()}: No timestamps available from provider"
-            )
-            all_source_files[source_name] = []
-            continue
+        cached_ts_set = build_normalized_cache(
+            cached_timestamps_by_source.get(source_name, [])
+        )
 
         # Determine which timestamps need downloading
         timestamps_to_download = []
@@ -482,20 +689,11 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
                         timestamp_groups[timestamp] = {}
                     timestamp_groups[timestamp][source_name] = file_info
 
-                    # Cache downloaded data immediately (so next run won't re-download)
-                    if cache and file_info.get("path"):
-                        try:
-                            radar_data = source.process_to_array(file_info["path"])
-                            cache.put(source_name, timestamp, product, radar_data)
-                            # Mark for Pass 2 to retrieve from cache, but track as downloaded for stats
-                            file_info["from_cache"] = True
-                            file_info["was_downloaded"] = True  # Track for logging
-                            del radar_data
-                            gc.collect()
-                        except Exception as e:
-                            logger.debug(
-                                f"Could not cache {source_name} {timestamp}: {e}"
-                            )
+                # Cache downloaded data immediately (so next run won't re-download)
+                if cache:
+                    _cache_downloaded_files(
+                        source_name, source, product, downloaded_files, cache
+                    )
 
         # Build cached file info entries for outage detection
         cached_file_infos = []
@@ -537,16 +735,21 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
                         "product": product,
                     }
 
+    # Index timestamp groups by source in one pass rather than rescanning
+    # every group once per source
+    timestamps_by_source = {source_name: [] for source_name in sources}
+    for ts, srcs in timestamp_groups.items():
+        for source_name in srcs:
+            if source_name in timestamps_by_source:
+                timestamps_by_source[source_name].append(ts)
+
     # Log summary of timestamps per source (downloaded + cached)
     logger.info("Timestamps available for matching (download + cache):")
     for source_name in sources.keys():
-        source_timestamps = sorted(
-            [ts for ts, srcs in timestamp_groups.items() if source_name in srcs],
-            reverse=True,
-        )
+        source_timestamps = timestamps_by_source[source_name]
         if source_timestamps:
-            # Show total count and newest few timestamps
-            recent = source_timestamps[:3]
+            # Show total count and newest few timestamps (top-k, no full sort)
+            recent = heapq.nlargest(3, source_timestamps)
             # Count downloads: either not from_cache, or was_downloaded (cached after download this run)
             download_count = sum(
                 1
@@ -691,7 +894,7 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
     logger.info(f"Found {len(common_timestamps)} timestamps to process")
 
     # ========== STEP 6: PROCESS EACH TIMESTAMP ==========
-    from .utils.cli_helpers import output_exists
+    from .utils.cli_helpers import output_exists, record_outputs
 
     processed_count = 0
     last_composite = None
@@ -703,14 +906,12 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
         "processing_failed": [],
     }
 
+    # Static source extents don't change between timestamps; look each up once
+    static_dimensions = {}
+
     for common_timestamp, source_files in common_timestamps:
         # Parse timestamp for filename generation
-        try:
-            dt = datetime.strptime(common_timestamp[:14], "%Y%m%d%H%M%S")
-        except ValueError:
-            dt = datetime.strptime(common_timestamp[:12], "%Y%m%d%H%M")
-        dt_utc = pytz.UTC.localize(dt)
-        unix_timestamp = int(dt_utc.timestamp())
+        unix_timestamp = timestamp_to_unix(common_timestamp)
         filename = f"{unix_timestamp}.png"
         output_path = output_dir / filename
 
@@ -740,10 +941,13 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
 
             try:
                 if from_cache and cache:
-                    extent = source.get_extent()
+                    if source_name not in static_dimensions:
+                        static_dimensions[source_name] = source.get_extent().get(
+                            "grid_size", [0, 0]
+                        )
                     source_metadata[source_name] = {
                         "from_cache": True,
-                        "dimensions": extent.get("grid_size", [0, 0]),
+                        "dimensions": static_dimensions[source_name],
                     }
                 else:
                     extent_info = source.extract_extent_only(file_info["path"])
@@ -818,12 +1022,9 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
                 if not from_cache and "file_path" in source_metadata.get(
                     source_name, {}
                 ):
-                    try:
-                        Path(source_metadata[source_name]["file_path"]).unlink(
-                            missing_ok=True
-                        )
-                    except Exception:
-                        pass
+                    _discard_download(
+                        source_name, source_metadata[source_name]["file_path"]
+                    )
 
             except Exception as e:
                 logger.warning(f"Failed to process {source_name}: {e}")
@@ -858,6 +1059,7 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
                 extent={"wgs84": composite["extent"]},
                 config=composite_config,
             )
+            record_outputs(path for path, _ in variants.values())
 
             logger.info(
                 f"Composite saved: {len(variants)} variants ({sources_processed} sources)"
@@ -950,6 +1152,18 @@ def _process_latest(args, sources, exporter, export_config, output_dir, uploader
     return 0
 
 
+def _discard_download(source_name: str, file_path: str) -> None:
+    """Delete a processed download unless its source keeps downloads on disk."""
+    from .config.sources import get_source_config
+
+    if (get_source_config(source_name) or {}).get("keep_downloads"):
+        return
+    try:
+        Path(file_path).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def _get_individual_source_dir(source_name: str, composite_output: Path) -> Path:
     """Get output directory for individual source images.
 
@@ -1028,6 +1242,9 @@ def _export_single_source(
         extent=radar_data["extent"],
         config=export_config,
     )
+    from .utils.cli_helpers import record_outputs
+
+    record_outputs(path for path, _ in variants.values())
 
     # Get the REPROJECTED bounds from export metadata (not native bounds)
     # Use the first variant's metadata for extent
@@ -1242,10 +1459,6 @@ def _export_dropped_arso(
         args: CLI arguments
         uploader: Optional SpacesUploader instance
     """
-    from datetime import datetime
-
-    import pytz
-
     arso_source, arso_product = sources["arso"]
 
     if "arso" not in all_source_files or not all_source_files["arso"]:
@@ -1257,14 +1470,9 @@ def _export_dropped_arso(
     for arso_file in all_source_files["arso"]:
         ts = arso_file["timestamp"]
         try:
-            dt = datetime.strptime(ts[:14], "%Y%m%d%H%M%S")
+            unix_ts = timestamp_to_unix(ts)
         except ValueError:
-            try:
-                dt = datetime.strptime(ts[:12], "%Y%m%d%H%M")
-            except ValueError:
-                continue
-        dt_utc = pytz.UTC.localize(dt)
-        unix_ts = int(dt_utc.timestamp())
+            continue
 
         # Skip if already exported (e.g., from a previous run)
         composite_output = Path(args.output)
@@ -1316,13 +1524,11 @@ def _process_backload(args, sources, exporter, export_config, output_dir, upload
     TWO-PASS ARCHITECTURE for ~75% memory reduction:
     - Pass 1: Extract extents only (no data loading) -> Calculate combined extent
     - Pass 2: Process each source sequentially: Load -> Export individual -> Merge -> Delete
-    """
-    from datetime import datetime as dt
-
-    import pytz
 
+    With --workers > 1, independent timestamps are composited in parallel
+    worker processes (memory use grows with the number of workers).
+    """
     from .cli import parse_time_range
-    from .processing.compositor import RadarCompositor
 
     start, end = parse_time_range(args.from_time, args.to_time, args.hours)
     logger.info(
@@ -1364,22 +1570,29 @@ def _process_backload(args, sources, exporter, export_config, output_dir, upload
         logger.error("No data downloaded from any source")
         return 1
 
-    # Group files by timestamp
+    # Group files by timestamp, keeping each source's timestamps sorted so the
+    # union can be streamed in order with heapq.merge
     timestamp_groups = {}
+    per_source_timestamps = []
     for source_name, files in all_source_files.items():
         for file_info in files:
             timestamp = file_info["timestamp"]
             if timestamp not in timestamp_groups:
                 timestamp_groups[timestamp] = {}
             timestamp_groups[timestamp][source_name] = file_info
+        per_source_timestamps.append(sorted({f["timestamp"] for f in files}))
 
     logger.info(f"Found {len(timestamp_groups)} unique timestamps")
 
-    # Process each timestamp with two-pass architecture
-    processed_count = 0
-    last_composite = None
+    # Only timestamps where every source has data are composited
+    complete_timestamps = []
+    last_timestamp = None
+    for timestamp in heapq.merge(*per_source_timestamps):
+        # Timestamps shared by several sources appear once per source
+        if timestamp == last_timestamp:
+            continue
+        last_timestamp = timestamp
 
-    for timestamp in sorted(timestamp_groups.keys()):
         source_files = timestamp_groups[timestamp]
 
         # Skip if not all sources have data for this timestamp
@@ -1389,136 +1602,95 @@ def _process_backload(args, sources, exporter, export_config, output_dir, upload
                 f"Skipping {timestamp} (missing: {', '.join(missing).upper()})"
             )
             continue
+        complete_timestamps.append(timestamp)
+
+    # Skip timestamps whose composite already exists locally or in S3 before
+    # loading and merging anything (mirrors latest mode). Existence is
+    # checked for the whole range at once rather than once per timestamp.
+    from .utils.cli_helpers import output_exists_many
+
+    filenames = [f"{timestamp_to_unix(ts)}.png" for ts in complete_timestamps]
+    exists = output_exists_many(
+        [output_dir / filename for filename in filenames],
+        "composite",
+        filenames,
+        uploader,
+    )
 
-        logger.info(f"Processing {timestamp}...")
-
-        # Generate Unix timestamp for filenames
-        dt_obj = dt.strptime(timestamp, "%Y%m%d%H%M%S")
-        dt_obj = pytz.UTC.localize(dt_obj)
-        unix_timestamp = int(dt_obj.timestamp())
-
-        # ========== PASS 1: EXTRACT EXTENTS ONLY ==========
-        logger.debug("   Pass 1: Extracting extents...")
-        all_extents = []
-        source_metadata = {}
-
-        for source_name, file_info in source_files.items():
-            source, _product = sources[source_name]
-            try:
-                extent_info = source.extract_extent_only(file_info["path"])
-                all_extents.append(extent_info["extent"]["wgs84"])
-                source_metadata[source_name] = {"file_path": file_info["path"]}
-            except Exception as e:
-                logger.warning(f"Failed to extract extent from {source_name}: {e}")
-                continue
-
-        # Get minimum sources required (for resilience)
-        min_sources_required = getattr(args, "min_sources", 2)
-        if len(all_extents) < min_sources_required:
-            logger.warning(
-                f"Not enough valid extents for composite ({len(all_extents)} < {min_sources_required}), skipping"
-            )
+    pending_timestamps = []
+    for timestamp, found in zip(complete_timestamps, exists):
+        if found:
+            logger.debug(f"Skipping {timestamp} (composite already exists)")
+            for source_name, file_info in timestamp_groups[timestamp].items():
+                _discard_download(source_name, file_info["path"])
             continue
+        pending_timestamps.append(timestamp)
 
-        # Always use fixed reference extent for consistent dimensions
-        combined_extent = REFERENCE_EXTENT.copy()
-
-        # ========== PASS 2: SEQUENTIAL PROCESSING ==========
-        logger.debug("   Pass 2: Processing sources sequentially...")
-        compositor = RadarCompositor(combined_extent, resolution_m=args.resolution)
-        sources_processed = 0
-
-        for source_name in source_metadata:
-            source, _product = sources[source_name]
-            file_path = source_metadata[source_name]["file_path"]
-
-            try:
-                # Load ONE source at a time
-                radar_data = source.process_to_array(file_path)
-
-                # Export individual source image if requested
-                if not args.no_individual:
-                    _export_single_source(
-                        source_name,
-                        radar_data,
-                        exporter,
-                        export_config,
-                        unix_timestamp,
-                        timestamp,
-                        args,
-                        uploader,
-                    )
-
-                # Merge into compositor
-                compositor.add_source(source_name, radar_data)
-                sources_processed += 1
-
-                # CRITICAL: Release memory immediately
-                del radar_data
-                gc.collect()
-
-                # Delete temp file
-                try:
-                    Path(file_path).unlink(missing_ok=True)
-                except Exception:
-                    pass
-
-            except Exception as e:
-                logger.warning(f"Failed to process {source_name}: {e}")
-
-        if sources_processed < 2:
-            logger.warning("Not enough valid sources for composite, skipping")
-            compositor.clear_cache()
-            del compositor
-            gc.collect()
-            continue
+    skipped_existing = len(complete_timestamps) - len(pending_timestamps)
+    if skipped_existing:
+        logger.info(
+            f"Skipping {skipped_existing} timestamp(s) with existing composites",
+            extra={"skipped": skipped_existing},
+        )
+    complete_timestamps = pending_timestamps
 
-        # Get final composite and export
-        try:
-            composite = compositor.get_composite()
+    # Process each timestamp with two-pass architecture
+    processed_count = 0
+    last_composite = None
+    workers = min(getattr(args, "workers", 1) or 1, len(complete_timestamps))
 
-            logger.info(f"Exporting composite for {timestamp}...")
-            radar_data_for_export = {
-                "data": composite["data"],
-                "timestamp": timestamp,
-                "product": "composite",
-                "metadata": {"source": "composite", "units": "dBZ"},
+    if workers > 1:
+        # Timestamps are independent: composite them in separate processes.
+        # Each worker holds its own compositor, so memory scales with workers.
+        logger.info(
+            f"Processing {len(complete_timestamps)} timestamps on {workers} workers"
+        )
+        source_products = {name: product for name, (_, product) in sources.items()}
+        results = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_backload_worker,
+            initargs=(source_products, export_config, uploader is not None),
+            # HDF5 is not fork-safe; the initializer rebuilds all worker state
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            future_to_ts = {
+                executor.submit(
+                    _run_backload_worker,
+                    timestamp,
+                    timestamp_groups[timestamp],
+                    output_dir,
+                    args,
+                ): timestamp
+                for timestamp in complete_timestamps
             }
-            # Composite data is already in Web Mercator, no reprojection needed
-            # Export all variants (full + scaled, PNG + AVIF)
-            base_path = output_dir / str(unix_timestamp)
-            composite_config = replace(export_config, reproject=False, colormap_type="shmu")
-            variants = exporter.export_variants(
-                radar_data=radar_data_for_export,
-                output_base_path=base_path,
-                extent={"wgs84": composite["extent"]},
-                config=composite_config,
+            for future in as_completed(future_to_ts):
+                timestamp = future_to_ts[future]
+                try:
+                    results[timestamp] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed for {timestamp}: {e}")
+                    results[timestamp] = None
+
+        for timestamp in complete_timestamps:
+            if results.get(timestamp) is not None:
+                processed_count += 1
+                last_composite = results[timestamp]
+    else:
+        for timestamp in complete_timestamps:
+            result = _process_backload_timestamp(
+                timestamp,
+                timestamp_groups[timestamp],
+                sources,
+                exporter,
+                export_config,
+                output_dir,
+                args,
+                uploader,
             )
-
-            logger.info(f"Composite saved: {len(variants)} variants")
-
-            # Upload all composite variants to DigitalOcean Spaces
-            if uploader:
-                for variant_name, (variant_path, _) in variants.items():
-                    try:
-                        uploader.upload_file(
-                            variant_path, "composite", variant_path.name
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to upload composite {variant_name}: {e}")
-
-            processed_count += 1
-            last_composite = {
-                "extent": {"wgs84": composite["extent"]},
-            }
-
-            # Cleanup
-            compositor.clear_cache()
-            del compositor, composite
-            gc.collect()
-
-        except Exception as e:
-            logger.error(f"Failed to create composite: {e}", exc_info=True)
+            if result is not None:
+                processed_count += 1
+                last_composite = result
 
     logger.info(
         f"Processed {processed_count} composites", extra={"count": processed_count}
@@ -1549,6 +1721,208 @@ def _process_backload(args, sources, exporter, export_config, output_dir, upload
     return 0
 
 
+def _process_backload_timestamp(
+    timestamp: str,
+    source_files: dict,
+    sources: dict,
+    exporter: Any,
+    export_config: Any,
+    output_dir: Path,
+    args: Any,
+    uploader: Any = None,
+) -> dict | None:
+    """Build, export and upload the composite for one backload timestamp.
+
+    Args:
+        timestamp: 14-digit timestamp being processed
+        source_files: Dict mapping source name -> downloaded file info
+        sources: Dict mapping source name -> (source instance, product)
+        exporter: MultiFormatExporter instance
+        export_config: ExportConfig for individual and composite exports
+        output_dir: Composite output directory
+        args: CLI arguments namespace
+        uploader: Optional SpacesUploader
+
+    Returns:
+        Dict with the composite extent, or None if the timestamp was skipped
+    """
+    from .processing.compositor import RadarCompositor
+
+    logger.info(f"Processing {timestamp}...")
+
+    # Generate Unix timestamp for filenames
+    unix_timestamp = timestamp_to_unix(timestamp)
+
+    # ========== PASS 1: EXTRACT EXTENTS ONLY ==========
+    logger.debug("   Pass 1: Extracting extents...")
+    all_extents = []
+    source_metadata = {}
+
+    for source_name, file_info in source_files.items():
+        source, _product = sources[source_name]
+        try:
+            extent_info = source.extract_extent_only(file_info["path"])
+            all_extents.append(extent_info["extent"]["wgs84"])
+            source_metadata[source_name] = {"file_path": file_info["path"]}
+        except Exception as e:
+            logger.warning(f"Failed to extract extent from {source_name}: {e}")
+            continue
+
+    # Get minimum sources required (for resilience)
+    min_sources_required = getattr(args, "min_sources", 2)
+    if len(all_extents) < min_sources_required:
+        logger.warning(
+            f"Not enough valid extents for composite "
+            f"({len(all_extents)} < {min_sources_required}), skipping"
+        )
+        return None
+
+    # Always use fixed reference extent for consistent dimensions
+    combined_extent = REFERENCE_EXTENT.copy()
+
+    # ========== PASS 2: SEQUENTIAL PROCESSING ==========
+    logger.debug("   Pass 2: Processing sources sequentially...")
+    compositor = RadarCompositor(combined_extent, resolution_m=args.resolution)
+    sources_processed = 0
+
+    for source_name in source_metadata:
+        source, _product = sources[source_name]
+        file_path = source_metadata[source_name]["file_path"]
+
+        try:
+            # Load ONE source at a time
+            radar_data = source.process_to_array(file_path)
+
+            # Export individual source image if requested
+            if not args.no_individual:
+                _export_single_source(
+                    source_name,
+                    radar_data,
+                    exporter,
+                    export_config,
+                    unix_timestamp,
+                    timestamp,
+                    args,
+                    uploader,
+                )
+
+            # Merge into compositor
+            compositor.add_source(source_name, radar_data)
+            sources_processed += 1
+
+            # CRITICAL: Release memory immediately
+            del radar_data
+            gc.collect()
+
+            # Delete temp file
+            _discard_download(source_name, file_path)
+
+        except Exception as e:
+            logger.warning(f"Failed to process {source_name}: {e}")
+
+    if sources_processed < 2:
+        logger.warning("Not enough valid sources for composite, skipping")
+        compositor.clear_cache()
+        del compositor
+        gc.collect()
+        return None
+
+    # Get final composite and export
+    try:
+        composite = compositor.get_composite()
+
+        logger.info(f"Exporting composite for {timestamp}...")
+        radar_data_for_export = {
+            "data": composite["data"],
+            "timestamp": timestamp,
+            "product": "composite",
+            "metadata": {"source": "composite", "units": "dBZ"},
+        }
+        # Composite data is already in Web Mercator, no reprojection needed
+        # Export all variants (full + scaled, PNG + AVIF)
+        base_path = output_dir / str(unix_timestamp)
+        composite_config = replace(export_config, reproject=False, colormap_type="shmu")
+        variants = exporter.export_variants(
+            radar_data=radar_data_for_export,
+            output_base_path=base_path,
+            extent={"wgs84": composite["extent"]},
+            config=composite_config,
+        )
+
+        logger.info(f"Composite saved: {len(variants)} variants")
+
+        # Upload all composite variants to DigitalOcean Spaces
+        if uploader:
+            for variant_name, (variant_path, _) in variants.items():
+                try:
+                    uploader.upload_file(variant_path, "composite", variant_path.name)
+                except Exception as e:
+                    logger.warning(f"Failed to upload composite {variant_name}: {e}")
+
+        result = {
+            "extent": {"wgs84": composite["extent"]},
+        }
+
+        # Cleanup
+        compositor.clear_cache()
+        del compositor, composite
+        gc.collect()
+
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to create composite: {e}", exc_info=True)
+        return None
+
+
+# Per-process state for parallel backload workers (see _init_backload_worker)
+_BACKLOAD_WORKER: dict[str, Any] = {}
+
+
+def _init_backload_worker(
+    source_products: dict[str, str], export_config: Any, upload_enabled: bool
+) -> None:
+    """Create sources, exporter and uploader once per backload worker process.
+
+    Source instances, the exporter and the boto3 client are not picklable,
+    so each worker builds its own instead of receiving the parent's.
+    """
+    from .config.sources import get_source_instance
+    from .processing.exporter import MultiFormatExporter
+
+    uploader = None
+    if upload_enabled:
+        from .utils.spaces_uploader import SpacesUploader
+
+        uploader = SpacesUploader()
+
+    _BACKLOAD_WORKER.update(
+        sources={
+            name: (get_source_instance(name), product)
+            for name, product in source_products.items()
+        },
+        exporter=MultiFormatExporter(),
+        export_config=export_config,
+        uploader=uploader,
+    )
+
+
+def _run_backload_worker(
+    timestamp: str, source_files: dict, output_dir: Path, args: Any
+) -> dict | None:
+    """Process one backload timestamp inside a worker process."""
+    return _process_backload_timestamp(
+        timestamp,
+        source_files,
+        _BACKLOAD_WORKER["sources"],
+        _BACKLOAD_WORKER["exporter"],
+        _BACKLOAD_WORKER["export_config"],
+        output_dir,
+        args,
+        _BACKLOAD_WORKER["uploader"],
+    )
+
+
 def _save_extent_index(_output_dir, composite, source_names, resolution, uploader=None):
     """Save extent index JSON in canonical format to iradar-data/extent/composite/.
 
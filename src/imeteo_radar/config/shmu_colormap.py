@@ -15,7 +15,10 @@ Usage:
     plt.pcolormesh(x, y, data, cmap=cmap, norm=norm, shading='nearest')
 """
 
+from functools import lru_cache
+
 import matplotlib.colors as mcolors
+import numpy as np
 
 from ..core.logging import get_logger
 
@@ -107,13 +110,22 @@ def get_shmu_colormap():
     # Create discrete colormap with clean boundaries
     cmap = mcolors.ListedColormap(colors, name="shmu_radar")
 
-    # Create boundaries for discrete steps (centered on integer dBZ values)
-    boundaries = [dbz - 0.5 for dbz in dbz_range] + [85.5]
-    norm = mcolors.BoundaryNorm(boundaries, len(colors))
+    # Discrete steps centered on integer dBZ values: snap to the nearest
+    # integer (half up, like 1 dBZ bins with half-dBZ edges) and clamp, so
+    # color index k covers [k - 35.5, k - 34.5) without a boundaries search
+    norm = mcolors.FuncNorm((_snap_dbz, _identity), vmin=-35, vmax=85)
 
     return cmap, norm
 
 
+def _snap_dbz(x):
+    return np.clip(np.floor(np.asarray(x, dtype=np.float64) + 0.5), -35, 85)
+
+
+def _identity(y):
+    return y
+
+
 def get_dbz_range():
     """
     Get the dBZ range covered by the SHMU colorscale.
@@ -124,26 +136,81 @@ def get_dbz_range():
     return (-35, 85)
 
 
-def get_color_for_dbz(dbz_value):
+@lru_cache(maxsize=1)
+def get_lut_rgba():
     """
-    Get the SHMU color for a specific dBZ value.
+    Get the SHMU colors as a lookup table indexed by dBZ - min_dbz.
+
+    Returns:
+        np.ndarray: Read-only (121, 4) float RGBA array (0-1 range)
+    """
+    cmap, _ = get_shmu_colormap()
+    lut = np.asarray(cmap(np.arange(cmap.N)))
+    lut.flags.writeable = False
+    return lut
+
+
+@lru_cache(maxsize=1)
+def get_lut_uint8():
+    """
+    Get the SHMU lookup table as packed RGBA8888 (484 bytes).
+
+    Returns:
+        np.ndarray: Read-only (121, 4) uint8 RGBA array (0-255 range)
+    """
+    lut = (get_lut_rgba() * 255.0 + 0.5).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def colorize(dbz, as_uint8=False):
+    """
+    Map dBZ values to SHMU colors with one table lookup.
+
+    Matches the colormap and its norm: values are rounded half up,
+    values outside the scale are clamped to its ends and NaN (nodata)
+    gets the colormap's bad color.
 
     Args:
-        dbz_value (float): dBZ value
+        dbz (float or np.ndarray): dBZ value(s)
+        as_uint8 (bool): Return 0-255 uint8 colors instead of floats
 
     Returns:
-        tuple: RGB color (0-1 range)
+        np.ndarray: RGBA colors with shape dbz.shape + (4,)
     """
-    cmap, norm = get_shmu_colormap()
+    min_dbz, max_dbz = get_dbz_range()
+    dbz = np.asarray(dbz, dtype=np.float64)
+    nodata = np.isnan(dbz)
+    clamped = np.clip(np.where(nodata, min_dbz, dbz), min_dbz, max_dbz)
+    indices = np.floor(clamped + 0.5).astype(np.intp) - min_dbz
+    lut = get_lut_uint8() if as_uint8 else get_lut_rgba()
+    colors = lut[indices]
+    if nodata.any():
+        colors = np.where(nodata[..., np.newaxis], _bad_color(as_uint8), colors)
+    return colors
+
+
+@lru_cache(maxsize=2)
+def _bad_color(as_uint8):
+    cmap, _ = get_shmu_colormap()
+    bad = np.asarray(cmap.get_bad())
+    if as_uint8:
+        bad = (bad * 255.0 + 0.5).astype(np.uint8)
+    bad.flags.writeable = False
+    return bad
 
-    # Clamp to range
-    dbz_clamped = max(-35, min(85, dbz_value))
 
-    # Get normalized value
-    norm_value = norm(dbz_clamped)
+def get_color_for_dbz(dbz_value):
+    """
+    Get the SHMU color for a specific dBZ value.
 
-    # Get color from colormap
-    return cmap(norm_value)
+    Args:
+        dbz_value (float): dBZ value
+
+    Returns:
+        tuple: RGBA color (0-1 range)
+    """
+    return tuple(colorize(dbz_value).tolist())
 
 
 if __name__ == "__main__":
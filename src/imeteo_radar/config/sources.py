@@ -45,6 +45,8 @@ SOURCE_REGISTRY: dict[str, dict[str, Any]] = {
         "country": "slovenia",
         "folder": "slovenia",
         "description": "Slovenian Environment Agency (ARSO)",
+        # Latest frame is kept on disk and revalidated by the next run
+        "keep_downloads": True,
     },
     "omsz": {
         "class_name": "OMSZRadarSource",
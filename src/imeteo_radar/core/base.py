@@ -5,6 +5,7 @@ Base classes for radar data sources
 
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
@@ -20,6 +21,9 @@ logger = get_logger(__name__)
 class RadarSource(ABC):
     """Abstract base class for radar data sources"""
 
+    # Concurrent downloads in download_timestamps (override per source)
+    download_workers = 6
+
     def __init__(self, name: str):
         self.name = name
         self.cache_dir = f"processed/{name}_data"
@@ -83,6 +87,7 @@ class RadarSource(ABC):
         self,
         timestamps: list[str],
         products: list[str] = None,
+        executor: Executor | None = None,
     ) -> list[dict[str, Any]]:
         """Download specific timestamps (not the latest N).
 
@@ -95,6 +100,8 @@ class RadarSource(ABC):
         Args:
             timestamps: List of specific timestamps to download
             products: List of products to download
+            executor: Optional thread pool to run downloads on (e.g. one
+                already used for availability probes)
 
         Returns:
             List of file info dicts with keys:
@@ -128,11 +135,15 @@ class RadarSource(ABC):
                 extra={"source": self.name},
             )
 
-            download_tasks = [(ts, prod) for ts in timestamps for prod in products]
+            # Product-major order: workers fetch runs of same-path URLs
+            # back to back, which keeps keep-alive connections warm
+            download_tasks = [(ts, prod) for prod in products for ts in timestamps]
             return execute_parallel_downloads(
                 tasks=download_tasks,
                 download_func=self._download_single_file,
                 source_name=self.name,
+                max_workers=self.download_workers,
+                executor=executor,
             )
 
         # Fallback: use download_latest (less efficient)
@@ -5,9 +5,12 @@ Centralized logging module for imeteo-radar
 Provides structured JSON logging with timestamps and human-readable console output.
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import UTC, datetime
 
@@ -81,11 +84,46 @@ class ConsoleFormatter(logging.Formatter):
 # Global state for tracking if logging is already configured
 _logging_configured = False
 
+# Background writer thread when logging is queued (see setup_logging)
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue records as-is; the listener runs in the same process.
+
+    The default prepare() pre-formats the message and drops exc_info,
+    which would bypass StructuredFormatter's exception field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Drain queued records and stop the background writer, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def _unqueue_after_fork() -> None:
+    """Write directly in forked children, which lack the writer thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        logging.getLogger("imeteo_radar").handlers = list(_queue_listener.handlers)
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+os.register_at_fork(after_in_child=_unqueue_after_fork)
+
 
 def setup_logging(
     level: str = "INFO",
     structured: bool = False,
     log_file: str | None = None,
+    queued: bool = False,
 ) -> logging.Logger:
     """Configure application-wide logging.
 
@@ -93,6 +131,9 @@ def setup_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         structured: Use JSON structured output (default: human-readable)
         log_file: Optional file path for log output
+        queued: Hand records to one background writer thread instead of
+            formatting and writing in the logging thread, so busy worker
+            threads never wait on stream I/O
 
     Returns:
         Root logger for imeteo_radar
@@ -107,12 +148,13 @@ def setup_logging(
         # File logging for production
         setup_logging(level="INFO", log_file="/var/log/imeteo-radar.log")
     """
-    global _logging_configured
+    global _logging_configured, _queue_listener
 
     # Get or create root logger for imeteo_radar
     logger = logging.getLogger("imeteo_radar")
 
-    # Clear existing handlers to avoid duplicates
+    # Clear existing handlers to avoid duplicates (draining any queue first)
+    _stop_queue_listener()
     logger.handlers.clear()
 
     # Set log level
@@ -132,7 +174,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(numeric_level)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # Add file handler if specified
     if log_file:
@@ -140,7 +182,18 @@ def setup_logging(
         # Always use structured format for file logs
         file_handler.setFormatter(StructuredFormatter() if structured else formatter)
         file_handler.setLevel(numeric_level)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if queued:
+        log_queue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        logger.addHandler(_InProcessQueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     _logging_configured = True
     return logger
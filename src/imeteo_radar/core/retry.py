@@ -94,7 +94,7 @@ def retry_with_backoff(
         @retry_with_backoff(
             max_retries=5,
             base_delay=0.5,
-            on_retry=lambda attempt, delay, e: print(f"Retry {attempt}: {e}")
+            on_retry=lambda attempt, delay, e: logger.warning(f"Retry {attempt}: {e}")
         )
         def api_call():
             return fetch_data()
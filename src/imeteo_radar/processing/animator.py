@@ -5,6 +5,7 @@ This module creates GIF animations from radar PNG sequences for SHMU, DWD, and m
 Supports multiple products per source and handles different timestamp formats.
 """
 
+import os
 import re
 import warnings
 from datetime import datetime
@@ -118,18 +119,23 @@ class RadarAnimator:
 
         png_files = []
 
-        for file_path in directory.glob("*.png"):
-            # Filter by product if specified
-            if product and not file_path.name.startswith(product):
-                continue
+        # Filter on entry names from one scandir pass; Path objects are only
+        # built for files that are kept
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".png") or name.startswith("."):
+                    continue
 
-            timestamp = self.parse_timestamp(file_path.name, source)
-            if timestamp:
-                png_files.append((file_path, timestamp))
-            else:
-                logger.warning(
-                    f"Skipping file with unparseable timestamp: {file_path.name}"
-                )
+                # Filter by product if specified
+                if product and not name.startswith(product):
+                    continue
+
+                timestamp = self.parse_timestamp(name, source)
+                if timestamp:
+                    png_files.append((Path(entry.path), timestamp))
+                else:
+                    logger.warning(f"Skipping file with unparseable timestamp: {name}")
 
         # Sort by timestamp
         png_files.sort(key=lambda x: x[1])
@@ -12,7 +12,6 @@ through the same CRS pipeline as the data PNGs to ensure pixel-perfect
 alignment.
 """
 
-import glob
 import json
 import os
 from pathlib import Path
@@ -32,7 +31,7 @@ from ..config.sources import (
 from ..core.base import lonlat_to_mercator
 from ..core.logging import get_logger
 from ..core.projections import get_crs_web_mercator, get_crs_wgs84
-from ..utils.extent_loader import get_wgs84_from_extent
+from ..utils.extent_loader import get_wgs84_from_extent, read_extent_file
 
 logger = get_logger(__name__)
 
@@ -53,8 +52,7 @@ def _load_extent_index(output_dir: str) -> dict[str, Any] | None:
     extent_path = os.path.join(output_dir, "extent_index.json")
     if os.path.exists(extent_path):
         try:
-            with open(extent_path) as f:
-                return json.load(f)
+            return read_extent_file(extent_path)
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Failed to load extent_index.json from {output_dir}: {e}")
     return None
@@ -432,16 +430,27 @@ def _reproject_coverage_to_target(
 
 def _get_target_dimensions_from_pngs(output_dir: str) -> tuple[int, int] | None:
     """Get target dimensions from existing radar PNG files in the output directory."""
-    # Find PNG files (excluding coverage_mask.png itself)
-    png_files = glob.glob(os.path.join(output_dir, "*.png"))
-    for png_file in png_files:
-        if "coverage_mask" in png_file:
-            continue
-        try:
-            with Image.open(png_file) as img:
-                return (img.height, img.width)
-        except Exception:
-            continue
+    # Scan lazily so a directory with thousands of frames stops at the first
+    # readable PNG instead of being listed in full (skip coverage_mask.png)
+    try:
+        entries = os.scandir(output_dir)
+    except OSError:
+        return None
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                not name.endswith(".png")
+                or name.startswith(".")
+                or "coverage_mask" in name
+            ):
+                continue
+            try:
+                with Image.open(entry.path) as img:
+                    return (img.height, img.width)
+            except Exception:
+                continue
     return None
 
 
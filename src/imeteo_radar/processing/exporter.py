@@ -17,12 +17,56 @@ from PIL import Image
 from ..config.shmu_colormap import get_shmu_colormap
 from ..core.logging import get_logger
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 # Minimum DBZ value to render — pixels below this threshold are transparent
 MIN_RENDER_DBZ = 10
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _render_lut_kernel(data, lut, vmin, span, scale, min_value, transparent):
+        """Fused mask + LUT index + RGBA gather, one pass over the grid.
+
+        Arithmetic mirrors the NumPy path in _render_to_rgba step by step
+        (same dtype, same operation order, truncating cast) so both produce
+        identical pixels. Scalars must be passed in data's dtype.
+        """
+        height, width = data.shape
+        rgba = np.empty((height, width, 4), dtype=np.uint8)
+        valid_mask = np.empty((height, width), dtype=np.bool_)
+
+        for i in prange(height):
+            for j in range(width):
+                value = data[i, j]
+                valid = np.isfinite(value) and value >= min_value
+                valid_mask[i, j] = valid
+
+                index = 0
+                if valid:
+                    scaled = (value - vmin) / span * scale
+                    if scaled < 0:
+                        scaled = 0
+                    elif scaled > 255:
+                        scaled = 255
+                    index = int(scaled)
+
+                rgba[i, j, 0] = lut[index, 0]
+                rgba[i, j, 1] = lut[index, 1]
+                rgba[i, j, 2] = lut[index, 2]
+                rgba[i, j, 3] = lut[index, 3] if valid or not transparent else 0
+
+        return rgba, valid_mask
+
+
 @dataclass
 class ExportConfig:
     """Configuration for multi-format/multi-resolution export.
@@ -241,6 +285,19 @@ class MultiFormatExporter:
         """
         lut_info = self.colormap_luts[cmap_name]
 
+        # Single fused pass when numba is installed (performance extra)
+        if NUMBA_AVAILABLE and data.ndim == 2 and data.dtype.kind == "f":
+            as_dtype = data.dtype.type
+            return _render_lut_kernel(
+                data,
+                lut_info["lut"],
+                as_dtype(lut_info["vmin"]),
+                as_dtype(lut_info["vmax"] - lut_info["vmin"]),
+                as_dtype(255),
+                as_dtype(MIN_RENDER_DBZ),
+                transparent_background,
+            )
+
         # Map data values to LUT indices (0-255)
         # Handle NaN/invalid values separately
         valid_mask = np.isfinite(data) & (data >= MIN_RENDER_DBZ)
@@ -20,6 +20,8 @@ Storage Format:
 import hashlib
 import os
 import tempfile
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -119,6 +121,8 @@ class TransformCache:
         self._memory_cache: dict[str, TransformGrid] = {}
         self._uploader = None
         self._s3_initialized = False
+        # Guards lazy S3 setup when the cache is shared by worker threads
+        self._s3_init_lock = threading.Lock()
 
         # Create local cache directory
         self.local_cache_dir.mkdir(parents=True, exist_ok=True)
@@ -134,20 +138,29 @@ class TransformCache:
             return None
 
         if not self._s3_initialized:
-            self._s3_initialized = True
-            try:
-                from ..utils.spaces_uploader import SpacesUploader, is_spaces_configured
-
-                if is_spaces_configured():
-                    self._uploader = SpacesUploader()
-                    # Use bucket from uploader if not explicitly set
-                    if self._s3_bucket is None:
-                        self._s3_bucket = self._uploader.bucket
-                    logger.debug("S3 transform cache layer enabled")
-                else:
-                    logger.debug("S3 not configured, using local transform cache only")
-            except Exception as e:
-                logger.warning(f"Failed to initialize S3 for transform cache: {e}")
+            with self._s3_init_lock:
+                if not self._s3_initialized:
+                    try:
+                        from ..utils.spaces_uploader import (
+                            SpacesUploader,
+                            is_spaces_configured,
+                        )
+
+                        if is_spaces_configured():
+                            self._uploader = SpacesUploader()
+                            # Use bucket from uploader if not explicitly set
+                            if self._s3_bucket is None:
+                                self._s3_bucket = self._uploader.bucket
+                            logger.debug("S3 transform cache layer enabled")
+                        else:
+                            logger.debug(
+                                "S3 not configured, using local transform cache only"
+                            )
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to initialize S3 for transform cache: {e}"
+                        )
+                    self._s3_initialized = True
 
         return self._uploader
 
@@ -204,6 +217,17 @@ class TransformCache:
 
         return local_path
 
+    def _iter_local_grids(self) -> Iterator[os.DirEntry]:
+        """Yield .npz entries of the local cache dir from one scandir pass."""
+        try:
+            with os.scandir(self.local_cache_dir) as entries:
+                for entry in entries:
+                    # Same matches as glob("*.npz"): no hidden files
+                    if entry.name.endswith(".npz") and not entry.name.startswith("."):
+                        yield entry
+        except FileNotFoundError:
+            return
+
     def _get_s3_key(self, cache_key: str) -> str:
         """Get S3 key for a given cache key."""
         return f"{self.s3_prefix}{cache_key}.npz"
@@ -248,9 +272,8 @@ class TransformCache:
 
         # Tier 3: S3 cache (slower but persistent)
         if self._get_uploader():
-            grid = self._try_load_from_s3(cache_key)
+            grid = self._try_load_from_s3(cache_key, local_path)
             if grid:
-                self._save_to_disk(local_path, grid)  # Warm local cache
                 self._memory_cache[cache_key] = grid
                 logger.debug(f"Transform cache hit (S3): {source_name}")
                 return grid
@@ -498,10 +521,14 @@ class TransformCache:
         except Exception as e:
             logger.warning(f"Failed to save transform cache to {local_path}: {e}")
 
-    def _try_load_from_s3(self, cache_key: str) -> TransformGrid | None:
+    def _try_load_from_s3(
+        self, cache_key: str, local_path: Path | None = None
+    ) -> TransformGrid | None:
         """Try to load transform grid from S3.
 
-        Returns None if not found or download fails.
+        Returns None if not found or download fails. If local_path is given,
+        a valid download is moved there to warm the local disk cache (the
+        file is already a cache NPZ, so it is not re-compressed and rewritten).
 
         Security: Uses secure temp file handling with try/finally cleanup
         and restrictive file permissions.
@@ -535,6 +562,13 @@ class TransformCache:
             # Load from temp file
             grid = self._load_from_disk(tmp_path)
 
+            if grid and local_path is not None:
+                try:
+                    os.replace(tmp_path, local_path)
+                    tmp_path = None
+                except OSError as e:
+                    logger.debug(f"Failed to warm local transform cache: {e}")
+
             return grid
 
         except uploader.s3_client.exceptions.ClientError as e:
@@ -763,22 +797,21 @@ class TransformCache:
         stats["memory_cache_size_mb"] = round(stats["memory_cache_size_mb"], 2)
 
         # Local cache stats
-        if self.local_cache_dir.exists():
-            for npz_file in self.local_cache_dir.glob("*.npz"):
-                stats["local_entries"] += 1
-                stats["local_size_mb"] += npz_file.stat().st_size / (1024 * 1024)
-
-                # Extract source from filename
-                parts = npz_file.stem.split("_")
-                if parts:
-                    source = parts[0]
-                    if source not in stats["sources"]:
-                        stats["sources"][source] = {
-                            "memory": False,
-                            "local": False,
-                            "s3": False,
-                        }
-                    stats["sources"][source]["local"] = True
+        for entry in self._iter_local_grids():
+            stats["local_entries"] += 1
+            stats["local_size_mb"] += entry.stat().st_size / (1024 * 1024)
+
+            # Extract source from filename
+            parts = entry.name[: -len(".npz")].split("_")
+            if parts:
+                source = parts[0]
+                if source not in stats["sources"]:
+                    stats["sources"][source] = {
+                        "memory": False,
+                        "local": False,
+                        "s3": False,
+                    }
+                stats["sources"][source]["local"] = True
 
         stats["local_size_mb"] = round(stats["local_size_mb"], 2)
 
@@ -817,13 +850,13 @@ class TransformCache:
             Number of files removed
         """
         removed = 0
-        if self.local_cache_dir.exists():
-            for npz_file in self.local_cache_dir.glob("*.npz"):
-                try:
-                    npz_file.unlink()
-                    removed += 1
-                except Exception as e:
-                    logger.warning(f"Failed to remove {npz_file}: {e}")
+        # Finish the directory scan before unlinking entries from it
+        for entry in list(self._iter_local_grids()):
+            try:
+                os.unlink(entry.path)
+                removed += 1
+            except Exception as e:
+                logger.warning(f"Failed to remove {entry.path}: {e}")
 
         self._memory_cache.clear()
         logger.info(f"Cleared {removed} local transform cache entries")
@@ -903,10 +936,9 @@ class TransformCache:
             return (0, 0)
 
         # Get list of local grids
-        local_files = {}
-        if self.local_cache_dir.exists():
-            for npz_file in self.local_cache_dir.glob("*.npz"):
-                local_files[npz_file.name] = npz_file
+        local_files = {
+            entry.name: Path(entry.path) for entry in self._iter_local_grids()
+        }
 
         # Download S3-only grids to local
         for s3_filename in s3_keys:
@@ -11,12 +11,14 @@ Documentation: https://meteo.arso.gov.si/uploads/meteo/help/sl/SRD3Format.html
 
 import os
 import tempfile
+from concurrent.futures import Executor
 from datetime import UTC, datetime
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
-import requests
 from pyproj import CRS, Transformer
 
 from ..core.base import RadarSource, lonlat_to_mercator
@@ -24,10 +26,64 @@ from ..core.logging import get_logger
 from ..utils.parallel_download import (
     create_download_result,
     create_error_result,
+    create_http_session,
 )
 
 logger = get_logger(__name__)
 
+# ARSO serves only the latest frame at a fixed URL; the last download is kept
+# here so repeated runs can revalidate it with a conditional GET
+ARSO_DOWNLOAD_DIR = Path("/tmp/iradar-data/download/arso")
+
+
+@lru_cache(maxsize=1)
+def _get_sirad_transformer(proj4: str) -> Transformer:
+    """Get the SIRAD -> WGS84 transformer (cached, shared by all instances)."""
+    return Transformer.from_crs(
+        CRS.from_proj4(proj4), CRS.from_epsg(4326), always_xy=True
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_sirad_grid(
+    proj4: str,
+    ncell: tuple[int, int],
+    geoss_cell: tuple[int, int],
+    cellsize: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute WGS84 lon/lat arrays for the fixed SIRAD grid (cached).
+
+    The grid is a constant of the SRD-3 format, so it is transformed once
+    per process instead of once per source instance.
+    """
+    width, height = ncell
+
+    # Grid cell indices
+    # i = 1 to 401 (zonal/W-E), j = 1 to 301 (meridional/N-S)
+    # Grid center at [201, 151], GEOSS at [205, 145]
+    # GEOSS offset: 4 km west, 6 km south from center
+
+    # Calculate x,y coordinates in km from GEOSS reference
+    # Center cell offset from GEOSS: (201-205, 151-145) = (-4, 6) cells = (-4, 6) km
+    # So GEOSS is at (0, 0) in projection coordinates
+
+    # Create grid of cell indices (1-indexed as per spec)
+    i_indices = np.arange(1, width + 1)
+    j_indices = np.arange(1, height + 1)
+
+    # Convert cell indices to km coordinates
+    # x = (i - GEOSS_i) * cellsize, y = (GEOSS_j - j) * cellsize
+    # Note: j increases southward in data, but y increases northward in projection
+    geoss_i, geoss_j = geoss_cell
+    x_km = (i_indices - geoss_i) * cellsize
+    y_km = (geoss_j - j_indices) * cellsize
+
+    # Create 2D meshgrid
+    x_grid, y_grid = np.meshgrid(x_km, y_km)
+
+    # Transform to WGS84
+    return _get_sirad_transformer(proj4).transform(x_grid, y_grid)
+
 
 class ARSORadarSource(RadarSource):
     """ARSO Slovenia radar data source using SRD-3 format"""
@@ -68,13 +124,14 @@ class ARSORadarSource(RadarSource):
     def __init__(self):
         super().__init__("arso")
         # temp_files is initialized in base class
+        self.download_dir = ARSO_DOWNLOAD_DIR
+        # Keep-alive session for the header probe and the download
+        self.session = create_http_session()
 
-        # Initialize projection transformer
-        self.sirad_crs = CRS.from_proj4(self.SIRAD_PROJ4)
-        self.wgs84_crs = CRS.from_epsg(4326)
-        self.transformer = Transformer.from_crs(
-            self.sirad_crs, self.wgs84_crs, always_xy=True
-        )
+        # Initialize projection transformer (shared across instances)
+        self.transformer = _get_sirad_transformer(self.SIRAD_PROJ4)
+        self.sirad_crs = self.transformer.source_crs
+        self.wgs84_crs = self.transformer.target_crs
 
         # Pre-compute grid coordinates (only done once)
         self._lons = None
@@ -221,33 +278,9 @@ class ARSORadarSource(RadarSource):
         if self._lons is not None:
             return
 
-        width, height = self.GRID_NCELL
-
-        # Grid cell indices
-        # i = 1 to 401 (zonal/W-E), j = 1 to 301 (meridional/N-S)
-        # Grid center at [201, 151], GEOSS at [205, 145]
-        # GEOSS offset: 4 km west, 6 km south from center
-
-        # Calculate x,y coordinates in km from GEOSS reference
-        # Center cell offset from GEOSS: (201-205, 151-145) = (-4, 6) cells = (-4, 6) km
-        # So GEOSS is at (0, 0) in projection coordinates
-
-        # Create grid of cell indices (1-indexed as per spec)
-        i_indices = np.arange(1, width + 1)
-        j_indices = np.arange(1, height + 1)
-
-        # Convert cell indices to km coordinates
-        # x = (i - GEOSS_i) * cellsize, y = (GEOSS_j - j) * cellsize
-        # Note: j increases southward in data, but y increases northward in projection
-        geoss_i, geoss_j = self.GEOSS_CELL
-        x_km = (i_indices - geoss_i) * self.GRID_CELLSIZE
-        y_km = (geoss_j - j_indices) * self.GRID_CELLSIZE
-
-        # Create 2D meshgrid
-        x_grid, y_grid = np.meshgrid(x_km, y_km)
-
-        # Transform to WGS84
-        lons, lats = self.transformer.transform(x_grid, y_grid)
+        lons, lats = _get_sirad_grid(
+            self.SIRAD_PROJ4, self.GRID_NCELL, self.GEOSS_CELL, self.GRID_CELLSIZE
+        )
 
         self._lons = lons
         self._lats = lats
@@ -268,37 +301,49 @@ class ARSORadarSource(RadarSource):
         try:
             url = self._get_product_url(product)
 
-            # Check if we've already downloaded this file in this session
-            cache_key = f"latest_{product}"
-            if cache_key in self.temp_files:
-                # Check if file still exists
-                if os.path.exists(self.temp_files[cache_key]):
-                    return create_download_result(
-                        timestamp="",
-                        product=product,
-                        path=self.temp_files[cache_key],
-                        url=url,
-                        cached=True,
-                    )
+            local_path = self.download_dir / self.PRODUCTS[product]["file"]
+
+            # Revalidate the previous download: the server answers 304 with
+            # headers only while the latest frame is unchanged
+            headers = {}
+            if local_path.exists():
+                headers["If-Modified-Since"] = formatdate(
+                    local_path.stat().st_mtime, usegmt=True
+                )
 
-            # Download to temporary file
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30, headers=headers)
+            if response.status_code == 304:
+                return create_download_result(
+                    timestamp="",
+                    product=product,
+                    path=str(local_path),
+                    url=url,
+                    cached=True,
+                )
             response.raise_for_status()
 
-            # Save to temp file
+            # Write next to the final path, then replace it atomically
+            local_path.parent.mkdir(parents=True, exist_ok=True)
             with tempfile.NamedTemporaryFile(
-                suffix=f"_arso_{product}.srd", delete=False, mode="wb"
+                dir=local_path.parent, suffix=".tmp", delete=False, mode="wb"
             ) as temp_file:
                 temp_file.write(response.content)
                 temp_path = Path(temp_file.name)
+            os.replace(temp_path, local_path)
 
-            # Track the temporary file
-            self.temp_files[cache_key] = str(temp_path)
+            # Stamp the file with the server's time for the next revalidation
+            last_modified = response.headers.get("Last-Modified")
+            if last_modified:
+                try:
+                    mtime = parsedate_to_datetime(last_modified).timestamp()
+                    os.utime(local_path, (mtime, mtime))
+                except (TypeError, ValueError):
+                    pass
 
             return create_download_result(
                 timestamp="",
                 product=product,
-                path=str(temp_path),
+                path=str(local_path),
                 url=url,
                 cached=False,
             )
@@ -331,7 +376,7 @@ class ARSORadarSource(RadarSource):
             try:
                 url = self._get_product_url(product)
                 # Download just enough to parse the header (first 2KB)
-                response = requests.get(
+                response = self.session.get(
                     url, timeout=30, headers={"Range": "bytes=0-2048"}
                 )
                 if response.status_code in [200, 206]:
@@ -353,6 +398,7 @@ class ARSORadarSource(RadarSource):
         self,
         timestamps: list[str],
         products: list[str] = None,
+        executor: Executor | None = None,
     ) -> list[dict[str, Any]]:
         """Download specific ARSO timestamps.
 
@@ -362,6 +408,7 @@ class ARSORadarSource(RadarSource):
         Args:
             timestamps: List of requested timestamps (YYYYMMDDHHMMSS format)
             products: List of products to download (default: ['zm'])
+            executor: Ignored (ARSO downloads one file per product, sequentially)
 
         Returns:
             List of file info dicts (may be empty if latest doesn't match)
@@ -6,6 +6,7 @@ Handles downloading and processing of DWD radar composite data.
 """
 
 import os
+import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -37,6 +38,9 @@ from ..utils.timestamps import (
 )
 
 logger = get_logger(__name__)
+
+# YYYYMMDD_HHMM timestamp embedded in DWD filenames
+_FILENAME_TS_RE = re.compile(r"(\d{8})_(\d{4})")
 alert_manager = get_alert_manager()
 
 
@@ -554,9 +558,7 @@ class DWDRadarSource(RadarSource):
         """Extract timestamp from DWD file path and normalize to 14-digit format"""
         filename = Path(file_path).name
         # Extract YYYYMMDD_HHMM pattern
-        import re
-
-        match = re.search(r"(\d{8})_(\d{4})", filename)
+        match = _FILENAME_TS_RE.search(filename)
         if match:
             date_part = match.group(1)
             time_part = match.group(2)
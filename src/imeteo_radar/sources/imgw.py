@@ -6,6 +6,7 @@ Handles downloading and processing of IMGW radar data in ODIM_H5 format.
 Data is accessed via the IMGW public API at https://danepubliczne.imgw.pl/api/data/product
 """
 
+import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -39,6 +40,9 @@ from ..utils.timestamps import (
 
 logger = get_logger(__name__)
 
+# 14 timestamp digits followed by the "00dBZ" suffix of IMGW filenames
+_FILENAME_TS_RE = re.compile(r"(\d{14})00dBZ")
+
 
 class IMGWRadarSource(RadarSource):
     """IMGW Radar data source implementation"""
@@ -128,16 +132,10 @@ class IMGWRadarSource(RadarSource):
         Filename format: YYYYMMDDHHMMSS00dBZ.cmax.h5
         Returns: YYYYMMDDHHMMSS (14 digits)
         """
-        # Remove file extension and suffix
         # Example: 2026012705300000dBZ.cmax.h5 -> 20260127053000
-        try:
-            # Extract digits before "00dBZ"
-            ts_part = filename.split("00dBZ")[0]
-            if len(ts_part) == 14 and ts_part.isdigit():
-                return ts_part
-        except Exception:
-            pass
-        return None
+        # Validate with the regex up front instead of wrapping parsing in try
+        match = _FILENAME_TS_RE.match(filename)
+        return match.group(1) if match else None
 
     def _check_timestamp_availability(self, timestamp: str, product: str) -> bool:
         """Check if data is available for a specific timestamp and product
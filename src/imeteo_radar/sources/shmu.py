@@ -5,12 +5,19 @@ SHMU (Slovak Hydrometeorological Institute) Radar Source
 Handles downloading and processing of SHMU radar data in ODIM_H5 format.
 """
 
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
 import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
-import requests
 import urllib3
 
 from ..core.base import (
@@ -23,11 +30,15 @@ from ..utils.hdf5_utils import (
     decode_hdf5_attrs,
     get_quantity_units,
     get_scaling_params,
+    quantize_radar_data,
     scale_radar_data,
 )
 from ..utils.parallel_download import (
     create_download_result,
     create_error_result,
+    create_http_session,
+    default_io_workers,
+    find_available_parallel,
 )
 from ..utils.timestamps import (
     TimestampFormat,
@@ -35,6 +46,14 @@ from ..utils.timestamps import (
     generate_timestamp_candidates,
 )
 
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # Suppress SSL verification warnings for SHMU (their certificate has issues)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -50,16 +69,42 @@ SHMU_FALLBACK_EXTENT = {
     "north": 50.701424,
 }
 
+# (connect, read) timeouts in seconds for availability probes: a HEAD has no
+# body, so the read side only waits for the status line
+HEAD_TIMEOUT = (3.0, 2.0)
+
+# Timestamps confirmed on the server are remembered across runs for an hour
+AVAILABILITY_CACHE_DIR = Path("/tmp/iradar-data/availability")
+AVAILABILITY_TTL_SECONDS = 3600
+
 
 class SHMURadarSource(RadarSource):
     """SHMU Radar data source implementation"""
 
-    def __init__(self):
+    def __init__(self, max_workers: int | None = None, max_avail_workers: int = 8):
+        """Initialize the SHMU source.
+
+        Args:
+            max_workers: Concurrent downloads (default: 4 per CPU, at most 16).
+                Lower it if the server starts throttling.
+            max_avail_workers: Concurrent HEAD probes (HTTP/2 connections
+                or probe threads)
+        """
         super().__init__("shmu")
+        self.download_workers = max_workers or default_io_workers()
+        self.avail_workers = max_avail_workers
         self.base_url = (
             "https://opendata.shmu.sk/meteorology/weather/radar/composite/skcomp"
         )
 
+        # Keep-alive session shared by availability probes and downloads
+        # (SSL verification disabled, their certificate has issues)
+        self.session = create_http_session(
+            pool_maxsize=max(16, self.download_workers, self.avail_workers),
+            verify=False,
+        )
+        self.availability_cache_dir = AVAILABILITY_CACHE_DIR
+
         # SHMU product mapping
         self.product_mapping = {
             "zmax": "PABV",  # Maximum reflectivity
@@ -68,6 +113,9 @@ class SHMURadarSource(RadarSource):
             "pac01": "PASV",  # 1h accumulated precipitation
         }
 
+        # Coverage is fixed, so build the extent once
+        self._extent = self._build_extent()
+
         # Product metadata
         self.product_info = {
             "zmax": {
@@ -123,11 +171,59 @@ class SHMURadarSource(RadarSource):
         """Check if data is available for a specific timestamp and product"""
         url = self._get_product_url(timestamp, product)
         try:
-            response = requests.head(url, timeout=5, verify=False)
+            response = self.session.head(
+                url, timeout=HEAD_TIMEOUT, allow_redirects=False
+            )
             return response.status_code == 200
         except Exception:
             return False
 
+    def _check_many_availability(self, timestamps: list[str], product: str) -> set[str]:
+        """Probe many timestamps at once over a shared HTTP/2 connection.
+
+        All HEAD requests are multiplexed as concurrent streams, so the TLS
+        handshake is paid once. Failed probes count as unavailable.
+
+        Returns:
+            Set of timestamps whose file exists on the server
+
+        Raises:
+            RuntimeError: If called from a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Checked before the coroutine exists, so none is left unawaited
+            raise RuntimeError("asyncio.run() cannot be called from a running loop")
+
+        async def _probe() -> set[str]:
+            async with httpx.AsyncClient(
+                http2=True,
+                # Queued probes may wait on the pool; each one is still bounded
+                timeout=httpx.Timeout(
+                    HEAD_TIMEOUT[1], connect=HEAD_TIMEOUT[0], pool=None
+                ),
+                verify=False,
+                limits=httpx.Limits(max_connections=self.avail_workers),
+            ) as client:
+                responses = await asyncio.gather(
+                    *(
+                        client.head(self._get_product_url(timestamp, product))
+                        for timestamp in timestamps
+                    ),
+                    return_exceptions=True,
+                )
+            return {
+                timestamp
+                for timestamp, response in zip(timestamps, responses)
+                if not isinstance(response, BaseException)
+                and response.status_code == 200
+            }
+
+        return asyncio.run(_probe())
+
     def _download_single_file(self, timestamp: str, product: str) -> dict[str, Any]:
         """Download a single radar file (for parallel processing)"""
         if product not in self.product_mapping:
@@ -150,13 +246,20 @@ class SHMURadarSource(RadarSource):
             # Download to temporary file
             url = self._get_product_url(timestamp, product)
 
-            with tempfile.NamedTemporaryFile(
-                suffix=f"_shmu_{product}_{timestamp}.hdf", delete=False
-            ) as temp_file:
-                response = requests.get(url, timeout=30, verify=False)
+            # Stream to disk in 1 MiB chunks instead of buffering the payload
+            with self.session.get(url, timeout=30, stream=True) as response:
                 response.raise_for_status()
-                temp_file.write(response.content)
-                temp_path = Path(temp_file.name)
+                response.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(
+                    suffix=f"_shmu_{product}_{timestamp}.hdf", delete=False
+                ) as temp_file:
+                    temp_path = Path(temp_file.name)
+                    try:
+                        shutil.copyfileobj(response.raw, temp_file, 1024 * 1024)
+                    except Exception:
+                        temp_file.close()
+                        temp_path.unlink(missing_ok=True)
+                        raise
 
             # Track the temporary file
             self.temp_files[cache_key] = str(temp_path)
@@ -178,6 +281,7 @@ class SHMURadarSource(RadarSource):
         products: list[str] = None,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
+        executor: Executor | None = None,
     ) -> list[str]:
         """Get list of available SHMU timestamps WITHOUT downloading.
 
@@ -186,6 +290,7 @@ class SHMURadarSource(RadarSource):
             products: List of products to check (default: ['zmax'])
             start_time: Optional start time for filtering
             end_time: Optional end time for filtering
+            executor: Optional thread pool for the threaded HEAD probes
 
         Returns:
             List of timestamp strings in YYYYMMDDHHMMSS format, newest first
@@ -205,15 +310,90 @@ class SHMURadarSource(RadarSource):
                 test_timestamps, start_time, end_time
             )
 
-        # Find available timestamps
-        available_timestamps = []
-        for timestamp in test_timestamps:
-            if len(available_timestamps) >= count:
-                break
-            if self._check_timestamp_availability(timestamp, "zmax"):
-                available_timestamps.append(timestamp)
+        # Timestamps confirmed by a recent run need no HEAD request
+        known = self._load_known_available("zmax")
+
+        available = None
+        # Probe every other candidate over one multiplexed connection
+        if HTTPX_AVAILABLE:
+            # Only candidates newer than the count-th known one can matter
+            unknown, known_hits = [], 0
+            for ts in test_timestamps:
+                if known_hits >= count:
+                    break
+                if ts in known:
+                    known_hits += 1
+                else:
+                    unknown.append(ts)
+            try:
+                found = (
+                    self._check_many_availability(unknown, "zmax") if unknown else set()
+                )
+                available = [
+                    ts for ts in test_timestamps if ts in known or ts in found
+                ][:count]
+            except RuntimeError as e:
+                # asyncio.run() cannot be nested inside a running event loop
+                logger.debug(f"HTTP/2 probing unavailable, using threads: {e}")
+
+        if available is None:
+            # Find available timestamps (HEAD probes run concurrently)
+            available = find_available_parallel(
+                test_timestamps,
+                lambda timestamp: timestamp in known
+                or self._check_timestamp_availability(timestamp, "zmax"),
+                count,
+                max_workers=self.avail_workers,
+                executor=executor,
+            )
+
+        self._remember_available("zmax", known, available)
+        return available
+
+    def _load_known_available(self, product: str) -> dict[str, float]:
+        """Load timestamps confirmed on the server within the TTL.
+
+        Returns:
+            Dict mapping timestamp to the Unix time it was confirmed
+        """
+        path = self.availability_cache_dir / f"shmu_{product}.json"
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+
+        cutoff = time.time() - AVAILABILITY_TTL_SECONDS
+        return {
+            ts: checked_at
+            for ts, checked_at in entries.items()
+            if isinstance(checked_at, (int, float)) and checked_at >= cutoff
+        }
+
+    def _remember_available(
+        self, product: str, known: dict[str, float], timestamps: list[str]
+    ) -> None:
+        """Persist newly confirmed timestamps (best effort, atomic replace)."""
+        new_timestamps = [ts for ts in timestamps if ts not in known]
+        if not new_timestamps:
+            return
 
-        return available_timestamps
+        entries = {**known, **dict.fromkeys(new_timestamps, time.time())}
+        path = self.availability_cache_dir / f"shmu_{product}.json"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not save SHMU availability cache: {e}")
 
     # download_timestamps is inherited from RadarSource base class
 
@@ -237,38 +417,65 @@ class SHMURadarSource(RadarSource):
             extra={"source": "shmu"},
         )
 
-        # Get available timestamps
-        available_timestamps = self.get_available_timestamps(
-            count=count,
-            products=products,
-            start_time=start_time,
-            end_time=end_time,
-        )
+        # One pool for both phases: probe threads (and their pooled
+        # connections) stay warm for the downloads that follow
+        with ThreadPoolExecutor(
+            max_workers=self.download_workers, thread_name_prefix="shmu"
+        ) as executor:
+            # Get available timestamps
+            available_timestamps = self.get_available_timestamps(
+                count=count,
+                products=products,
+                start_time=start_time,
+                end_time=end_time,
+                executor=executor,
+            )
 
-        # Log found timestamps
-        for ts in available_timestamps:
-            logger.info(f"Found current: {ts}", extra={"source": "shmu"})
+            # Log found timestamps
+            for ts in available_timestamps:
+                logger.info(f"Found current: {ts}", extra={"source": "shmu"})
 
-        if not available_timestamps:
-            logger.warning("No available timestamps found", extra={"source": "shmu"})
-            return []
+            if not available_timestamps:
+                logger.warning(
+                    "No available timestamps found", extra={"source": "shmu"}
+                )
+                return []
 
-        # Download the timestamps
-        return self.download_timestamps(available_timestamps, products)
+            # Download the timestamps
+            return self.download_timestamps(
+                available_timestamps, products, executor=executor
+            )
 
-    def process_to_array(self, file_path: str) -> dict[str, Any]:
-        """Process SHMU HDF5 file to array with metadata"""
+    def process_to_array(
+        self, file_path: str, dtype: str = "float32"
+    ) -> dict[str, Any]:
+        """Process SHMU HDF5 file to array with metadata
+
+        Args:
+            file_path: Path to the SHMU HDF5 file
+            dtype: Output dtype: "float32" (default), "float16" or "int8".
+                int8 data stores NaN as a sentinel; metadata["quantization"]
+                holds what dequantize_radar_data() needs to restore floats.
+        """
         import h5py
         import numpy as np
 
         try:
-            with h5py.File(file_path, "r") as f:
-                # Read raw data
-                data = f["dataset1/data1/data"][:]
+            with h5py.File(
+                file_path,
+                "r",
+                rdcc_nbytes=16 * 1024 * 1024,
+                rdcc_nslots=10007,
+                rdcc_w0=0.75,
+            ) as f:
+                # Read raw data straight into a pre-allocated array
+                dataset = f["dataset1/data1/data"]
+                data = np.empty(dataset.shape, dtype=dataset.dtype)
+                dataset.read_direct(data)
 
                 # Get and decode attributes
-                what_attrs = decode_hdf5_attrs(dict(f["dataset1/what"].attrs))
-                where_attrs = decode_hdf5_attrs(dict(f["where"].attrs))
+                what_attrs = decode_hdf5_attrs(f["dataset1/what"].attrs)
+                where_attrs = decode_hdf5_attrs(f["where"].attrs)
 
                 # Get scaling parameters and scale data
                 scaling = get_scaling_params(
@@ -285,6 +492,9 @@ class SHMURadarSource(RadarSource):
                     scaling["undetect"],
                     handle_uint8=True,  # SHMU uses 255 as nodata for uint8
                 )
+                scaled_data, quantization = quantize_radar_data(
+                    scaled_data, dtype, scaling["gain"], scaling["offset"]
+                )
 
                 # Extract corner coordinates directly from HDF5 data
                 ll_lon = float(where_attrs["LL_lon"])
@@ -326,6 +536,7 @@ class SHMURadarSource(RadarSource):
                         "nodata_value": np.nan,
                         "gain": scaling["gain"],
                         "offset": scaling["offset"],
+                        "quantization": quantization,
                     },
                     "extent": {
                         "wgs84": {
@@ -342,8 +553,48 @@ class SHMURadarSource(RadarSource):
         except Exception as e:
             raise RuntimeError(f"Failed to process SHMU file {file_path}: {e}") from e
 
+    def process_many(
+        self,
+        file_paths: list[str],
+        max_workers: int | None = None,
+        dtype: str = "float32",
+    ) -> list[dict[str, Any]]:
+        """Process several SHMU HDF5 files in parallel worker processes.
+
+        h5py serializes every call behind one library-wide lock, so threads
+        cannot decode files concurrently; separate processes can.
+
+        Args:
+            file_paths: Paths of HDF5 files to process
+            max_workers: Worker processes (default: CPU count)
+            dtype: Output dtype, as for process_to_array()
+
+        Returns:
+            process_to_array() results in the same order as file_paths
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        if workers <= 1:
+            return [self.process_to_array(path, dtype) for path in file_paths]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_process_worker,
+            initargs=(self.download_workers, self.avail_workers),
+            # HDF5 is not fork-safe: workers must not inherit its state
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return list(
+                executor.map(
+                    _run_process_worker, file_paths, repeat(dtype, len(file_paths))
+                )
+            )
+
     def get_extent(self) -> dict[str, Any]:
-        """Get SHMU radar coverage extent"""
+        """Get SHMU radar coverage extent (shared dict, do not mutate)"""
+        return self._extent
+
+    def _build_extent(self) -> dict[str, Any]:
+        """Build the fixed SHMU coverage extent in WGS84 and Web Mercator"""
         wgs84 = SHMU_FALLBACK_EXTENT.copy()
 
         x_min, y_min = lonlat_to_mercator(wgs84["west"], wgs84["south"])
@@ -366,3 +617,17 @@ class SHMURadarSource(RadarSource):
     def extract_extent_only(self, file_path: str) -> dict[str, Any]:
         """Extract extent from SHMU HDF5 without loading data array."""
         return extract_hdf5_corner_extent(file_path)
+
+
+# Per-process state for process_many workers (see _init_process_worker)
+_PROCESS_WORKER: dict[str, SHMURadarSource] = {}
+
+
+def _init_process_worker(max_workers: int, max_avail_workers: int) -> None:
+    """Create one SHMU source per worker process (its session is not picklable)."""
+    _PROCESS_WORKER["source"] = SHMURadarSource(max_workers, max_avail_workers)
+
+
+def _run_process_worker(file_path: str, dtype: str) -> dict[str, Any]:
+    """Process one SHMU file inside a worker process."""
+    return _PROCESS_WORKER["source"].process_to_array(file_path, dtype)
@@ -7,6 +7,11 @@ to ensure consistent behavior and reduce code duplication.
 """
 
 import argparse
+import asyncio
+import os
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +19,16 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Back-to-back CLI runs skip the expired-entry sweep for this long
+CACHE_CLEANUP_INTERVAL_SECONDS = 300
+
+# Recent S3 existence results, (source, filename) -> (exists, monotonic time)
+_exists_cache: dict[tuple[str, str], tuple[bool, float]] = {}
+_EXISTS_CACHE_MAX = 4096
+
+# Regular files found in each output directory, listed once per run
+_dir_cache: dict[Path, frozenset[str]] = {}
+
 
 def init_uploader(args: Any) -> Any:
     """Initialize DigitalOcean Spaces uploader from CLI arguments.
@@ -129,6 +144,18 @@ def add_export_format_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+@lru_cache(maxsize=8)
+def _get_or_build_cache(local_dir: Path, ttl_minutes: int, s3_enabled: bool) -> Any:
+    """Return one shared ProcessedDataCache per configuration."""
+    from .processed_cache import ProcessedDataCache
+
+    return ProcessedDataCache(
+        local_dir=local_dir,
+        ttl_minutes=ttl_minutes,
+        s3_enabled=s3_enabled,
+    )
+
+
 def init_cache_from_args(args: Any, upload_enabled: bool = True) -> Any:
     """Initialize ProcessedDataCache from CLI arguments.
 
@@ -151,22 +178,20 @@ def init_cache_from_args(args: Any, upload_enabled: bool = True) -> Any:
         logger.debug("Caching disabled via --no-cache")
         return None
 
-    from .processed_cache import ProcessedDataCache
-
     s3_enabled = upload_enabled and not getattr(args, "no_cache_upload", False)
 
-    cache = ProcessedDataCache(
-        local_dir=getattr(args, "cache_dir", Path("/tmp/iradar-data/data")),
-        ttl_minutes=getattr(args, "cache_ttl", 60),
-        s3_enabled=s3_enabled,
+    cache = _get_or_build_cache(
+        getattr(args, "cache_dir", Path("/tmp/iradar-data/data")),
+        getattr(args, "cache_ttl", 60),
+        s3_enabled,
     )
 
     if getattr(args, "clear_cache", False):
         cleared = cache.clear()
         logger.info(f"Cleared {cleared} cache entries")
 
-    # Cleanup expired entries on startup
-    cache.cleanup_expired()
+    # Cleanup expired entries on startup, unless a recent run already did
+    cache.cleanup_expired(min_interval=CACHE_CLEANUP_INTERVAL_SECONDS)
 
     logger.debug(
         f"Cache initialized: dir={cache.local_dir}, "
@@ -176,34 +201,198 @@ def init_cache_from_args(args: Any, upload_enabled: bool = True) -> Any:
     return cache
 
 
-def output_exists(output_path: Path, source: str, filename: str, uploader: Any) -> bool:
+def _cached_file_exists(
+    uploader: Any, source: str, filename: str, ttl: float = 60.0
+) -> bool:
+    """Return uploader.file_exists, remembering hits and misses for ttl seconds.
+
+    Failed checks raise and are not cached.
+    """
+    key = (source, filename)
+    cached = _exists_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < ttl:
+        return cached[0]
+
+    exists = bool(uploader.file_exists(source, filename))
+    # Re-insert so dict order stays oldest-first for eviction
+    _exists_cache.pop(key, None)
+    _exists_cache[key] = (exists, now)
+    if len(_exists_cache) > _EXISTS_CACHE_MAX:
+        _exists_cache.pop(next(iter(_exists_cache)), None)
+    return exists
+
+
+def _dir_entries(directory: Path) -> frozenset[str]:
+    """Return the regular file names in a directory, scanning it only on first use.
+
+    Entries are typed from the directory listing itself, so a directory at
+    an output path never counts as an existing output. A missing or
+    unreadable directory has no entries.
+    """
+    names = _dir_cache.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            names = frozenset()
+        _dir_cache[directory] = names
+    return names
+
+
+def output_exists(
+    output_path: Path,
+    source: str,
+    filename: str,
+    uploader: Any,
+    existing: set[str] | frozenset[str] | None = None,
+) -> bool:
     """Check if output file already exists locally or in S3.
 
     Used to skip redundant processing and uploads when the output
-    file already exists either locally or in S3.
+    file already exists either locally or in S3. Local and S3 results are
+    remembered for the run: each output directory is listed once, so files
+    written later must be added with record_outputs(), and any new code
+    path that writes outputs must call it after writing. Call
+    clear_output_caches() to forget everything.
 
     Args:
         output_path: Local path to the output file
         source: Source identifier for S3 path (e.g., 'dwd', 'composite')
         filename: Filename within the source directory (e.g., '1738123400.png')
         uploader: SpacesUploader instance or None
+        existing: Filenames already known to exist in S3 (e.g., from
+            SpacesUploader.existing_files). When given, it replaces the
+            per-file S3 request.
 
     Returns:
         True if file exists and should be skipped, False otherwise
     """
-    # Check local first (fast)
-    if output_path.exists():
+    if existing is not None:
+        if _exists_locally(output_path):
+            return True
+        if filename in existing:
+            logger.debug(f"Output exists in S3: {source}/{filename}")
+            return True
+        return False
+
+    # Specialized on the uploader: local-only runs skip the S3 path entirely
+    check = _OUTPUT_EXISTS_IMPLS.get(type(uploader), _output_exists_with_s3)
+    return check(output_path, source, filename, uploader)
+
+
+def _exists_locally(output_path: Path) -> bool:
+    # Fast: one directory scan for all siblings
+    if output_path.name in _dir_entries(output_path.parent):
         logger.debug(f"Output exists locally: {output_path}")
         return True
+    return False
+
+
+def _output_exists_local_only(
+    output_path: Path, source: str, filename: str, uploader: None
+) -> bool:
+    return _exists_locally(output_path)
+
+
+def _output_exists_with_s3(
+    output_path: Path, source: str, filename: str, uploader: Any
+) -> bool:
+    # Check local first (fast)
+    if _exists_locally(output_path):
+        return True
+
+    try:
+        if _cached_file_exists(uploader, source, filename):
+            logger.debug(f"Output exists in S3: {source}/{filename}")
+            return True
+    except Exception as e:
+        logger.debug(f"S3 existence check failed: {e}")
+        # Fall through - proceed with processing if S3 check fails
+
+    return False
+
 
-    # Check S3 if uploader available
-    if uploader is not None:
+_OUTPUT_EXISTS_IMPLS: dict[type, Callable[[Path, str, str, Any], bool]] = {
+    type(None): _output_exists_local_only
+}
+
+
+def record_outputs(output_paths: Iterable[Path]) -> None:
+    """Add files written during the run to the remembered directory listings."""
+    for path in output_paths:
+        names = _dir_cache.get(path.parent)
+        # Directories not listed yet will see the file when first scanned
+        if names is not None:
+            _dir_cache[path.parent] = names | {path.name}
+
+
+def clear_output_caches() -> None:
+    """Forget local directory listings and S3 results remembered by output_exists."""
+    _dir_cache.clear()
+    _exists_cache.clear()
+
+
+async def output_exists_async(
+    output_path: Path, source: str, filename: str, uploader: Any
+) -> bool:
+    """Async version of output_exists; the blocking checks run in a thread."""
+    return await asyncio.to_thread(
+        output_exists, output_path, source, filename, uploader
+    )
+
+
+async def output_exists_many_async(
+    items: list[tuple[Path, str, str]], uploader: Any
+) -> list[bool]:
+    """Run output_exists for many (output_path, source, filename) items at once.
+
+    For uploaders or buckets where listing is not an option: the per-file
+    S3 checks are issued concurrently instead of one after another.
+
+    Args:
+        items: (output_path, source, filename) tuples as for output_exists
+        uploader: SpacesUploader instance or None
+
+    Returns:
+        One flag per item, True if it exists locally or in S3
+    """
+    return list(
+        await asyncio.gather(*(output_exists_async(*item, uploader) for item in items))
+    )
+
+
+def output_exists_many(
+    output_paths: list[Path], source: str, filenames: list[str], uploader: Any
+) -> list[bool]:
+    """Batch version of output_exists for outputs spread over any paths.
+
+    Local files are found with one directory scan per distinct parent
+    directory (shared with output_exists) instead of a stat per file, and
+    files missing locally are checked with one S3 listing instead of a
+    HEAD request each.
+
+    Args:
+        output_paths: Local paths to the output files
+        source: Source identifier for S3 path (e.g., 'dwd', 'composite')
+        filenames: Filenames within the source directory, parallel to
+            output_paths
+        uploader: SpacesUploader instance or None
+
+    Returns:
+        One flag per output, True if it exists locally or in S3
+    """
+    result = [path.name in _dir_entries(path.parent) for path in output_paths]
+
+    missing = [name for name, found in zip(filenames, result) if not found]
+    if uploader is not None and missing:
         try:
-            if uploader.file_exists(source, filename):
-                logger.debug(f"Output exists in S3: {source}/{filename}")
-                return True
+            in_s3 = uploader.existing_files(source, missing)
         except Exception as e:
             logger.debug(f"S3 existence check failed: {e}")
             # Fall through - proceed with processing if S3 check fails
+            return result
+        result = [found or name in in_s3 for name, found in zip(filenames, result)]
 
-    return False
+    return result
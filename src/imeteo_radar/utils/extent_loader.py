@@ -12,10 +12,19 @@ without needing to recompute projections.
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from ..core.logging import get_logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 # Canonical local directory for extent files
@@ -32,6 +41,37 @@ def _get_uploader():
     return get_uploader_if_configured()
 
 
+@lru_cache(maxsize=32)
+def _parse_extent_file(path: str, mtime_ns: int) -> dict:
+    """Parse an extent file; cached per path and modification time."""
+    with open(path, "rb") as f:
+        content = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def read_extent_file(path: str | Path) -> dict:
+    """Read and parse an extent_index.json file.
+
+    The parsed result is reused until the file's mtime changes, so
+    repeated lookups of the same extent (e.g. once per mask) parse the
+    file only once. Callers must treat the returned dict as read-only.
+
+    Args:
+        path: Path to the extent_index.json file
+
+    Returns:
+        Parsed extent data
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return _parse_extent_file(str(path), os.stat(path).st_mtime_ns)
+
+
 def get_extent_path(source_name: str) -> Path:
     """Get local path for extent_index.json.
 
@@ -63,8 +103,7 @@ def load_extent_index(source_name: str) -> dict | None:
     # 1. Check local cache first
     if local_path.exists():
         try:
-            with open(local_path) as f:
-                data = json.load(f)
+            data = read_extent_file(local_path)
             logger.debug(f"Loaded extent from local: {source_name}")
             return data
         except (json.JSONDecodeError, OSError) as e:
@@ -76,8 +115,7 @@ def load_extent_index(source_name: str) -> dict | None:
         s3_key = f"{EXTENT_S3_PREFIX}/{source_name}/extent_index.json"
         if uploader.download_metadata(s3_key, local_path):
             try:
-                with open(local_path) as f:
-                    data = json.load(f)
+                data = read_extent_file(local_path)
                 logger.info(f"Downloaded extent from S3: {source_name}")
                 return data
             except (json.JSONDecodeError, OSError) as e:
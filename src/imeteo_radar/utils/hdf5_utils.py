@@ -6,6 +6,7 @@ Consolidates common HDF5 reading, attribute extraction, and data scaling
 logic that was duplicated across source classes (DWD, SHMU, CHMI, IMGW).
 """
 
+from functools import lru_cache
 from typing import Any
 
 import h5py
@@ -20,20 +21,16 @@ def decode_hdf5_attrs(attrs: dict) -> dict[str, Any]:
     """Decode HDF5 attributes, converting bytes to strings.
 
     Args:
-        attrs: Dictionary of HDF5 attributes (may contain bytes)
+        attrs: HDF5 attributes (dict or h5py AttributeManager, may contain bytes)
 
     Returns:
         Dictionary with bytes decoded to strings
     """
-    decoded = {}
-    for key, value in attrs.items():
-        if isinstance(value, bytes):
-            decoded[key] = value.decode("utf-8")
-        elif isinstance(value, np.bytes_):
-            decoded[key] = value.decode("utf-8")
-        else:
-            decoded[key] = value
-    return decoded
+    # np.bytes_ subclasses bytes, so one check covers both
+    return {
+        key: value.decode("utf-8") if isinstance(value, bytes) else value
+        for key, value in attrs.items()
+    }
 
 
 def get_scaling_params(
@@ -63,6 +60,48 @@ def get_scaling_params(
     }
 
 
+@lru_cache(maxsize=1)
+def _get_scale_kernel():
+    """Compile the fused scale-and-mask kernel, or None without numba.
+
+    numba is imported lazily so sources that never scale ODIM data do not
+    pay for it at import time.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def _scale_kernel(data, gain, offset, nodata, undetect, mask_255):
+        """Scale and mask special values in one pass over the grid.
+
+        Raw values are compared as float64, which is exact for the 8/16-bit
+        integer dtypes this is used for; gain and offset must be float32 so
+        the arithmetic matches the NumPy path bit for bit.
+        """
+        height, width = data.shape
+        scaled = np.empty((height, width), dtype=np.float32)
+        nan = np.float32(np.nan)
+
+        for i in prange(height):
+            for j in range(width):
+                raw = data[i, j]
+                value = np.float64(raw)
+                if (
+                    value == nodata
+                    or value == undetect
+                    or (mask_255 and value == 255.0)
+                ):
+                    scaled[i, j] = nan
+                else:
+                    scaled[i, j] = np.float32(raw) * gain + offset
+
+        return scaled
+
+    return _scale_kernel
+
+
 def scale_radar_data(
     data: np.ndarray,
     gain: float,
@@ -86,20 +125,101 @@ def scale_radar_data(
     Returns:
         Scaled data array with special values as NaN
     """
-    # Apply scaling
-    scaled_data = data.astype(np.float32) * gain + offset
-
-    # Handle special values
-    scaled_data[data == nodata] = np.nan
-    scaled_data[data == undetect] = np.nan
+    # Single fused pass when numba is installed (performance extra)
+    if (
+        data.ndim == 2
+        and data.dtype.kind in "ui"
+        and data.dtype.itemsize <= 2
+        and data.dtype.isnative
+    ):
+        kernel = _get_scale_kernel()
+        if kernel is not None:
+            return kernel(
+                data,
+                np.float32(gain),
+                np.float32(offset),
+                float(nodata),
+                float(undetect),
+                handle_uint8 and data.dtype == np.uint8,
+            )
+
+    # Apply scaling: the multiply casts to float32 and allocates the only copy
+    scaled_data = np.multiply(data, np.float32(gain), dtype=np.float32)
+    scaled_data += np.float32(offset)
+
+    # Handle special values with one combined mask
+    invalid = data == nodata
+    invalid |= data == undetect
 
     # Handle uint8 255 value (common for no-data in some sources)
     if handle_uint8 and data.dtype == np.uint8:
-        scaled_data[data == 255] = np.nan
+        invalid |= data == 255
+
+    np.copyto(scaled_data, np.float32(np.nan), where=invalid)
 
     return scaled_data
 
 
+# Sentinel for NaN in int8-quantized data
+INT8_NODATA = -128
+
+
+def quantize_radar_data(
+    scaled_data: np.ndarray,
+    dtype: str,
+    gain: float,
+    offset: float,
+) -> tuple[np.ndarray, dict[str, Any] | None]:
+    """Store scaled radar data in a narrower dtype to save memory.
+
+    "int8" keeps one byte per pixel using the product's own gain as the
+    step, so 8-bit ODIM products (e.g. SHMU uint8 dBZ) keep every level;
+    NaN is stored as INT8_NODATA. "float16" halves the size and keeps NaN.
+
+    Args:
+        scaled_data: Float array from scale_radar_data
+        dtype: Target dtype ("float32", "float16" or "int8")
+        gain: Scaling gain the data was decoded with
+        offset: Scaling offset the data was decoded with
+
+    Returns:
+        Tuple of (array, quantization) where quantization holds gain,
+        offset and nodata for int8 output, otherwise None
+    """
+    if dtype == "float32":
+        return scaled_data.astype(np.float32, copy=False), None
+    if dtype == "float16":
+        return scaled_data.astype(np.float16), None
+    if dtype != "int8":
+        raise ValueError(f"Unsupported dtype: {dtype}")
+
+    # Centre the code range so raw codes 1..255 map onto -127..127
+    q_gain = float(gain)
+    q_offset = float(offset) + 128 * q_gain
+
+    codes = np.subtract(scaled_data, np.float32(q_offset), dtype=np.float32)
+    codes /= np.float32(q_gain)
+    np.rint(codes, out=codes)
+    np.clip(codes, INT8_NODATA + 1, 127, out=codes)
+    np.copyto(codes, np.float32(INT8_NODATA), where=np.isnan(codes))
+
+    quantization = {"gain": q_gain, "offset": q_offset, "nodata": INT8_NODATA}
+    return codes.astype(np.int8), quantization
+
+
+def dequantize_radar_data(
+    data: np.ndarray, quantization: dict[str, Any] | None
+) -> np.ndarray:
+    """Restore float32 values (NaN for nodata) from quantize_radar_data output."""
+    if quantization is None:
+        return data.astype(np.float32, copy=False)
+
+    values = np.multiply(data, np.float32(quantization["gain"]), dtype=np.float32)
+    values += np.float32(quantization["offset"])
+    values[data == quantization["nodata"]] = np.nan
+    return values
+
+
 def extract_corner_coordinates(
     where_attrs: dict,
     fallback_extent: dict[str, float] | None = None,
@@ -137,6 +257,28 @@ def extract_corner_coordinates(
     raise ValueError("Could not extract coordinates and no fallback provided")
 
 
+@lru_cache(maxsize=8)
+def _make_coordinates(
+    rows: int,
+    cols: int,
+    west: float,
+    east: float,
+    south: float,
+    north: float,
+    flip_lat: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build read-only lon/lat vectors, shared across files on the same grid."""
+    lons = np.linspace(west, east, cols)
+    lats = np.linspace(south, north, rows)
+
+    if flip_lat:
+        lats = np.flip(lats)
+
+    lons.flags.writeable = False
+    lats.flags.writeable = False
+    return lons, lats
+
+
 def create_coordinate_arrays(
     extent: dict[str, float],
     shape: tuple[int, int],
@@ -150,15 +292,19 @@ def create_coordinate_arrays(
         flip_lat: Whether to flip latitude array (north to south)
 
     Returns:
-        Dictionary with 'lons' and 'lats' arrays
+        Dictionary with 'lons' and 'lats' arrays (cached, read-only)
     """
     rows, cols = shape
 
-    lons = np.linspace(extent["west"], extent["east"], cols)
-    lats = np.linspace(extent["south"], extent["north"], rows)
-
-    if flip_lat:
-        lats = np.flip(lats)
+    lons, lats = _make_coordinates(
+        int(rows),
+        int(cols),
+        float(extent["west"]),
+        float(extent["east"]),
+        float(extent["south"]),
+        float(extent["north"]),
+        flip_lat,
+    )
 
     return {"lons": lons, "lats": lats}
 
@@ -7,21 +7,37 @@ across all source classes (DWD, SHMU, CHMI, OMSZ, IMGW).
 """
 
 import os
+import threading
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def default_io_workers(cap: int = 16) -> int:
+    """Worker count for I/O-bound downloads: 4 per CPU, at most ``cap``.
+
+    Threads blocked on sockets release the GIL, so more threads than cores
+    keep the network busy; the cap keeps load on a single host polite.
+    """
+    return min(cap, 4 * (os.cpu_count() or 1))
+
+
 def execute_parallel_downloads(
     tasks: list[tuple],
     download_func: Callable,
     source_name: str,
     max_workers: int = 6,
+    executor: Executor | None = None,
 ) -> list[dict[str, Any]]:
     """Execute downloads in parallel using ThreadPoolExecutor.
 
@@ -30,6 +46,8 @@ def execute_parallel_downloads(
         download_func: Function to call for each download, signature: (timestamp, product) -> dict
         source_name: Name of the source for logging
         max_workers: Maximum concurrent downloads (default: 6)
+        executor: Existing executor to reuse; max_workers is ignored and
+            the executor is left running
 
     Returns:
         List of successful download results
@@ -43,7 +61,8 @@ def execute_parallel_downloads(
 
     downloaded_files = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    pool = nullcontext(executor) if executor else ThreadPoolExecutor(max_workers)
+    with pool as executor:
         # Submit all download tasks
         future_to_task = {
             executor.submit(download_func, timestamp, product): (timestamp, product)
@@ -75,6 +94,101 @@ def execute_parallel_downloads(
     return downloaded_files
 
 
+def find_available_parallel(
+    candidates: list[str],
+    check_func: Callable[[str], bool],
+    count: int,
+    max_workers: int = 8,
+    executor: Executor | None = None,
+) -> list[str]:
+    """Probe candidate timestamps concurrently, keeping candidate order.
+
+    Equivalent to checking candidates one by one and stopping after
+    ``count`` hits, but up to ``max_workers`` probes (blocking HEAD
+    requests) are in flight at once. Probes not yet started when enough
+    hits are found are cancelled.
+
+    Args:
+        candidates: Timestamps to check, in preference order
+        check_func: Availability check, signature: (timestamp) -> bool
+        count: Maximum number of available timestamps to return
+        max_workers: Maximum concurrent probes (default: 8)
+        executor: Existing executor to reuse; it is left running and at
+            most max_workers of its threads probe at once
+
+    Returns:
+        Up to ``count`` available timestamps, in candidate order
+    """
+    if not candidates or count <= 0:
+        return []
+
+    if executor:
+        # A shared pool may be larger than max_workers, so cap probes in flight
+        check_func = _limit_concurrency(check_func, max_workers)
+
+    available = []
+    pool = nullcontext(executor) if executor else ThreadPoolExecutor(max_workers)
+    with pool as executor:
+        futures = [executor.submit(check_func, ts) for ts in candidates]
+        for timestamp, future in zip(candidates, futures):
+            if len(available) >= count:
+                break
+            try:
+                if future.result():
+                    available.append(timestamp)
+            except Exception as e:
+                logger.debug(f"Availability check failed for {timestamp}: {e}")
+        for future in futures:
+            future.cancel()
+
+    return available
+
+
+def _limit_concurrency(
+    func: Callable[[str], bool], limit: int
+) -> Callable[[str], bool]:
+    """Wrap func so that at most ``limit`` calls run at once."""
+    slots = threading.BoundedSemaphore(limit)
+
+    def limited(arg: str) -> bool:
+        with slots:
+            return func(arg)
+
+    return limited
+
+
+def create_http_session(
+    pool_maxsize: int = 16,
+    max_retries: int = 2,
+    verify: bool = True,
+) -> requests.Session:
+    """Create a keep-alive HTTP session for repeated requests to one host.
+
+    Reusing a session lets availability probes and parallel downloads share
+    pooled connections instead of opening a new TCP+TLS connection per
+    request. The pool must be at least as large as the download fan-out
+    (see execute_parallel_downloads).
+
+    Args:
+        pool_maxsize: Maximum pooled connections per host (default: 16)
+        max_retries: Connection-level retries with backoff (default: 2)
+        verify: Whether to verify TLS certificates (default: True)
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=max_retries, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.verify = verify
+    return session
+
+
 class SessionCache:
     """Simple session-level cache for downloaded files.
 
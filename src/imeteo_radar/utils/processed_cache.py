@@ -19,6 +19,8 @@ Storage Format:
 """
 
 import json
+import os
+import threading
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -30,6 +32,9 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Touched in the local cache dir after each cleanup sweep
+CLEANUP_MARKER = ".last_cleanup"
+
 
 def _make_json_serializable(obj):
     """Convert numpy types to native Python types for JSON serialization.
@@ -52,6 +57,38 @@ def _make_json_serializable(obj):
     return obj
 
 
+def _json_default(obj):
+    """json.dumps fallback for numpy scalars and arrays left in metadata."""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _parse_cache_filename(filename: str, source: str) -> tuple[str, str] | None:
+    """Extract (product, timestamp) from a ``{source}_{product}_{ts}.npz`` name.
+
+    Cache files always carry a 12-char timestamp (see ``_get_local_path``), so
+    the fields are recovered by fixed-width slicing off the known source
+    prefix. Names of any other shape fall back to splitting on underscores.
+
+    Returns:
+        Tuple of (product, timestamp), or None if the name is not a cache file
+    """
+    prefix_len = len(source) + 1
+    if (
+        len(filename) > prefix_len + 17
+        and filename[-17] == "_"
+        and filename.startswith(source)
+        and filename[prefix_len - 1] == "_"
+    ):
+        return filename[prefix_len:-17], filename[-16:-4]
+
+    parts = filename[:-4].split("_")
+    if len(parts) >= 3:
+        return parts[1], parts[2]
+    return None
+
+
 class ProcessedDataCache:
     """Dual-layer cache for processed radar data arrays.
 
@@ -91,6 +128,10 @@ class ProcessedDataCache:
         self.s3_enabled = s3_enabled
         self._uploader = None
         self._s3_initialized = False
+        # Guards lazy S3 setup when the cache is shared by worker threads
+        self._s3_init_lock = threading.Lock()
+        # Per-directory listing of NPZ names, keyed by path -> (mtime_ns, names)
+        self._dir_cache: dict[str, tuple[int, list[str]]] = {}
 
         # Create local cache directory
         self.local_dir.mkdir(parents=True, exist_ok=True)
@@ -106,17 +147,22 @@ class ProcessedDataCache:
             return None
 
         if not self._s3_initialized:
-            self._s3_initialized = True
-            try:
-                from .spaces_uploader import SpacesUploader, is_spaces_configured
-
-                if is_spaces_configured():
-                    self._uploader = SpacesUploader()
-                    logger.debug("S3 cache layer enabled")
-                else:
-                    logger.debug("S3 not configured, using local cache only")
-            except Exception as e:
-                logger.warning(f"Failed to initialize S3 for cache: {e}")
+            with self._s3_init_lock:
+                if not self._s3_initialized:
+                    try:
+                        from .spaces_uploader import (
+                            SpacesUploader,
+                            is_spaces_configured,
+                        )
+
+                        if is_spaces_configured():
+                            self._uploader = SpacesUploader()
+                            logger.debug("S3 cache layer enabled")
+                        else:
+                            logger.debug("S3 not configured, using local cache only")
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize S3 for cache: {e}")
+                    self._s3_initialized = True
 
         return self._uploader
 
@@ -128,6 +174,29 @@ class ProcessedDataCache:
         ts_normalized = timestamp[:12]
         return source_dir / f"{source}_{product}_{ts_normalized}.npz"
 
+    def _list_npz_files(self, source_dir: Path) -> list[Path]:
+        """List NPZ cache files in a source directory, sorted by name.
+
+        The listing is cached per directory and reused while the directory's
+        mtime is unchanged (adding or removing entries bumps it), so repeated
+        lookups cost a single stat instead of a full directory scan.
+        """
+        key = str(source_dir)
+        try:
+            mtime_ns = source_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._dir_cache.pop(key, None)
+            return []
+
+        cached = self._dir_cache.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            with os.scandir(source_dir) as entries:
+                names = sorted(e.name for e in entries if e.name.endswith(".npz"))
+            cached = (mtime_ns, names)
+            self._dir_cache[key] = cached
+
+        return [source_dir / name for name in cached[1]]
+
     def _get_metadata_path(self, npz_path: Path) -> Path:
         """Get metadata JSON path for a given NPZ file."""
         return npz_path.with_suffix(".json")
@@ -302,8 +371,10 @@ class ProcessedDataCache:
             "cached_at_iso": datetime.now(UTC).isoformat(),
         }
 
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        # Compact encoding: sidecars are read programmatically, not by humans
+        metadata_path.write_text(
+            json.dumps(metadata, separators=(",", ":"), default=_json_default)
+        )
 
         logger.info(
             f"Cached: {local_path.name}",
@@ -404,17 +475,14 @@ class ProcessedDataCache:
         # Get from local cache
         source_dir = self.local_dir / source
         if source_dir.exists():
-            for npz_file in source_dir.glob("*.npz"):
+            for npz_file in self._list_npz_files(source_dir):
                 metadata_path = self._get_metadata_path(npz_file)
                 if self._is_expired(metadata_path):
                     continue
 
-                # Parse filename: {source}_{product}_{timestamp}.npz
-                parts = npz_file.stem.split("_")
-                if len(parts) >= 3:
-                    file_product = parts[1]
-                    file_timestamp = parts[2]
-
+                parsed = _parse_cache_filename(npz_file.name, source)
+                if parsed is not None:
+                    file_product, file_timestamp = parsed
                     if product is None or file_product == product:
                         timestamps.add(file_timestamp)
 
@@ -443,13 +511,11 @@ class ProcessedDataCache:
                     if not key.endswith(".npz"):
                         continue
 
-                    # Parse key: iradar/cache/{source}/{source}_{product}_{timestamp}.npz
-                    filename = key.split("/")[-1]
-                    parts = filename.replace(".npz", "").split("_")
-                    if len(parts) >= 3:
-                        file_product = parts[1]
-                        file_timestamp = parts[2]
-
+                    # Key: iradar-data/data/{source}/{source}_{product}_{timestamp}.npz
+                    filename = key[len(prefix) :]
+                    parsed = _parse_cache_filename(filename, source)
+                    if parsed is not None:
+                        file_product, file_timestamp = parsed
                         if product is None or file_product == product:
                             timestamps.add(file_timestamp)
 
@@ -458,15 +524,33 @@ class ProcessedDataCache:
 
         return timestamps
 
-    def cleanup_expired(self) -> int:
+    def cleanup_expired(self, min_interval: float = 0) -> int:
         """Remove expired cache entries from local cache and S3.
 
+        Args:
+            min_interval: Skip the sweep if the last one (by any process)
+                finished less than this many seconds ago (default: always run)
+
         Returns:
             Number of entries removed (local + S3)
         """
+        marker = self.local_dir / CLEANUP_MARKER
+        if min_interval > 0:
+            try:
+                if marker.stat().st_mtime > time.time() - min_interval:
+                    logger.debug("Cache cleanup skipped: last sweep is recent")
+                    return 0
+            except OSError:
+                pass
+
         local_removed = self._cleanup_local_expired()
         s3_removed = self._cleanup_s3_expired()
 
+        try:
+            marker.touch()
+        except OSError as e:
+            logger.debug(f"Failed to write cleanup marker: {e}")
+
         total_removed = local_removed + s3_removed
         if total_removed > 0:
             logger.info(
@@ -486,7 +570,7 @@ class ProcessedDataCache:
             if not source_dir.is_dir():
                 continue
 
-            for npz_file in source_dir.glob("*.npz"):
+            for npz_file in self._list_npz_files(source_dir):
                 metadata_path = self._get_metadata_path(npz_file)
 
                 if self._is_expired(metadata_path):
@@ -607,7 +691,7 @@ class ProcessedDataCache:
             source_entries = 0
             source_size = 0
 
-            for npz_file in source_dir.glob("*.npz"):
+            for npz_file in self._list_npz_files(source_dir):
                 metadata_path = self._get_metadata_path(npz_file)
                 if not self._is_expired(metadata_path):
                     source_entries += 1
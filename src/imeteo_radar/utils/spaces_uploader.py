@@ -16,6 +16,7 @@ If credentials are not available, upload is disabled and processing continues lo
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from ..core.logging import get_logger
@@ -154,12 +155,6 @@ class SpacesUploader:
         Returns:
             str: Public URL of uploaded file, or None if upload failed
         """
-        local_path = Path(local_path)
-
-        if not local_path.exists():
-            logger.error(f"Local file not found: {local_path}")
-            return None
-
         # Auto-detect content type if not provided
         if content_type is None:
             content_type = self._detect_content_type(local_path)
@@ -171,9 +166,9 @@ class SpacesUploader:
         s3_key = f"iradar/{folder}/{filename}"
 
         try:
-            # Upload file with public-read ACL
+            # Upload file with public-read ACL (boto3 raises if the file is missing)
             self.s3_client.upload_file(
-                str(local_path),
+                os.fspath(local_path),
                 self.bucket,
                 s3_key,
                 ExtraArgs={"ACL": "public-read", "ContentType": content_type},
@@ -188,6 +183,9 @@ class SpacesUploader:
             )
             return public_url
 
+        except FileNotFoundError:
+            logger.error(f"Local file not found: {local_path}")
+            return None
         except ClientError as e:
             logger.error(f"Failed to upload to Spaces: {e}")
             return None
@@ -340,6 +338,52 @@ class SpacesUploader:
             logger.error(f"Failed to delete from Spaces: {e}")
             return False
 
+    def delete_files(self, source: str, filenames: list[str]) -> int:
+        """
+        Delete multiple files from DigitalOcean Spaces in bulk
+
+        Uses DeleteObjects, which accepts up to 1000 keys per request, so N
+        deletions cost ceil(N / 1000) round-trips instead of N.
+
+        Args:
+            source: Source name ('dwd' for germany, 'shmu' for slovakia)
+            filenames: Filenames to delete
+
+        Returns:
+            int: Number of files reported deleted by Spaces
+        """
+        folder = _get_folder_for_source(source)
+        s3_keys = [f"iradar/{folder}/{filename}" for filename in filenames]
+        deleted = 0
+
+        for i in range(0, len(s3_keys), 1000):
+            batch = s3_keys[i : i + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        "Quiet": False,
+                    },
+                )
+            except ClientError as e:
+                logger.error(f"Failed to delete batch from Spaces: {e}")
+                continue
+
+            deleted += len(response.get("Deleted", []))
+            for error in response.get("Errors", []):
+                logger.warning(
+                    f"Failed to delete {error.get('Key')} from Spaces: "
+                    f"{error.get('Message')}"
+                )
+
+        if deleted > 0:
+            logger.info(
+                f"Deleted {deleted} files from Spaces: iradar/{folder}/",
+                extra={"source": source, "operation": "delete", "count": deleted},
+            )
+        return deleted
+
     def file_exists(self, source: str, filename: str) -> bool:
         """
         Check if a file exists in DigitalOcean Spaces
@@ -371,6 +415,51 @@ class SpacesUploader:
             logger.warning(f"Unexpected error checking file existence: {e}")
             return False
 
+    def existing_files(self, source: str, filenames: list[str]) -> set[str]:
+        """
+        Find which of many files exist in DigitalOcean Spaces
+
+        Lists keys under the filenames' longest common prefix (paginated),
+        so checking N files costs a few LIST requests instead of N HEADs.
+        The listing starts just before the smallest filename and stops past
+        the largest, so a short common prefix does not scan unrelated keys.
+
+        Args:
+            source: Source name ('dwd' for germany, 'shmu' for slovakia, 'composite')
+            filenames: Filenames to check (e.g., ['1234567890.png', ...])
+
+        Returns:
+            set: The subset of filenames present in Spaces
+
+        Raises:
+            ClientError: If listing fails (callers decide how to degrade)
+        """
+        wanted = set(filenames)
+        if not wanted:
+            return set()
+
+        folder = _get_folder_for_source(source)
+        first, last = min(wanted), max(wanted)
+        s3_prefix = f"iradar/{folder}/{os.path.commonprefix([first, last])}"
+        # Keys are listed in order; first[:-1] sorts just before first
+        start_after = f"iradar/{folder}/{first[:-1]}"
+        stop_after = f"iradar/{folder}/{last}"
+
+        found = set()
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket, Prefix=s3_prefix, StartAfter=start_after
+        )
+        for page in pages:
+            for obj in page.get("Contents", []):
+                key = obj["Key"]
+                if key > stop_after:
+                    return found
+                name = key.rsplit("/", 1)[-1]
+                if name in wanted:
+                    found.add(name)
+        return found
+
     def list_files(self, source: str, prefix: str = "") -> list:
         """
         List files in DigitalOcean Spaces for a given source
@@ -403,10 +492,15 @@ class SpacesUploader:
             return []
 
 
+@lru_cache(maxsize=1)
 def is_spaces_configured() -> bool:
     """
     Check if DigitalOcean Spaces is configured via environment variables
 
+    The result is cached for the life of the process since credentials do
+    not change mid-run. Callers that modify the environment afterwards must
+    call ``is_spaces_configured.cache_clear()``.
+
     Returns:
         bool: True if all required env vars are set, False otherwise
     """
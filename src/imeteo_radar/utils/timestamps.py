@@ -6,9 +6,14 @@ Centralizes all timestamp parsing, normalization, and generation logic
 that was previously duplicated across source classes.
 """
 
-from datetime import datetime, timedelta
+import re
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
-import pytz
+import numpy as np
 
 from ..core.logging import get_logger
 
@@ -31,9 +36,24 @@ class TimestampFormat:
     TIME_ONLY = "%H%M%S"
 
 
+# Leading YYYYMMDDHHMM[SS] or YYYYMMDD_HHMM (FULL / SHORT / UNDERSCORE)
+_TIMESTAMP_RE = re.compile(r"(\d{12})(\d{2})?|(\d{8})_(\d{4})")
+
+# %-format equivalents of the TimestampFormat constants, applied to the first
+# N fields of a struct_time; skips strftime's per-call format interpretation
+_FAST_FORMATS: dict[str, tuple[str, int]] = {
+    TimestampFormat.FULL: ("%04d%02d%02d%02d%02d%02d", 6),
+    TimestampFormat.SHORT: ("%04d%02d%02d%02d%02d", 5),
+    TimestampFormat.UNDERSCORE: ("%04d%02d%02d_%02d%02d", 5),
+}
+
+
 def parse_timestamp(ts_str: str, fmt: str | None = None) -> datetime | None:
     """Parse a timestamp string to datetime.
 
+    Results are memoized: the same timestamp strings recur across cache
+    lookups, range filtering and composite matching.
+
     Args:
         ts_str: Timestamp string to parse
         fmt: Optional format string. If None, auto-detects format.
@@ -41,27 +61,130 @@ def parse_timestamp(ts_str: str, fmt: str | None = None) -> datetime | None:
     Returns:
         Parsed datetime or None if parsing fails
     """
+    return _parse_timestamp_cached(ts_str, fmt)
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp_cached(ts_str: str, fmt: str | None) -> datetime | None:
+    """Uncached body of parse_timestamp (datetimes are immutable, safe to share)."""
     if fmt:
+        # Canonical strings in the standard formats skip strptime entirely;
+        # anything else keeps strptime's exact semantics
+        digits = _canonical_digits(ts_str, fmt)
+        if digits is not None:
+            return _fast_parse_numeric(digits)
         try:
             return datetime.strptime(ts_str, fmt)
         except ValueError:
             return None
 
-    # Auto-detect format based on string pattern
-    formats_to_try = [
-        (TimestampFormat.FULL, 14),  # YYYYMMDDHHMMSS
-        (TimestampFormat.SHORT, 12),  # YYYYMMDDHHMM
-        (TimestampFormat.UNDERSCORE, 13),  # YYYYMMDD_HHMM
-    ]
+    # Classify the leading timestamp in one regex pass instead of trying
+    # strptime formats in turn and catching ValueError
+    match = _TIMESTAMP_RE.match(ts_str)
+    if match is None:
+        return None
+
+    digits_12, seconds, date_part, time_part = match.groups()
+    if digits_12 is None:
+        # YYYYMMDD_HHMM
+        return _fast_parse_numeric(date_part + time_part)
+
+    if seconds is not None:
+        # YYYYMMDDHHMMSS; invalid seconds fall back to the 12-digit form
+        dt = _fast_parse_numeric(digits_12 + seconds)
+        if dt is not None:
+            return dt
+
+    return _fast_parse_numeric(digits_12)
+
+
+def _canonical_digits(ts_str: str, fmt: str) -> str | None:
+    """Return the bare digits of ts_str if it exactly matches a standard format.
+
+    Only the FULL, SHORT and UNDERSCORE formats are recognized; other formats
+    and non-canonical strings return None.
+    """
+    n = len(ts_str)
+    if fmt == TimestampFormat.UNDERSCORE:
+        if n != 13 or ts_str[8] != "_":
+            return None
+        ts_str = ts_str[:8] + ts_str[9:]
+    elif not (
+        (fmt == TimestampFormat.FULL and n == 14)
+        or (fmt == TimestampFormat.SHORT and n == 12)
+    ):
+        return None
+    return ts_str if ts_str.isascii() and ts_str.isdigit() else None
+
+
+def _fast_parse_numeric(ts: str) -> datetime | None:
+    """Build a datetime from 12 or 14 digits by slicing fixed offsets.
 
-    for fmt, expected_len in formats_to_try:
-        if len(ts_str) >= expected_len:
-            try:
-                return datetime.strptime(ts_str[:expected_len], fmt)
-            except ValueError:
-                continue
+    Returns None for out-of-range fields (e.g. month 13).
+    """
+    try:
+        return datetime(
+            int(ts[0:4]),
+            int(ts[4:6]),
+            int(ts[6:8]),
+            int(ts[8:10]),
+            int(ts[10:12]),
+            int(ts[12:14]) if len(ts) == 14 else 0,
+        )
+    except ValueError:
+        return None
+
+
+def _parse_timestamps_batch(timestamps: list[str]) -> list[datetime | None]:
+    """Parse many timestamps at once, equivalent to parse_timestamp per item.
+
+    Canonical numeric strings (YYYYMMDDHHMM[SS], YYYYMMDD_HHMM) are decoded
+    together as a NumPy digit matrix and validated in one vectorized pass.
+    Anything else, including out-of-range fields, goes through
+    parse_timestamp so the fallback rules stay identical.
+    """
+    results: list[datetime | None] = [None] * len(timestamps)
+    batch_index = []
+    batch = []
+
+    for i, ts in enumerate(timestamps):
+        norm = ts.replace("_", "") if len(ts) == 13 and ts[8] == "_" else ts
+        if len(norm) == 12:
+            norm += "00"
+        if len(norm) == 14 and norm.isascii() and norm.isdigit():
+            batch_index.append(i)
+            batch.append(norm)
+        else:
+            results[i] = parse_timestamp(ts)
+
+    if not batch:
+        return results
+
+    digits = np.frombuffer("".join(batch).encode("ascii"), dtype=np.uint8)
+    digits = digits.reshape(-1, 14).astype(np.int64) - 48
+    # Two-digit fields: century, year, month, day, hour, minute, second
+    fields = digits[:, 0::2] * 10 + digits[:, 1::2]
+    year = fields[:, 0] * 100 + fields[:, 1]
+    month, day, hour, minute, second = fields[:, 2:].T
+
+    valid = (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+
+    month_start = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype(
+        "datetime64[M]"
+    )
+    days_in_month = (
+        (month_start + 1).astype("datetime64[D]") - month_start.astype("datetime64[D]")
+    ).astype(np.int64)
+    valid &= day <= days_in_month
 
-    return None
+    offsets = (day - 1) * 86400 + hour * 3600 + minute * 60 + second
+    values = (month_start.astype("datetime64[s]") + offsets).tolist()
+
+    for i, value, ok in zip(batch_index, values, valid.tolist()):
+        results[i] = value if ok else parse_timestamp(timestamps[i])
+
+    return results
 
 
 def normalize_timestamp(timestamp: str, target_length: int = 14) -> str:
@@ -75,15 +198,19 @@ def normalize_timestamp(timestamp: str, target_length: int = 14) -> str:
         Normalized timestamp string
     """
     # Remove underscores if present (DWD/OMSZ format)
-    ts = timestamp.replace("_", "")
+    ts = timestamp.replace("_", "") if "_" in timestamp else timestamp
+    n = len(ts)
 
     if target_length == 14:
+        # Already normalized: return as-is without re-slicing
+        if n == 14:
+            return ts
         # Pad to 14 characters with "00" for seconds
-        if len(ts) == 12:
+        if n == 12:
             return ts + "00"
         return ts[:14]
     elif target_length == 12:
-        return ts[:12]
+        return ts if n == 12 else ts[:12]
 
     return ts
 
@@ -98,11 +225,11 @@ def round_to_interval(dt: datetime, interval_minutes: int = 5) -> datetime:
     Returns:
         Rounded datetime
     """
-    return dt.replace(
-        minute=(dt.minute // interval_minutes) * interval_minutes,
-        second=0,
-        microsecond=0,
-    )
+    minute = (dt.minute // interval_minutes) * interval_minutes
+    if minute == dt.minute and not dt.second and not dt.microsecond:
+        # Already aligned; datetimes are immutable so no copy is needed
+        return dt
+    return dt.replace(minute=minute, second=0, microsecond=0)
 
 
 def generate_timestamp_candidates(
@@ -124,25 +251,38 @@ def generate_timestamp_candidates(
     Returns:
         List of timestamp strings, newest first
     """
-    timestamps = []
-    current_time = datetime.now(pytz.UTC) - timedelta(minutes=delay_minutes)
-
-    if timezone_offset_hours:
-        current_time = current_time + timedelta(hours=timezone_offset_hours)
+    # Insertion-ordered dict for O(1) dedup that keeps newest-first order
+    timestamps: dict[str, None] = {}
+    # Work in integer epoch seconds: no datetime/timedelta allocations per step
+    current = int(time.time()) - delay_minutes * 60 + timezone_offset_hours * 3600
+    step = interval_minutes * 60
+    fast_format = _FAST_FORMATS.get(format_str)
 
     # Generate candidates going backwards
-    for minutes_back in range(0, count * interval_minutes * 3, interval_minutes):
-        check_time = current_time - timedelta(minutes=minutes_back)
-        check_time = round_to_interval(check_time, interval_minutes)
-        timestamp = check_time.strftime(format_str)
-
-        if timestamp not in timestamps:
-            timestamps.append(timestamp)
+    for k in range(count * 3):
+        check_time = current - k * step
+        # Same rounding as round_to_interval: drop seconds, floor minute-of-hour
+        check_time -= check_time % 60
+        check_time -= (check_time % 3600) // 60 % interval_minutes * 60
+        tm = time.gmtime(check_time)
+        if fast_format:
+            timestamp = fast_format[0] % tm[: fast_format[1]]
+        else:
+            timestamp = time.strftime(format_str, tm)
+
+        timestamps.setdefault(timestamp, None)
 
         if len(timestamps) >= count * 3:
             break
 
-    return timestamps
+    return list(timestamps)
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    """Convert a datetime to naive UTC; naive input is assumed to be UTC."""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(UTC).replace(tzinfo=None)
 
 
 def filter_timestamps_by_range(
@@ -155,27 +295,29 @@ def filter_timestamps_by_range(
 
     Args:
         timestamps: List of timestamp strings
-        start_time: Start of time range (timezone-aware datetime)
-        end_time: End of time range (timezone-aware datetime)
+        start_time: Start of time range (timezone-aware, or naive UTC)
+        end_time: End of time range (timezone-aware, or naive UTC)
         parse_format: Format string for parsing timestamps
 
     Returns:
         Filtered list of timestamps within the range
     """
-    filtered = []
-    for ts in timestamps:
-        dt = parse_timestamp(ts, parse_format)
-        if dt is None:
-            continue
-
-        # Make timezone aware if needed
-        if dt.tzinfo is None:
-            dt = pytz.UTC.localize(dt)
-
-        if start_time <= dt <= end_time:
-            filtered.append(ts)
+    if not timestamps:
+        return []
+
+    # Normalize the bounds to naive UTC once; parsed timestamps are already
+    # naive UTC, so the range check is one vectorized mask with no localize
+    start = np.datetime64(_to_naive_utc(start_time), "us")
+    end = np.datetime64(_to_naive_utc(end_time), "us")
+
+    # Unparseable timestamps become NaT, which fails both comparisons
+    parsed = np.array(
+        [parse_timestamp(ts, parse_format) or "NaT" for ts in timestamps],
+        dtype="datetime64[us]",
+    )
+    mask = (parsed >= start) & (parsed <= end)
 
-    return filtered
+    return [ts for ts, keep in zip(timestamps, mask.tolist()) if keep]
 
 
 def find_common_timestamp(
@@ -193,44 +335,58 @@ def find_common_timestamp(
     Returns:
         (common_timestamp, source_files) or (None, None)
     """
-    # Parse all timestamps to datetime
-    timestamp_datetimes = {}
-    for ts_str in timestamp_groups.keys():
-        dt = parse_timestamp(ts_str)
-        if dt:
-            timestamp_datetimes[ts_str] = dt
-
-    if not timestamp_datetimes:
+    # Parse all timestamps, remembering insertion order for tie-breaking
+    keys = list(timestamp_groups.keys())
+    valid = [
+        (order, ts_str, dt)
+        for order, (ts_str, dt) in enumerate(zip(keys, _parse_timestamps_batch(keys)))
+        if dt
+    ]
+
+    if not valid:
         return None, None
 
-    # Sort by datetime (most recent first)
-    sorted_timestamps = sorted(
-        timestamp_datetimes.keys(),
-        key=lambda x: timestamp_datetimes[x],
-        reverse=True,
+    # Work in integer epoch seconds so the window checks below are plain int
+    # comparisons rather than datetime/timedelta arithmetic
+    seconds = (
+        np.array([dt for _, _, dt in valid], dtype="datetime64[s]")
+        .astype(np.int64)
+        .tolist()
     )
-
-    tolerance = timedelta(minutes=tolerance_minutes)
-
-    # For each timestamp, check if all sources have data within tolerance
-    for candidate_ts in sorted_timestamps:
-        candidate_dt = timestamp_datetimes[candidate_ts]
-        sources_in_window = {}
-
-        # Find sources with data in this time window
-        for ts_str, ts_dt in timestamp_datetimes.items():
-            if abs(ts_dt - candidate_dt) <= tolerance:
-                for source_name, file_info in timestamp_groups[ts_str].items():
-                    if source_name not in sources_in_window:
-                        sources_in_window[source_name] = (ts_str, file_info, ts_dt)
-                    else:
-                        # Keep the closer timestamp
-                        _, _, existing_dt = sources_in_window[source_name]
-                        if abs(ts_dt - candidate_dt) < abs(existing_dt - candidate_dt):
-                            sources_in_window[source_name] = (ts_str, file_info, ts_dt)
+    parsed = [(sec, -order, ts_str) for sec, (order, ts_str, _) in zip(seconds, valid)]
+
+    # Ascending by time; equal times keep insertion order when the list is
+    # walked newest-first below
+    parsed.sort()
+    times = [sec for sec, _, _ in parsed]
+
+    tolerance = tolerance_minutes * 60
+
+    # Walk candidates newest first with a sliding [t - tol, t + tol] window.
+    # Both window edges only move left, so the scan is linear overall.
+    left = right = len(parsed)
+    sources_in_window: dict[str, tuple] = {}
+    for i in range(len(parsed) - 1, -1, -1):
+        candidate_time, _, candidate_ts = parsed[i]
+        while right > 0 and times[right - 1] > candidate_time + tolerance:
+            right -= 1
+        while left > 0 and times[left - 1] >= candidate_time - tolerance:
+            left -= 1
+
+        sources_in_window.clear()
+
+        # Find sources with data in this time window (in insertion order)
+        window = sorted(parsed[left:right], key=lambda entry: -entry[1])
+        for ts_time, _, ts_str in window:
+            distance = abs(ts_time - candidate_time)
+            for source_name, file_info in timestamp_groups[ts_str].items():
+                existing = sources_in_window.get(source_name)
+                # Keep the closer timestamp
+                if existing is None or distance < existing[2]:
+                    sources_in_window[source_name] = (ts_str, file_info, distance)
 
         # Check if all required sources are present
-        if required_sources <= set(sources_in_window.keys()):
+        if required_sources <= sources_in_window.keys():
             logger.debug(f"Found common time window around {candidate_ts}")
             return candidate_ts, {
                 src: info for src, (_, info, _) in sources_in_window.items()
@@ -257,6 +413,20 @@ def extract_timestamp_from_hdf5_attrs(
     date_str = what_attrs.get(date_key, "")
     time_str = what_attrs.get(time_key, "")
 
+    try:
+        return _timestamp_from_date_time(date_str, time_str)
+    except TypeError:
+        # Unhashable attribute values (e.g. arrays) bypass the cache
+        return _timestamp_from_date_time.__wrapped__(date_str, time_str)
+
+
+@lru_cache(maxsize=1024)
+def _timestamp_from_date_time(date_str: str | bytes, time_str: str | bytes) -> str:
+    """Combine HDF5 date/time attributes into a normalized 14-digit timestamp.
+
+    Cached by the raw (date, time) pair since sweeps and products from the
+    same volume share identical nominal timestamps.
+    """
     # Handle bytes
     if isinstance(date_str, bytes):
         date_str = date_str.decode("utf-8")
@@ -268,14 +438,34 @@ def extract_timestamp_from_hdf5_attrs(
     return normalize_timestamp(timestamp, 14)
 
 
-def is_timestamp_in_cache(timestamp: str, cached_set: set[str]) -> bool:
+def build_normalized_cache(cached_timestamps: Iterable[str]) -> frozenset[str]:
+    """Normalize cached timestamps once for repeated is_timestamp_in_cache calls.
+
+    Cache entries are keyed at minute precision, so every entry is reduced to
+    its 12-digit YYYYMMDDHHMM form regardless of underscores or seconds. The
+    "same minute" prefix query then becomes a single hash lookup of the
+    query's 12-digit key.
+
+    Args:
+        cached_timestamps: Cached timestamp strings in any supported format
+
+    Returns:
+        Frozen set of 12-digit timestamps
+    """
+    return frozenset(
+        (ts.replace("_", "") if "_" in ts else ts)[:12] for ts in cached_timestamps
+    )
+
+
+def is_timestamp_in_cache(timestamp: str, cached_set: frozenset[str]) -> bool:
     """Check if a timestamp matches any entry in a cache set.
 
-    Handles different timestamp formats (with/without underscores, 12/14 digits).
+    Handles different timestamp formats (with/without underscores, 12/14 digits)
+    by comparing at minute precision.
 
     Args:
         timestamp: Timestamp string to check
-        cached_set: Set of cached timestamp strings
+        cached_set: Set of 12-digit timestamps from build_normalized_cache()
 
     Returns:
         True if timestamp matches any cached entry
@@ -283,17 +473,8 @@ def is_timestamp_in_cache(timestamp: str, cached_set: set[str]) -> bool:
     if not cached_set:
         return False
 
-    # Clean and normalize to different formats for comparison
-    ts_clean = timestamp.replace("_", "")
-    ts_12 = ts_clean[:12]  # YYYYMMDDHHMM
-    ts_14 = ts_12 + "00" if len(ts_clean) <= 12 else ts_clean[:14]
-
-    return (
-        timestamp in cached_set
-        or ts_clean in cached_set
-        or ts_12 in cached_set
-        or ts_14 in cached_set
-    )
+    ts = timestamp.replace("_", "") if "_" in timestamp else timestamp
+    return ts[:12] in cached_set
 
 
 def timestamp_to_unix(timestamp: str, tz: str = "UTC") -> int:
@@ -311,6 +492,12 @@ def timestamp_to_unix(timestamp: str, tz: str = "UTC") -> int:
         raise ValueError(f"Cannot parse timestamp: {timestamp}")
 
     if dt.tzinfo is None:
-        dt = pytz.timezone(tz).localize(dt)
+        dt = dt.replace(tzinfo=UTC if tz == "UTC" else _get_timezone(tz))
 
     return int(dt.timestamp())
+
+
+@lru_cache(maxsize=32)
+def _get_timezone(name: str) -> ZoneInfo:
+    """Get a timezone by name (cached, zone lookups hit the tz database)."""
+    return ZoneInfo(name)
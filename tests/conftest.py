@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def shmu_cmap():
+    """SHMU colormap built once per session: (cmap, norm, min_dbz, max_dbz).
+
+    Tests must treat the colormap and norm as read-only.
+    """
+    from imeteo_radar.config.shmu_colormap import get_dbz_range, get_shmu_colormap
+
+    return (*get_shmu_colormap(), *get_dbz_range())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the ARSO radar source.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+
+from imeteo_radar.cli_composite import _discard_download
+from imeteo_radar.sources.arso import ARSORadarSource
+
+LAST_MODIFIED = "Tue, 28 Jan 2025 10:05:00 GMT"
+LAST_MODIFIED_UNIX = 1738058700
+
+
+class _Resp:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status=200, headers=None, content=b""):
+        self.status_code = status
+        self.headers = headers or {}
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _StubSession:
+    """Session that returns one canned response and records request headers."""
+
+    def __init__(self, response):
+        self.response = response
+        self.headers = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.headers.append(headers or {})
+        return self.response
+
+
+@pytest.fixture
+def arso_source(tmp_path):
+    """ARSO source downloading into tmp_path."""
+    source = ARSORadarSource()
+    source.session.close()
+    source.download_dir = tmp_path
+    return source
+
+
+class TestConditionalDownload:
+    """Tests for the If-Modified-Since revalidation of the latest frame."""
+
+    def test_first_download_stores_file_with_server_mtime(self, arso_source):
+        """Should do a plain GET and stamp the file with Last-Modified."""
+        arso_source.session = _StubSession(
+            _Resp(headers={"Last-Modified": LAST_MODIFIED}, content=b"SRD-3 frame")
+        )
+
+        result = arso_source._download_single_file("zm")
+
+        assert result["success"] and not result["cached"]
+        assert arso_source.session.headers == [{}]
+        path = arso_source.download_dir / ARSORadarSource.PRODUCTS["zm"]["file"]
+        assert result["path"] == str(path)
+        assert path.read_bytes() == b"SRD-3 frame"
+        assert path.stat().st_mtime == LAST_MODIFIED_UNIX
+
+    def test_not_modified_reuses_local_file(self, arso_source):
+        """Should revalidate with the file's mtime and keep it on a 304."""
+        path = arso_source.download_dir / ARSORadarSource.PRODUCTS["zm"]["file"]
+        path.write_bytes(b"previous frame")
+        os.utime(path, (LAST_MODIFIED_UNIX, LAST_MODIFIED_UNIX))
+        arso_source.session = _StubSession(_Resp(status=304))
+
+        result = arso_source._download_single_file("zm")
+
+        assert result["success"] and result["cached"]
+        assert arso_source.session.headers == [
+            {"If-Modified-Since": formatdate(LAST_MODIFIED_UNIX, usegmt=True)}
+        ]
+        assert result["path"] == str(path)
+        assert path.read_bytes() == b"previous frame"
+
+
+class TestDiscardDownload:
+    """Tests for composite cleanup of processed downloads."""
+
+    def test_keeps_arso_frame_and_deletes_others(self, tmp_path):
+        """Should leave ARSO's revalidated file and delete other downloads."""
+        arso_file = tmp_path / "arso.srd"
+        shmu_file = tmp_path / "shmu.hdf"
+        arso_file.write_bytes(b"")
+        shmu_file.write_bytes(b"")
+
+        _discard_download("arso", str(arso_file))
+        _discard_download("shmu", str(shmu_file))
+
+        assert arso_file.exists()
+        assert not shmu_file.exists()
+
+
+class TestDownloadTimestamps:
+    """Tests for the download_timestamps override."""
+
+    def test_accepts_executor_like_the_base_class(self, arso_source, monkeypatch):
+        """Should accept and ignore a shared executor."""
+        latest = {"timestamp": "20250128100500", "path": "si0-zm.srd"}
+        monkeypatch.setattr(arso_source, "download_latest", lambda **kw: [latest])
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            result = arso_source.download_timestamps(["20250128100500"], executor=pool)
+
+        assert result == [latest]
@@ -6,29 +6,71 @@ Tests the shared CLI helpers used by both fetch and composite commands.
 """
 
 import argparse
+import asyncio
+import threading
+import uuid
 
 import pytest
 from argparse import Namespace
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+from imeteo_radar.utils import processed_cache
 from imeteo_radar.utils.cli_helpers import (
+    _get_or_build_cache,
     add_cache_args,
     add_export_format_args,
+    clear_output_caches,
     init_cache_from_args,
     init_uploader,
     output_exists,
+    output_exists_many,
+    output_exists_many_async,
+    record_outputs,
 )
 
 
+class _RecordingCache:
+    """Stand-in for ProcessedDataCache that records how it was used."""
+
+    instances: list = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.local_dir = kwargs["local_dir"]
+        self.ttl_minutes = kwargs["ttl_minutes"]
+        self.cleanup_calls = 0
+        self.clear_calls = 0
+        type(self).instances.append(self)
+
+    def cleanup_expired(self, min_interval=0):
+        self.cleanup_calls += 1
+        return 0
+
+    def clear(self, source=None):
+        self.clear_calls += 1
+        return 5
+
+
 class TestInitCacheFromArgs:
     """Tests for init_cache_from_args function."""
 
+    @pytest.fixture(autouse=True)
+    def recording_cache(self, monkeypatch):
+        """Swap in _RecordingCache and drop caches memoized by earlier tests."""
+        # init_cache_from_args imports the class from this module at call time
+        monkeypatch.setattr(processed_cache, "ProcessedDataCache", _RecordingCache)
+        _RecordingCache.instances.clear()
+        _get_or_build_cache.cache_clear()
+        yield
+        _get_or_build_cache.cache_clear()
+
     def test_returns_none_when_no_cache_flag_set(self):
         """Should return None when --no-cache is set."""
         args = Namespace(no_cache=True)
         result = init_cache_from_args(args, upload_enabled=True)
         assert result is None
+        assert _RecordingCache.instances == []
 
     def test_initializes_cache_with_defaults(self):
         """Should initialize cache with default settings."""
@@ -39,19 +81,28 @@ class TestInitCacheFromArgs:
             no_cache_upload=False,
             clear_cache=False,
         )
-        with patch("imeteo_radar.utils.processed_cache.ProcessedDataCache") as mock_cache_class:
-            mock_cache = MagicMock()
-            mock_cache_class.return_value = mock_cache
 
-            result = init_cache_from_args(args, upload_enabled=True)
+        result = init_cache_from_args(args, upload_enabled=True)
 
-            mock_cache_class.assert_called_once_with(
-                local_dir=Path("/tmp/test-cache"),
-                ttl_minutes=30,
-                s3_enabled=True,
-            )
-            mock_cache.cleanup_expired.assert_called_once()
-            assert result == mock_cache
+        assert _RecordingCache.instances == [result]
+        assert result.kwargs == {
+            "local_dir": Path("/tmp/test-cache"),
+            "ttl_minutes": 30,
+            "s3_enabled": True,
+        }
+        assert result.cleanup_calls == 1
+        assert result.clear_calls == 0
+
+    def test_reuses_cache_for_same_settings(self):
+        """Should build one cache per (dir, ttl, s3) configuration."""
+        args = Namespace(no_cache=False, cache_dir=Path("/tmp/test-cache"))
+
+        first = init_cache_from_args(args, upload_enabled=True)
+        second = init_cache_from_args(args, upload_enabled=True)
+        init_cache_from_args(args, upload_enabled=False)
+
+        assert first is second
+        assert len(_RecordingCache.instances) == 2
 
     def test_disables_s3_when_upload_disabled(self):
         """Should disable S3 when upload_enabled is False."""
@@ -62,17 +113,14 @@ class TestInitCacheFromArgs:
             no_cache_upload=False,
             clear_cache=False,
         )
-        with patch("imeteo_radar.utils.processed_cache.ProcessedDataCache") as mock_cache_class:
-            mock_cache = MagicMock()
-            mock_cache_class.return_value = mock_cache
 
-            init_cache_from_args(args, upload_enabled=False)
+        result = init_cache_from_args(args, upload_enabled=False)
 
-            mock_cache_class.assert_called_once_with(
-                local_dir=Path("/tmp/test-cache"),
-                ttl_minutes=60,
-                s3_enabled=False,
-            )
+        assert result.kwargs == {
+            "local_dir": Path("/tmp/test-cache"),
+            "ttl_minutes": 60,
+            "s3_enabled": False,
+        }
 
     def test_disables_s3_when_no_cache_upload_flag_set(self):
         """Should disable S3 when --no-cache-upload is set."""
@@ -83,17 +131,14 @@ class TestInitCacheFromArgs:
             no_cache_upload=True,
             clear_cache=False,
         )
-        with patch("imeteo_radar.utils.processed_cache.ProcessedDataCache") as mock_cache_class:
-            mock_cache = MagicMock()
-            mock_cache_class.return_value = mock_cache
 
-            init_cache_from_args(args, upload_enabled=True)
+        result = init_cache_from_args(args, upload_enabled=True)
 
-            mock_cache_class.assert_called_once_with(
-                local_dir=Path("/tmp/test-cache"),
-                ttl_minutes=60,
-                s3_enabled=False,
-            )
+        assert result.kwargs == {
+            "local_dir": Path("/tmp/test-cache"),
+            "ttl_minutes": 60,
+            "s3_enabled": False,
+        }
 
     def test_clears_cache_when_clear_cache_flag_set(self):
         """Should clear cache when --clear-cache is set."""
@@ -104,104 +149,216 @@ class TestInitCacheFromArgs:
             no_cache_upload=False,
             clear_cache=True,
         )
-        with patch("imeteo_radar.utils.processed_cache.ProcessedDataCache") as mock_cache_class:
-            mock_cache = MagicMock()
-            mock_cache.clear.return_value = 5
-            mock_cache_class.return_value = mock_cache
 
-            init_cache_from_args(args, upload_enabled=True)
+        result = init_cache_from_args(args, upload_enabled=True)
 
-            mock_cache.clear.assert_called_once()
+        assert result.clear_calls == 1
 
     def test_uses_default_values_when_args_missing(self):
         """Should use default values when args attributes are missing."""
         args = Namespace(no_cache=False)  # Minimal args
-        with patch("imeteo_radar.utils.processed_cache.ProcessedDataCache") as mock_cache_class:
-            mock_cache = MagicMock()
-            mock_cache_class.return_value = mock_cache
 
-            init_cache_from_args(args, upload_enabled=True)
+        result = init_cache_from_args(args, upload_enabled=True)
 
-            mock_cache_class.assert_called_once_with(
-                local_dir=Path("/tmp/iradar-data/data"),
-                ttl_minutes=60,
-                s3_enabled=True,
-            )
+        assert result.kwargs == {
+            "local_dir": Path("/tmp/iradar-data/data"),
+            "ttl_minutes": 60,
+            "s3_enabled": True,
+        }
 
 
 class TestOutputExists:
     """Tests for output_exists function."""
 
-    def test_returns_true_when_local_file_exists(self, tmp_path):
-        """Should return True when local file exists."""
-        output_path = tmp_path / "test.png"
-        output_path.touch()
+    @pytest.fixture(scope="module")
+    def shared_dir(self, tmp_path_factory):
+        """One output directory for all cases; files get unique names."""
+        return tmp_path_factory.mktemp("outputs")
+
+    @pytest.fixture(autouse=True)
+    def fresh_exists_cache(self):
+        """Drop existence results remembered by earlier tests."""
+        clear_output_caches()
+        yield
+        clear_output_caches()
+
+    @pytest.mark.parametrize(
+        "source, create_local, s3_result, expected, expect_s3_check",
+        [
+            # Local file exists, no uploader
+            ("dwd", True, None, True, False),
+            # Local file missing, no uploader
+            ("dwd", False, None, False, False),
+            # Local missing, found in S3
+            ("dwd", False, True, True, True),
+            # Missing from both local and S3
+            ("dwd", False, False, False, True),
+            # S3 check fails: treated as missing, does not raise
+            ("dwd", False, Exception("S3 error"), False, True),
+            # Local file exists: S3 is not asked
+            ("dwd", True, True, True, False),
+            # Composite source name is passed through to S3
+            ("composite", False, True, True, True),
+        ],
+        ids=[
+            "local-exists",
+            "local-missing-no-uploader",
+            "found-in-s3",
+            "missing-everywhere",
+            "s3-check-fails",
+            "skips-s3-when-local-exists",
+            "composite-source",
+        ],
+    )
+    def test_checks_local_then_s3(
+        self, shared_dir, source, create_local, s3_result, expected, expect_s3_check
+    ):
+        """Should check the local file first and fall back to S3."""
+        filename = f"{uuid.uuid4().hex}.png"
+        output_path = shared_dir / filename
+        if create_local:
+            output_path.touch()
+
+        uploader = None
+        if s3_result is not None:
+            uploader = Mock()
+            if isinstance(s3_result, Exception):
+                uploader.file_exists.side_effect = s3_result
+            else:
+                uploader.file_exists.return_value = s3_result
+
+        result = output_exists(output_path, source, filename, uploader)
+
+        assert result is expected
+        if uploader is not None:
+            if expect_s3_check:
+                uploader.file_exists.assert_called_once_with(source, filename)
+            else:
+                uploader.file_exists.assert_not_called()
+
+    def test_returns_false_when_path_is_directory(self, shared_dir):
+        """Should not treat a directory at the output path as an output."""
+        filename = f"{uuid.uuid4().hex}.png"
+        (shared_dir / filename).mkdir()
+
+        assert output_exists(shared_dir / filename, "dwd", filename, None) is False
+
+    def test_output_exists_caches_negative_result(self, tmp_path):
+        """Should ask S3 once for repeated checks of the same missing file."""
+        mock_uploader = Mock()
+        mock_uploader.file_exists.return_value = False
+
+        for _ in range(2):
+            assert not output_exists(
+                tmp_path / "missing.png", "dwd", "missing.png", mock_uploader
+            )
+
+        mock_uploader.file_exists.assert_called_once_with("dwd", "missing.png")
 
-        result = output_exists(output_path, "dwd", "test.png", None)
+    def test_scans_directory_once_per_run(self, tmp_path):
+        """Should list a directory once until the cache is cleared."""
+        (tmp_path / "a.png").touch()
 
-        assert result is True
+        assert output_exists(tmp_path / "a.png", "dwd", "a.png", None)
+        (tmp_path / "b.png").touch()
+        assert not output_exists(tmp_path / "b.png", "dwd", "b.png", None)
 
-    def test_returns_false_when_local_missing_and_no_uploader(self, tmp_path):
-        """Should return False when local file missing and no uploader."""
-        output_path = tmp_path / "missing.png"
+        clear_output_caches()
+        assert output_exists(tmp_path / "b.png", "dwd", "b.png", None)
 
-        result = output_exists(output_path, "dwd", "missing.png", None)
+    def test_recorded_outputs_count_as_existing(self, tmp_path):
+        """Should see files written during the run once they are recorded."""
+        assert not output_exists(tmp_path / "a.png", "dwd", "a.png", None)
+        (tmp_path / "a.png").touch()
+        (tmp_path / "a.avif").touch()
 
-        assert result is False
+        record_outputs([tmp_path / "a.png", tmp_path / "a.avif"])
 
-    def test_checks_s3_when_local_missing(self, tmp_path):
-        """Should check S3 when local file missing."""
-        output_path = tmp_path / "missing.png"
+        assert output_exists(tmp_path / "a.png", "dwd", "a.png", None)
+        found = output_exists_many([tmp_path / "a.avif"], "dwd", ["a.avif"], None)
+        assert found == [True]
+
+    def test_output_exists_uses_prefetched_set(self, tmp_path):
+        """Should answer from a prefetched S3 listing without calling S3."""
         mock_uploader = Mock()
-        mock_uploader.file_exists.return_value = True
 
-        result = output_exists(output_path, "dwd", "missing.png", mock_uploader)
+        assert output_exists(
+            tmp_path / "a.png", "dwd", "a.png", mock_uploader, frozenset({"a.png"})
+        )
+        assert not output_exists(
+            tmp_path / "b.png", "dwd", "b.png", mock_uploader, frozenset({"a.png"})
+        )
+        mock_uploader.file_exists.assert_not_called()
 
-        assert result is True
-        mock_uploader.file_exists.assert_called_once_with("dwd", "missing.png")
 
-    def test_returns_false_when_both_local_and_s3_missing(self, tmp_path):
-        """Should return False when file missing from both local and S3."""
-        output_path = tmp_path / "missing.png"
+class TestOutputExistsMany:
+    """Tests for output_exists_many function."""
+
+    def test_lists_s3_once_for_local_misses(self, tmp_path):
+        """Should check local misses with one S3 listing, keeping order."""
+        (tmp_path / "a.png").touch()
+        names = ["a.png", "b.png", "c.png"]
         mock_uploader = Mock()
-        mock_uploader.file_exists.return_value = False
+        mock_uploader.existing_files.return_value = {"c.png"}
 
-        result = output_exists(output_path, "dwd", "missing.png", mock_uploader)
+        result = output_exists_many(
+            [tmp_path / name for name in names], "dwd", names, mock_uploader
+        )
 
-        assert result is False
-        mock_uploader.file_exists.assert_called_once_with("dwd", "missing.png")
+        assert result == [True, False, True]
+        mock_uploader.existing_files.assert_called_once_with("dwd", ["b.png", "c.png"])
+        mock_uploader.file_exists.assert_not_called()
 
-    def test_returns_false_when_s3_check_fails(self, tmp_path):
-        """Should return False and not raise when S3 check fails."""
-        output_path = tmp_path / "missing.png"
-        mock_uploader = Mock()
-        mock_uploader.file_exists.side_effect = Exception("S3 error")
+    def test_missing_directory_counts_as_missing(self, tmp_path):
+        """Should report outputs in a nonexistent directory as missing."""
+        (tmp_path / "a.png").touch()
+        paths = [Path("/nonexistent/xyz/a.png"), tmp_path / "a.png"]
 
-        result = output_exists(output_path, "dwd", "missing.png", mock_uploader)
+        result = output_exists_many(paths, "dwd", ["a.png", "a.png"], None)
 
-        assert result is False
+        assert result == [False, True]
 
-    def test_skips_s3_check_when_local_exists(self, tmp_path):
-        """Should not check S3 when local file exists."""
-        output_path = tmp_path / "test.png"
-        output_path.touch()
+    def test_ignores_s3_failure_and_output_named_directories(self, tmp_path):
+        """Should treat S3 errors and a directory at an output path as missing."""
+        (tmp_path / "1.png").mkdir()
         mock_uploader = Mock()
+        mock_uploader.existing_files.side_effect = Exception("S3 error")
 
-        result = output_exists(output_path, "dwd", "test.png", mock_uploader)
+        result = output_exists_many(
+            [tmp_path / "1.png"], "composite", ["1.png"], mock_uploader
+        )
 
-        assert result is True
-        mock_uploader.file_exists.assert_not_called()
+        assert result == [False]
+
+
+class TestOutputExistsAsync:
+    """Tests for output_exists_many_async function."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_exists_cache(self):
+        """Drop existence results remembered by earlier tests."""
+        clear_output_caches()
+        yield
+        clear_output_caches()
+
+    def test_checks_s3_concurrently(self, tmp_path):
+        """Should have several S3 checks in flight at once, keeping order."""
+        names = [f"{i}.png" for i in range(8)]
+        # Each check waits for a second one, so serial checks would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def file_exists(source, filename):
+            barrier.wait()
+            return int(filename[0]) % 2 == 0
 
-    def test_handles_composite_source(self, tmp_path):
-        """Should work with composite source name."""
-        output_path = tmp_path / "1738123400.png"
         mock_uploader = Mock()
-        mock_uploader.file_exists.return_value = True
+        mock_uploader.file_exists.side_effect = file_exists
+        items = [(tmp_path / name, "dwd", name) for name in names]
 
-        result = output_exists(output_path, "composite", "1738123400.png", mock_uploader)
+        result = asyncio.run(output_exists_many_async(items, mock_uploader))
 
-        assert result is True
-        mock_uploader.file_exists.assert_called_once_with("composite", "1738123400.png")
+        assert result == [True, False] * 4
+        assert mock_uploader.file_exists.call_count == 8
 
 
 class TestInitUploader:
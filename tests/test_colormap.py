@@ -8,7 +8,10 @@ and is used correctly throughout the system.
 
 import sys
 import os
+import hashlib
 import numpy as np
+import pytest
+from hypothesis import given, strategies as st
 from pathlib import Path
 
 # Add src to path for imports
@@ -17,19 +20,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 def test_shmu_colormap_availability():
     """Test that SHMU colormap is available and importable"""
     try:
-        from imeteo_radar.config.shmu_colormap import get_shmu_colormap, get_dbz_range
+        from imeteo_radar.config.shmu_colormap import get_shmu_colormap, get_dbz_range, get_color_for_dbz
         print("✅ SHMU colormap imports successfully")
-        assert True  # Import succeeded
+        assert all(map(callable, (get_shmu_colormap, get_dbz_range, get_color_for_dbz)))
     except ImportError as e:
         print(f"❌ SHMU colormap import failed: {e}")
         assert False, f"SHMU colormap import failed: {e}"
 
-def test_discrete_dbz_increments():
+def test_discrete_dbz_increments(shmu_cmap):
     """Test that colormap provides discrete 1 dBZ increments"""
-    from imeteo_radar.config.shmu_colormap import get_shmu_colormap, get_dbz_range
-    
-    cmap, norm = get_shmu_colormap()
-    min_dbz, max_dbz = get_dbz_range()
+    cmap, norm, min_dbz, max_dbz = shmu_cmap
     
     print(f"📊 Testing dBZ range: {min_dbz} to {max_dbz}")
     
@@ -42,42 +42,66 @@ def test_discrete_dbz_increments():
     
     print(f"✅ Colormap has {cmap.N} discrete colors for 1 dBZ increments")
     
-    # Check boundaries (should be at half-dBZ values for discrete steps)
-    if hasattr(norm, 'boundaries'):
-        boundaries = norm.boundaries
-        expected_boundaries = np.arange(min_dbz - 0.5, max_dbz + 1, 1.0)
-        
-        assert np.allclose(boundaries, expected_boundaries, atol=1e-6), "Boundaries don't match expected 1 dBZ discrete steps"
-        
-        print("✅ Boundaries are correctly set for 1 dBZ discrete steps")
-    else:
-        assert False, "Norm doesn't have boundaries - might not be discrete"
+    # Check bins (centered on integer dBZ, edges at half-dBZ values)
+    values = np.array([-40, -35, -34.6, -34.5, -34.4, -34, 0, 84.5, 85, 90])
+    expected_bins = np.array([0, 0, 0, 1, 1, 1, 35, 120, 120, 120])
+
+    assert np.allclose(norm(values), expected_bins / (expected_colors - 1), atol=1e-6), "Norm doesn't map to 1 dBZ discrete steps"
+    assert np.array_equal(cmap(norm(values)), cmap(expected_bins)), "Norm fractions select the wrong colors"
+
+    print("✅ Norm maps values to 1 dBZ discrete steps")
+
+    # The lookup table must bin exactly like the norm, including half-dBZ edges
+    from imeteo_radar.config.shmu_colormap import colorize, get_lut_rgba
+
+    lut = get_lut_rgba()
+    assert lut.shape == (expected_colors, 4), f"Wrong LUT shape: {lut.shape}"
+    assert np.array_equal(colorize(np.array([min_dbz, max_dbz])), lut[[0, -1]])
+
+    samples = np.arange(min_dbz - 2, max_dbz + 2, 0.25)
+    assert np.array_equal(colorize(samples), cmap(norm(samples))), "LUT lookup disagrees with the norm"
     
     print(f"✅ Colormap has {cmap.N} discrete colors for 1 dBZ increments")
 
-def test_colormap_consistency():
-    """Test that colormap returns consistent colors for same dBZ values"""
-    from imeteo_radar.config.shmu_colormap import get_color_for_dbz
+@given(st.lists(st.integers(-35, 85), min_size=1, max_size=256))
+def test_colorize_is_a_pure_lut(dbz_list):
+    """Test that colorize is a pure lookup: repeatable, and distinct dBZ get distinct colors"""
+    from imeteo_radar.config.shmu_colormap import colorize
     
-    # Test key dBZ values
-    test_values = [-35, -20, 0, 20, 40, 60, 85]
+    dbz = np.array(dbz_list)
     
-    print("🎨 Testing color consistency...")
+    colors1 = colorize(dbz, as_uint8=True)
+    colors2 = colorize(dbz, as_uint8=True)
     
-    for dbz in test_values:
-        color1 = get_color_for_dbz(dbz)
-        color2 = get_color_for_dbz(dbz)
-        
-        assert np.allclose(color1, color2, atol=1e-6), f"Inconsistent colors for {dbz} dBZ"
+    assert np.array_equal(colors1, colors2), "Inconsistent colors for repeated lookup"
     
-    # Test that adjacent dBZ values give different colors
-    for dbz in range(-30, 80, 10):
-        color1 = get_color_for_dbz(dbz)
-        color2 = get_color_for_dbz(dbz + 1)
-        
-        assert not np.allclose(color1[:3], color2[:3], atol=1e-6), f"Same colors for adjacent dBZ values: {dbz} and {dbz+1}"
+    # Neighbouring samples with different dBZ must differ in RGB
+    if len(dbz) > 1:
+        changed = np.abs(np.diff(colors1[:, :3].astype(int), axis=0)).sum(axis=1) > 0
+        assert changed[np.diff(dbz) != 0].all(), f"Same colors for different dBZ values in {dbz_list}"
+
+def test_lut_is_uint8_and_tight(shmu_cmap):
+    """Test that the packed LUT is RGBA8888 and matches the float colormap"""
+    from imeteo_radar.config.shmu_colormap import colorize, get_lut_uint8
     
-    print("✅ Colors are consistent and discrete")
+    cmap, _, min_dbz, max_dbz = shmu_cmap
+    lut = get_lut_uint8()
+
+    assert lut.shape == (121, 4) and lut.dtype == np.uint8
+    assert lut.nbytes == 121 * 4
+    assert np.allclose(lut[[0, 120]] / 255.0, cmap([0, 120]), atol=1 / 255)
+    assert np.array_equal(colorize(np.array([min_dbz, max_dbz]), as_uint8=True), lut[[0, 120]])
+
+def test_colorize_maps_nan_to_bad_color(shmu_cmap):
+    """Test that NaN nodata gets the colormap's bad color, like the norm does"""
+    from imeteo_radar.config.shmu_colormap import colorize, get_color_for_dbz
+
+    cmap, norm, _, _ = shmu_cmap
+    grid = np.array([[np.nan, 20.0], [np.inf, -np.inf]])
+
+    assert np.array_equal(colorize(grid), cmap(norm(grid)))
+    assert get_color_for_dbz(np.nan) == tuple(cmap.get_bad())
+    assert tuple(colorize(np.nan, as_uint8=True)) == (0, 0, 0, 0)
 
 def test_exporter_uses_shmu_colormap():
     """Test that the PNG exporter uses SHMU colormap exclusively"""
@@ -123,7 +147,37 @@ def test_no_fallback_colormaps():
     except Exception as e:
         assert False, f"Error checking fallback colormaps: {e}"
 
-def generate_colormap_sample():
+def test_numba_render_matches_numpy(monkeypatch):
+    """Test that the numba LUT kernel renders the same pixels as the NumPy path"""
+    import pytest
+
+    pytest.importorskip("numba")
+    from imeteo_radar.processing import exporter as exporter_module
+
+    exporter = exporter_module.MultiFormatExporter(use_transform_cache=False)
+
+    # Every LUT bin edge plus NaN/inf and values around the render threshold
+    data = np.linspace(-40, 90, 4096, dtype=np.float32).reshape(64, 64)
+    data[0, :4] = [np.nan, np.inf, -np.inf, 10.0]
+
+    for transparent in (True, False):
+        monkeypatch.setattr(exporter_module, "NUMBA_AVAILABLE", True)
+        fast_rgba, fast_mask = exporter._render_to_rgba(
+            data, "reflectivity_shmu", transparent
+        )
+        monkeypatch.setattr(exporter_module, "NUMBA_AVAILABLE", False)
+        ref_rgba, ref_mask = exporter._render_to_rgba(
+            data, "reflectivity_shmu", transparent
+        )
+
+        assert np.array_equal(fast_rgba, ref_rgba)
+        assert np.array_equal(fast_mask, ref_mask)
+
+SAMPLE_PATH = Path(__file__).parent / "shmu_colormap_sample.png"
+SAMPLE_HASH_PATH = Path(__file__).parent / ".shmu_sample.hash"
+
+@pytest.mark.slow
+def test_generate_colormap_sample():
     """Generate a sample showing the discrete colormap"""
     try:
         import matplotlib.pyplot as plt
@@ -131,6 +185,12 @@ def generate_colormap_sample():
         
         cmap, norm = get_shmu_colormap()
         min_dbz, max_dbz = get_dbz_range()
+
+        # Only re-render when the colormap content changed
+        lut_hash = hashlib.blake2b(cmap(np.arange(cmap.N)).tobytes(), digest_size=16).hexdigest()
+        if SAMPLE_PATH.exists() and SAMPLE_HASH_PATH.exists() and SAMPLE_HASH_PATH.read_text() == lut_hash:
+            print(f"✅ Colormap sample is up to date: {SAMPLE_PATH}")
+            return
         
         # Create sample data
         dbz_values = np.arange(min_dbz, max_dbz + 1, 1)
@@ -140,8 +200,8 @@ def generate_colormap_sample():
         
         # Use exact same parameters as radar processing
         im = ax.pcolormesh(
-            np.arange(len(dbz_values) + 1), 
-            np.arange(11), 
+            np.arange(len(dbz_values)), 
+            np.arange(10), 
             data, 
             cmap=cmap, 
             norm=norm, 
@@ -163,10 +223,11 @@ def generate_colormap_sample():
         ax.set_xticklabels(tick_labels)
         
         plt.tight_layout()
-        plt.savefig('tests/shmu_colormap_sample.png', dpi=150, bbox_inches='tight')
+        plt.savefig(SAMPLE_PATH, dpi=150, bbox_inches='tight')
         plt.close()
+        SAMPLE_HASH_PATH.write_text(lut_hash)
         
-        print("✅ Generated colormap sample: tests/shmu_colormap_sample.png")
+        print(f"✅ Generated colormap sample: {SAMPLE_PATH}")
         
     except ImportError:
         print("⚠️  Matplotlib not available for sample generation")
@@ -180,13 +241,17 @@ def main():
     print("🎨 SHMU Colormap Validation Tests")
     print("=" * 50)
     
+    from imeteo_radar.config.shmu_colormap import get_shmu_colormap, get_dbz_range
+
+    shmu_cmap = (*get_shmu_colormap(), *get_dbz_range())
+
     tests = [
         ("SHMU Colormap Availability", test_shmu_colormap_availability),
-        ("Discrete 1 dBZ Increments", test_discrete_dbz_increments),
-        ("Colormap Consistency", test_colormap_consistency),
+        ("Discrete 1 dBZ Increments", lambda: test_discrete_dbz_increments(shmu_cmap)),
+        ("Colormap Consistency", test_colorize_is_a_pure_lut),
         ("Exporter Uses SHMU Colormap", test_exporter_uses_shmu_colormap),
         ("No Fallback Colormaps", test_no_fallback_colormaps),
-        ("Generate Sample", generate_colormap_sample)
+        ("Generate Sample", test_generate_colormap_sample)
     ]
     
     results = []
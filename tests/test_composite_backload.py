@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel backload compositing (--workers > 1).
+"""
+
+from argparse import Namespace
+
+from imeteo_radar import cli_composite
+
+TIMESTAMPS = ["20250128100000", "20250128100500", "20250128101000"]
+FAILING_TIMESTAMP = TIMESTAMPS[-1]
+
+
+class _StubSource:
+    """Source whose downloads are fixed file infos, one per timestamp."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def download_latest(self, count, products, start_time, end_time):
+        return [
+            {"timestamp": ts, "path": f"/nonexistent/{self.name}_{ts}.hdf"}
+            for ts in TIMESTAMPS
+        ]
+
+
+# Worker stand-ins run in spawned processes, so they must live at module level
+def _stub_init_worker(source_products, export_config, upload_enabled):
+    cli_composite._BACKLOAD_WORKER.update(
+        sources=sorted(source_products), uploader=upload_enabled
+    )
+
+
+def _stub_run_worker(timestamp, source_files, output_dir, args):
+    if timestamp == FAILING_TIMESTAMP:
+        raise RuntimeError("worker crashed")
+    return {
+        "extent": timestamp,
+        "sources": cli_composite._BACKLOAD_WORKER["sources"],
+        "files": sorted(source_files),
+    }
+
+
+def _backload_args(workers):
+    return Namespace(
+        from_time="2025-01-28 10:00",
+        to_time="2025-01-28 10:10",
+        hours=None,
+        workers=workers,
+        update_extent=False,
+        resolution=500,
+        no_individual=True,
+    )
+
+
+class TestParallelBackload:
+    """Tests for the process-pool path of _process_backload."""
+
+    def test_worker_results_are_ordered_and_failures_skipped(
+        self, tmp_path, monkeypatch
+    ):
+        """Should keep the newest successful composite and skip a failed worker."""
+        saved = []
+        monkeypatch.setattr(cli_composite, "_init_backload_worker", _stub_init_worker)
+        monkeypatch.setattr(cli_composite, "_run_backload_worker", _stub_run_worker)
+        monkeypatch.setattr(
+            cli_composite,
+            "_save_extent_index",
+            lambda output_dir, composite, *args, **kwargs: saved.append(composite),
+        )
+        monkeypatch.setattr(
+            cli_composite, "_auto_generate_masks_if_missing", lambda **kwargs: None
+        )
+        sources = {name: (_StubSource(name), "zmax") for name in ("dwd", "shmu")}
+
+        result = cli_composite._process_backload(
+            _backload_args(workers=2), sources, None, None, tmp_path
+        )
+
+        assert result == 0
+        assert saved == [
+            {
+                "extent": TIMESTAMPS[1],
+                "sources": ["dwd", "shmu"],
+                "files": ["dwd", "shmu"],
+            }
+        ]
+
+
+class TestBackloadWorker:
+    """Tests for the per-process backload worker state."""
+
+    def test_init_and_run_use_per_process_state(self, tmp_path, monkeypatch):
+        """Should build sources once and hand them to each timestamp."""
+        calls = []
+        monkeypatch.setattr(cli_composite, "_BACKLOAD_WORKER", {})
+        monkeypatch.setattr(
+            cli_composite,
+            "_process_backload_timestamp",
+            lambda *args: calls.append(args) or {"extent": args[0]},
+        )
+
+        cli_composite._init_backload_worker({"shmu": "zmax"}, "config", False)
+        result = cli_composite._run_backload_worker(
+            TIMESTAMPS[0], {"shmu": {}}, tmp_path, "args"
+        )
+
+        assert result == {"extent": TIMESTAMPS[0]}
+        timestamp, source_files, sources, _exporter, config, *rest = calls[0]
+        assert (timestamp, source_files) == (TIMESTAMPS[0], {"shmu": {}})
+        assert sources["shmu"][0].name == "shmu" and sources["shmu"][1] == "zmax"
+        assert (config, *rest) == ("config", tmp_path, "args", None)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for extent index loading.
+"""
+
+import json
+import os
+
+import pytest
+
+from imeteo_radar.utils.extent_loader import read_extent_file
+
+
+class TestReadExtentFile:
+    """Tests for read_extent_file function."""
+
+    def test_reuses_parsed_data_until_file_changes(self, tmp_path):
+        """Should return the cached result until the file's mtime changes."""
+        path = tmp_path / "extent_index.json"
+        path.write_text(json.dumps({"wgs84": {"west": 1.0}}))
+
+        first = read_extent_file(path)
+        assert read_extent_file(path) is first
+
+        path.write_text(json.dumps({"wgs84": {"west": 2.0}}))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert read_extent_file(path) == {"wgs84": {"west": 2.0}}
+
+    def test_invalid_json_raises_json_decode_error(self, tmp_path):
+        """Should raise json.JSONDecodeError regardless of parser backend."""
+        path = tmp_path / "extent_index.json"
+        path.write_text("{not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            read_extent_file(path)
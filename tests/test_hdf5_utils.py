@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for HDF5 scaling and quantization utilities.
+"""
+
+import numpy as np
+import pytest
+
+from imeteo_radar.utils.hdf5_utils import (
+    INT8_NODATA,
+    dequantize_radar_data,
+    quantize_radar_data,
+    scale_radar_data,
+)
+
+
+class TestQuantizeRadarData:
+    """Tests for quantize_radar_data and dequantize_radar_data."""
+
+    def test_int8_round_trips_uint8_product(self):
+        """Should keep every level of an 8-bit product and NaN as sentinel."""
+        raw = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        scaled = scale_radar_data(raw, 0.5, -32.0, 255, 0, handle_uint8=True)
+
+        quantized, quantization = quantize_radar_data(scaled, "int8", 0.5, -32.0)
+
+        assert quantized.dtype == np.int8
+        assert quantization["nodata"] == INT8_NODATA
+        assert np.all((quantized == INT8_NODATA) == np.isnan(scaled))
+        restored = dequantize_radar_data(quantized, quantization)
+        np.testing.assert_array_equal(restored, scaled)
+
+    def test_float16_keeps_nan_and_rejects_unknown_dtype(self):
+        """Should narrow floats to float16 and reject unsupported dtypes."""
+        scaled = np.array([[np.nan, 10.5], [45.0, -31.5]], dtype=np.float32)
+
+        narrowed, quantization = quantize_radar_data(scaled, "float16", 0.5, -32.0)
+
+        assert narrowed.dtype == np.float16
+        assert quantization is None
+        np.testing.assert_array_equal(narrowed, scaled)
+        with pytest.raises(ValueError):
+            quantize_radar_data(scaled, "uint4", 0.5, -32.0)
@@ -5,86 +5,103 @@ Unit tests for IMGW (Polish Institute of Meteorology and Water Management) Radar
 Tests follow TDD methodology - written before implementation.
 """
 
-import tempfile
-from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from datetime import datetime
 
 import h5py
 import numpy as np
 import pytest
 import pytz
+import requests
+
+from imeteo_radar.cli import create_parser
+from imeteo_radar.config.sources import SOURCE_REGISTRY, get_source_instance
+from imeteo_radar.sources.imgw import IMGWRadarSource
+from imeteo_radar.utils.timestamps import (
+    TimestampFormat,
+    filter_timestamps_by_range,
+    generate_timestamp_candidates,
+)
+
+
+class _Resp:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status=200, headers=None, content=b""):
+        self.status_code = status
+        self.headers = headers or {}
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+_OK_RESP = _Resp(content=b"test content")
+
+
+def _write_attrs(obj, attrs):
+    """Write a dict of HDF5 attributes without per-key existence checks."""
+    for name, value in attrs.items():
+        obj.attrs.create(name, value)
+
+
+@pytest.fixture(scope="module")
+def imgw_source():
+    """One IMGWRadarSource shared by tests that do not change its state."""
+    return IMGWRadarSource()
+
+
+@pytest.fixture
+def fresh_imgw_source():
+    """A new IMGWRadarSource for tests that fill its temp_files cache."""
+    source = IMGWRadarSource()
+    yield source
+    source.cleanup_temp_files()
+
+
+@pytest.fixture
+def fake_requests_get(monkeypatch):
+    """Make requests.get return the shared successful response."""
+    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: _OK_RESP)
+    return _OK_RESP
 
 
 class TestIMGWRadarSourceInitialization:
     """Test IMGW source initialization"""
 
-    def test_imgw_source_initializes_with_correct_name(self):
+    def test_imgw_source_initializes_with_correct_name(self, imgw_source):
         """Test that IMGW source initializes with name 'imgw'"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        assert source.name == "imgw"
+        assert imgw_source.name == "imgw"
 
-    def test_imgw_source_has_correct_base_url(self):
+    def test_imgw_source_has_correct_base_url(self, imgw_source):
         """Test that IMGW source has correct API and download URLs"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
+        assert "danepubliczne.imgw.pl" in imgw_source.api_url
+        assert "danepubliczne.imgw.pl" in imgw_source.download_base_url
+        assert "HVD" in imgw_source.download_base_url
 
-        source = IMGWRadarSource()
-        assert "danepubliczne.imgw.pl" in source.api_url
-        assert "danepubliczne.imgw.pl" in source.download_base_url
-        assert "HVD" in source.download_base_url
-
-    def test_imgw_source_has_temp_files_dict(self):
+    def test_imgw_source_has_temp_files_dict(self, imgw_source):
         """Test that IMGW source initializes with empty temp_files dict"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        assert isinstance(source.temp_files, dict)
-        assert len(source.temp_files) == 0
+        assert isinstance(imgw_source.temp_files, dict)
+        assert len(imgw_source.temp_files) == 0
 
-    def test_imgw_source_has_product_mapping(self):
+    def test_imgw_source_has_product_mapping(self, imgw_source):
         """Test that IMGW source has product mapping with cmax"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        assert hasattr(source, "product_mapping")
-        assert "cmax" in source.product_mapping
+        assert hasattr(imgw_source, "product_mapping")
+        assert "cmax" in imgw_source.product_mapping
 
 
 class TestIMGWProducts:
     """Test IMGW product-related methods"""
 
-    def test_get_available_products_returns_list(self):
-        """Test that get_available_products returns a list"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        products = source.get_available_products()
+    def test_get_available_products_includes_cmax(self, imgw_source):
+        """Test that get_available_products returns a list including cmax"""
+        products = imgw_source.get_available_products()
         assert isinstance(products, list)
-
-    def test_get_available_products_includes_cmax(self):
-        """Test that available products include cmax"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        products = source.get_available_products()
         assert "cmax" in products
 
-    def test_get_product_metadata_returns_dict(self):
-        """Test that get_product_metadata returns a dictionary"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        metadata = source.get_product_metadata("cmax")
+    def test_get_product_metadata_includes_required_fields(self, imgw_source):
+        """Test that product metadata is a dictionary with required fields"""
+        metadata = imgw_source.get_product_metadata("cmax")
         assert isinstance(metadata, dict)
-
-    def test_get_product_metadata_includes_required_fields(self):
-        """Test that product metadata includes required fields"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        metadata = source.get_product_metadata("cmax")
         assert "product" in metadata
         assert "source" in metadata
         assert metadata["source"] == "imgw"
@@ -95,11 +112,6 @@ class TestIMGWTimestamps:
 
     def test_generate_timestamps_returns_list(self):
         """Test that generate_timestamp_candidates returns a list"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            generate_timestamp_candidates,
-        )
-
         timestamps = generate_timestamp_candidates(
             count=3, interval_minutes=5, delay_minutes=10, format_str=TimestampFormat.FULL
         )
@@ -107,11 +119,6 @@ class TestIMGWTimestamps:
 
     def test_generate_timestamps_returns_correct_count(self):
         """Test that generate_timestamp_candidates returns expected number of timestamps"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            generate_timestamp_candidates,
-        )
-
         timestamps = generate_timestamp_candidates(
             count=3, interval_minutes=5, delay_minutes=10, format_str=TimestampFormat.FULL
         )
@@ -120,11 +127,6 @@ class TestIMGWTimestamps:
 
     def test_generate_timestamps_format_is_14_digits(self):
         """Test that timestamps are 14 digits (YYYYMMDDHHMMSS)"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            generate_timestamp_candidates,
-        )
-
         timestamps = generate_timestamp_candidates(
             count=3, interval_minutes=5, delay_minutes=10, format_str=TimestampFormat.FULL
         )
@@ -134,11 +136,6 @@ class TestIMGWTimestamps:
 
     def test_generate_timestamps_are_5_minute_intervals(self):
         """Test that timestamps are at 5-minute intervals"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            generate_timestamp_candidates,
-        )
-
         timestamps = generate_timestamp_candidates(
             count=5, interval_minutes=5, delay_minutes=10, format_str=TimestampFormat.FULL
         )
@@ -149,11 +146,6 @@ class TestIMGWTimestamps:
 
     def test_generate_timestamps_are_unique(self):
         """Test that generated timestamps are unique"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            generate_timestamp_candidates,
-        )
-
         timestamps = generate_timestamp_candidates(
             count=10, interval_minutes=5, delay_minutes=10, format_str=TimestampFormat.FULL
         )
@@ -163,161 +155,91 @@ class TestIMGWTimestamps:
 class TestIMGWUrlGeneration:
     """Test IMGW URL generation"""
 
-    def test_get_product_url_contains_base_url(self):
-        """Test that generated URL contains base URL"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        url = source._get_product_url("20250127120000", "cmax")
+    def test_get_product_url_format(self, imgw_source):
+        """Test that generated URL has the HVD host, directory, timestamp and suffix"""
+        url = imgw_source._get_product_url("20250127120000", "cmax")
         assert "danepubliczne.imgw.pl" in url
-
-    def test_get_product_url_contains_product_directory(self):
-        """Test that generated URL contains product directory"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        url = source._get_product_url("20250127120000", "cmax")
         assert "HVD_COMPO_CMAX_250" in url
-
-    def test_get_product_url_contains_timestamp(self):
-        """Test that generated URL contains timestamp"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        url = source._get_product_url("20250127120000", "cmax")
         assert "20250127120000" in url
-
-    def test_get_product_url_ends_with_h5(self):
-        """Test that generated URL ends with .h5"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        url = source._get_product_url("20250127120000", "cmax")
-        assert url.endswith(".h5")
-
-    def test_get_product_url_has_dbz_suffix(self):
-        """Test that generated URL contains 00dBZ suffix pattern"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        url = source._get_product_url("20250127120000", "cmax")
         assert "00dBZ" in url
+        assert url.endswith(".h5")
 
-    def test_get_product_url_raises_for_unknown_product(self):
+    def test_get_product_url_raises_for_unknown_product(self, imgw_source):
         """Test that _get_product_url raises for unknown product"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
         with pytest.raises(ValueError):
-            source._get_product_url("20250127120000", "unknown_product")
+            imgw_source._get_product_url("20250127120000", "unknown_product")
 
 
 class TestIMGWAvailability:
     """Test IMGW timestamp availability checking via HEAD requests"""
 
-    @patch("requests.head")
-    def test_check_timestamp_availability_returns_true_when_file_exists(self, mock_head):
+    def test_check_timestamp_availability_returns_true_when_file_exists(self, imgw_source, monkeypatch):
         """Test that availability check returns True when HEAD request succeeds with non-HTML content"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        # Mock successful HEAD response (non-HTML content type indicates real file)
-        mock_head.return_value.status_code = 200
-        mock_head.return_value.headers = {"Content-Type": "application/octet-stream"}
+        # Successful HEAD response (non-HTML content type indicates real file)
+        monkeypatch.setattr(
+            requests,
+            "head",
+            lambda *args, **kwargs: _Resp(headers={"Content-Type": "application/octet-stream"}),
+        )
 
-        source = IMGWRadarSource()
-        result = source._check_timestamp_availability("20250127120000", "cmax")
+        result = imgw_source._check_timestamp_availability("20250127120000", "cmax")
         assert result is True
 
-    @patch("requests.head")
-    def test_check_timestamp_availability_returns_false_when_file_missing(self, mock_head):
+    def test_check_timestamp_availability_returns_false_when_file_missing(self, imgw_source, monkeypatch):
         """Test that availability check returns False when server returns HTML (error page)"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        # Mock response that returns HTML (indicates error/404 page)
-        mock_head.return_value.status_code = 200
-        mock_head.return_value.headers = {"Content-Type": "text/html"}
+        # Response that returns HTML (indicates error/404 page)
+        monkeypatch.setattr(
+            requests,
+            "head",
+            lambda *args, **kwargs: _Resp(headers={"Content-Type": "text/html"}),
+        )
 
-        source = IMGWRadarSource()
-        result = source._check_timestamp_availability("20250127120000", "cmax")
+        result = imgw_source._check_timestamp_availability("20250127120000", "cmax")
         assert result is False
 
-    @patch("requests.head")
-    def test_check_timestamp_availability_returns_false_on_exception(self, mock_head):
+    def test_check_timestamp_availability_returns_false_on_exception(self, imgw_source, monkeypatch):
         """Test that availability check returns False on exception"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
 
-        mock_head.side_effect = Exception("Network error")
-        source = IMGWRadarSource()
-        result = source._check_timestamp_availability("20250127120000", "cmax")
+        def failing_head(*args, **kwargs):
+            raise Exception("Network error")
+
+        monkeypatch.setattr(requests, "head", failing_head)
+        result = imgw_source._check_timestamp_availability("20250127120000", "cmax")
         assert result is False
 
 
 class TestIMGWDownload:
     """Test IMGW file download functionality"""
 
-    @patch("requests.get")
-    def test_download_single_file_returns_dict(self, mock_get):
+    def test_download_single_file_returns_dict(self, fresh_imgw_source, fake_requests_get):
         """Test that _download_single_file returns a dictionary"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        mock_get.return_value.content = b"test content"
-        mock_get.return_value.raise_for_status = MagicMock()
-
-        source = IMGWRadarSource()
-        result = source._download_single_file("20250127120000", "cmax")
+        result = fresh_imgw_source._download_single_file("20250127120000", "cmax")
         assert isinstance(result, dict)
 
-    @patch("requests.get")
-    def test_download_single_file_includes_required_keys(self, mock_get):
+    def test_download_single_file_includes_required_keys(self, fresh_imgw_source, fake_requests_get):
         """Test that download result includes required keys"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        mock_get.return_value.content = b"test content"
-        mock_get.return_value.raise_for_status = MagicMock()
-
-        source = IMGWRadarSource()
-        result = source._download_single_file("20250127120000", "cmax")
+        result = fresh_imgw_source._download_single_file("20250127120000", "cmax")
 
         assert "timestamp" in result
         assert "product" in result
         assert "success" in result
 
-    @patch("requests.get")
-    def test_download_single_file_success_flag(self, mock_get):
+    def test_download_single_file_success_flag(self, fresh_imgw_source, fake_requests_get):
         """Test that successful download has success=True"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        mock_get.return_value.content = b"test content"
-        mock_get.return_value.raise_for_status = MagicMock()
-
-        source = IMGWRadarSource()
-        result = source._download_single_file("20250127120000", "cmax")
+        result = fresh_imgw_source._download_single_file("20250127120000", "cmax")
         assert result["success"] is True
 
-    @patch("requests.get")
-    def test_download_single_file_caches_file(self, mock_get):
+    def test_download_single_file_caches_file(self, fresh_imgw_source, fake_requests_get):
         """Test that downloaded files are cached"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        mock_get.return_value.content = b"test content"
-        mock_get.return_value.raise_for_status = MagicMock()
-
-        source = IMGWRadarSource()
-        result1 = source._download_single_file("20250127120000", "cmax")
-        result2 = source._download_single_file("20250127120000", "cmax")
+        result1 = fresh_imgw_source._download_single_file("20250127120000", "cmax")
+        result2 = fresh_imgw_source._download_single_file("20250127120000", "cmax")
 
         # Second call should use cache
         assert result2.get("cached", False) is True
 
-        # Clean up
-        source.cleanup_temp_files()
-
-    def test_download_single_file_returns_error_for_unknown_product(self):
+    def test_download_single_file_returns_error_for_unknown_product(self, fresh_imgw_source):
         """Test that unknown product returns error"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source._download_single_file("20250127120000", "unknown_product")
+        result = fresh_imgw_source._download_single_file("20250127120000", "unknown_product")
         assert result["success"] is False
         assert "error" in result
 
@@ -325,9 +247,11 @@ class TestIMGWDownload:
 class TestIMGWProcessing:
     """Test IMGW HDF5 file processing"""
 
-    @pytest.fixture
-    def mock_hdf5_file(self, tmp_path):
-        """Create a mock HDF5 file with IMGW-like structure
+    @pytest.fixture(scope="module")
+    def mock_hdf5_file(self, tmp_path_factory):
+        """Create a mock HDF5 file with IMGW-like structure, once per module
+
+        Tests only read it, so one file is shared.
 
         IMGW ODIM_H5 structure:
         - dataset1/data1/data: raw uint8 data
@@ -335,98 +259,66 @@ class TestIMGWProcessing:
         - what: global metadata (date, time, source)
         - where: corner coordinates (LL_lon, LL_lat, UR_lon, UR_lat)
         """
-        file_path = tmp_path / "test_imgw.h5"
+        file_path = tmp_path_factory.mktemp("imgw") / "test_imgw.h5"
 
-        with h5py.File(file_path, "w") as f:
-            # Create data with realistic shape
-            data = np.random.randint(0, 255, (500, 600), dtype=np.uint8)
+        with h5py.File(file_path, "w", libver="latest") as f:
+            # Small deterministic grid covering every raw level (incl. nodata/undetect)
+            data = (np.arange(50 * 60) % 256).astype(np.uint8).reshape(50, 60)
 
             # Create dataset structure
             dataset1 = f.create_group("dataset1")
             data1 = dataset1.create_group("data1")
-            data1.create_dataset("data", data=data)
+            data1.create_dataset("data", data=data, track_times=False)
 
             # Add dataset1/what attributes - IMGW stores scaling AND product info here
             what_dataset = dataset1.create_group("what")
-            what_dataset.attrs["gain"] = 0.5
-            what_dataset.attrs["offset"] = -32.0
-            what_dataset.attrs["nodata"] = 255.0
-            what_dataset.attrs["undetect"] = 0.0
-            what_dataset.attrs["quantity"] = b"DBZH"
-            what_dataset.attrs["product"] = b"COMP"
-            what_dataset.attrs["startdate"] = b"20250127"
-            what_dataset.attrs["starttime"] = b"120000"
+            _write_attrs(
+                what_dataset,
+                {
+                    "gain": 0.5,
+                    "offset": -32.0,
+                    "nodata": 255.0,
+                    "undetect": 0.0,
+                    "quantity": b"DBZH",
+                    "product": b"COMP",
+                    "startdate": b"20250127",
+                    "starttime": b"120000",
+                },
+            )
 
             # Add global what attributes (fallback metadata)
             what_global = f.create_group("what")
-            what_global.attrs["date"] = b"20250127"
-            what_global.attrs["time"] = b"120000"
-            what_global.attrs["source"] = b"IMGW"
+            _write_attrs(what_global, {"date": b"20250127", "time": b"120000", "source": b"IMGW"})
 
             # Add where attributes (extent)
             where = f.create_group("where")
-            where.attrs["LL_lon"] = 14.0
-            where.attrs["LL_lat"] = 49.0
-            where.attrs["UR_lon"] = 24.3
-            where.attrs["UR_lat"] = 54.9
+            _write_attrs(where, {"LL_lon": 14.0, "LL_lat": 49.0, "UR_lon": 24.3, "UR_lat": 54.9})
 
         return str(file_path)
 
-    def test_process_to_array_returns_dict(self, mock_hdf5_file):
-        """Test that process_to_array returns a dictionary"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
+    @pytest.fixture(scope="module")
+    def processed(self, imgw_source, mock_hdf5_file):
+        """Result of process_to_array on the mock file, shared by read-only tests"""
+        return imgw_source.process_to_array(mock_hdf5_file)
 
-        source = IMGWRadarSource()
-        result = source.process_to_array(mock_hdf5_file)
-        assert isinstance(result, dict)
-
-    def test_process_to_array_includes_data_array(self, mock_hdf5_file):
-        """Test that processed result includes data array"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.process_to_array(mock_hdf5_file)
-        assert "data" in result
-        assert isinstance(result["data"], np.ndarray)
+    def test_process_to_array_result_structure(self, processed):
+        """Test that processed result is a dict with data, metadata and extent"""
+        assert isinstance(processed, dict)
+        assert isinstance(processed["data"], np.ndarray)
+        assert processed["metadata"]["source"] == "IMGW"
+        assert "wgs84" in processed["extent"]
 
-    def test_process_to_array_includes_coordinates(self, mock_hdf5_file):
+    def test_process_to_array_includes_coordinates(self, processed):
         """Test that processed result includes coordinates"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.process_to_array(mock_hdf5_file)
-        assert "coordinates" in result
-        assert "lons" in result["coordinates"]
-        assert "lats" in result["coordinates"]
-
-    def test_process_to_array_includes_metadata(self, mock_hdf5_file):
-        """Test that processed result includes metadata"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.process_to_array(mock_hdf5_file)
-        assert "metadata" in result
-        assert "source" in result["metadata"]
-        assert result["metadata"]["source"] == "IMGW"
-
-    def test_process_to_array_includes_extent(self, mock_hdf5_file):
-        """Test that processed result includes extent"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.process_to_array(mock_hdf5_file)
-        assert "extent" in result
-        assert "wgs84" in result["extent"]
+        assert "coordinates" in processed
+        assert "lons" in processed["coordinates"]
+        assert "lats" in processed["coordinates"]
 
-    def test_process_to_array_applies_scaling(self, mock_hdf5_file):
+    def test_process_to_array_applies_scaling(self, processed):
         """Test that data scaling is applied correctly"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.process_to_array(mock_hdf5_file)
         # Data should be scaled (gain=0.5, offset=-32)
         # So values should be in dBZ range, not raw uint8 0-255
-        data = result["data"]
+        data = processed["data"]
         valid_data = data[~np.isnan(data)]
         if len(valid_data) > 0:
             # Scaled data should be in reasonable dBZ range
@@ -437,32 +329,10 @@ class TestIMGWProcessing:
 class TestIMGWExtent:
     """Test IMGW extent methods"""
 
-    def test_get_extent_returns_dict(self):
-        """Test that get_extent returns a dictionary"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        extent = source.get_extent()
+    def test_get_extent_covers_poland(self, imgw_source):
+        """Test that extent has WGS84 bounds covering Poland"""
+        extent = imgw_source.get_extent()
         assert isinstance(extent, dict)
-
-    def test_get_extent_includes_wgs84(self):
-        """Test that extent includes WGS84 bounds"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        extent = source.get_extent()
-        assert "wgs84" in extent
-        assert "west" in extent["wgs84"]
-        assert "east" in extent["wgs84"]
-        assert "south" in extent["wgs84"]
-        assert "north" in extent["wgs84"]
-
-    def test_get_extent_covers_poland(self):
-        """Test that extent covers Poland's approximate bounds"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        extent = source.get_extent()
         wgs84 = extent["wgs84"]
 
         # Poland approximate bounds: 14.0-24.3E, 49.0-54.9N
@@ -471,108 +341,55 @@ class TestIMGWExtent:
         assert wgs84["south"] <= 49.5  # Should include southern Poland
         assert wgs84["north"] >= 54.5  # Should include northern Poland
 
-    def test_get_extent_includes_mercator(self):
-        """Test that extent includes Mercator projection"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        extent = source.get_extent()
-        assert "mercator" in extent
-        assert "x_min" in extent["mercator"]
-        assert "x_max" in extent["mercator"]
-        assert "y_min" in extent["mercator"]
-        assert "y_max" in extent["mercator"]
+    @pytest.mark.parametrize("key", ["x_min", "x_max", "y_min", "y_max"])
+    def test_get_extent_includes_mercator(self, imgw_source, key):
+        """Test that extent includes Mercator projection bounds"""
+        assert key in imgw_source.get_extent()["mercator"]
 
 
 class TestIMGWMemoryOptimization:
     """Test IMGW memory-efficient extent extraction"""
 
-    @pytest.fixture
-    def mock_hdf5_file(self, tmp_path):
-        """Create a mock HDF5 file for extent extraction"""
-        file_path = tmp_path / "test_imgw_extent.h5"
+    @pytest.fixture(scope="module")
+    def mock_hdf5_file(self, tmp_path_factory):
+        """Create a mock HDF5 file for extent extraction, once per module"""
+        file_path = tmp_path_factory.mktemp("imgw") / "test_imgw_extent.h5"
 
-        with h5py.File(file_path, "w") as f:
+        with h5py.File(file_path, "w", libver="latest") as f:
             # Create minimal data structure
             data = np.zeros((100, 100), dtype=np.uint8)
             dataset1 = f.create_group("dataset1")
             data1 = dataset1.create_group("data1")
-            data1.create_dataset("data", data=data)
+            data1.create_dataset("data", data=data, track_times=False)
 
             # Add where attributes (extent)
             where = f.create_group("where")
-            where.attrs["LL_lon"] = 14.0
-            where.attrs["LL_lat"] = 49.0
-            where.attrs["UR_lon"] = 24.3
-            where.attrs["UR_lat"] = 54.9
+            _write_attrs(where, {"LL_lon": 14.0, "LL_lat": 49.0, "UR_lon": 24.3, "UR_lat": 54.9})
 
         return str(file_path)
 
-    def test_extract_extent_only_returns_dict(self, mock_hdf5_file):
-        """Test that extract_extent_only returns a dictionary"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.extract_extent_only(mock_hdf5_file)
+    def test_extract_extent_only_includes_extent_and_dimensions(self, imgw_source, mock_hdf5_file):
+        """Test that extract_extent_only returns extent and data dimensions"""
+        result = imgw_source.extract_extent_only(mock_hdf5_file)
         assert isinstance(result, dict)
-
-    def test_extract_extent_only_includes_extent(self, mock_hdf5_file):
-        """Test that result includes extent"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.extract_extent_only(mock_hdf5_file)
-        assert "extent" in result
         assert "wgs84" in result["extent"]
-
-    def test_extract_extent_only_includes_dimensions(self, mock_hdf5_file):
-        """Test that result includes dimensions"""
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
-        source = IMGWRadarSource()
-        result = source.extract_extent_only(mock_hdf5_file)
-        assert "dimensions" in result
         assert result["dimensions"] == (100, 100)
 
 
 class TestIMGWRegistry:
     """Test IMGW integration with source registry"""
 
-    def test_imgw_in_source_registry(self):
-        """Test that imgw is registered in SOURCE_REGISTRY"""
-        from imeteo_radar.config.sources import SOURCE_REGISTRY
-
+    def test_imgw_registry_entry(self):
+        """Test that imgw is registered with the right class, module, product and country"""
         assert "imgw" in SOURCE_REGISTRY
-
-    def test_imgw_registry_has_correct_class(self):
-        """Test that imgw registry entry has correct class name"""
-        from imeteo_radar.config.sources import SOURCE_REGISTRY
-
-        assert SOURCE_REGISTRY["imgw"]["class_name"] == "IMGWRadarSource"
-
-    def test_imgw_registry_has_correct_module(self):
-        """Test that imgw registry entry has correct module path"""
-        from imeteo_radar.config.sources import SOURCE_REGISTRY
-
-        assert SOURCE_REGISTRY["imgw"]["module"] == "imeteo_radar.sources.imgw"
-
-    def test_imgw_registry_has_correct_product(self):
-        """Test that imgw registry entry has correct default product"""
-        from imeteo_radar.config.sources import SOURCE_REGISTRY
-
-        assert SOURCE_REGISTRY["imgw"]["product"] == "cmax"
-
-    def test_imgw_registry_has_correct_country(self):
-        """Test that imgw registry entry has correct country"""
-        from imeteo_radar.config.sources import SOURCE_REGISTRY
-
-        assert SOURCE_REGISTRY["imgw"]["country"] == "poland"
+        entry = SOURCE_REGISTRY["imgw"]
+        assert entry["class_name"] == "IMGWRadarSource"
+        assert entry["module"] == "imeteo_radar.sources.imgw"
+        assert entry["product"] == "cmax"
+        assert entry["country"] == "poland"
 
     def test_get_source_instance_returns_imgw(self):
         """Test that get_source_instance creates IMGWRadarSource"""
-        from imeteo_radar.config.sources import get_source_instance
-        from imeteo_radar.sources.imgw import IMGWRadarSource
-
         source = get_source_instance("imgw")
         assert isinstance(source, IMGWRadarSource)
 
@@ -580,83 +397,29 @@ class TestIMGWRegistry:
 class TestIMGWCLI:
     """Test IMGW CLI integration"""
 
-    def test_imgw_in_fetch_choices(self):
-        """Test that imgw is available in fetch command choices"""
-        from imeteo_radar.cli import create_parser
-
-        parser = create_parser()
-        # Get fetch subparser
-        fetch_action = None
-        for action in parser._subparsers._actions:
-            if (
-                hasattr(action, "choices")
-                and action.choices
-                and "fetch" in action.choices
-            ):
-                fetch_action = action.choices["fetch"]
-                break
-
-        assert fetch_action is not None
-        # Check source argument choices
-        found = False
-        for action in fetch_action._actions:
-            if hasattr(action, "dest") and action.dest == "source":
-                assert "imgw" in action.choices
-                found = True
-                break
-        assert found, "source argument not found in fetch parser"
-
-    def test_imgw_in_extent_choices(self):
-        """Test that imgw is available in extent command choices"""
-        from imeteo_radar.cli import create_parser
-
-        parser = create_parser()
-        # Get extent subparser
-        extent_action = None
-        for action in parser._subparsers._actions:
-            if (
-                hasattr(action, "choices")
-                and action.choices
-                and "extent" in action.choices
-            ):
-                extent_action = action.choices["extent"]
-                break
-
-        assert extent_action is not None
-        # Check source argument choices
-        found = False
-        for action in extent_action._actions:
-            if hasattr(action, "dest") and action.dest == "source":
-                assert "imgw" in action.choices
-                found = True
-                break
-        assert found, "source argument not found in extent parser"
-
-    def test_imgw_in_coverage_mask_choices(self):
-        """Test that imgw is available in coverage-mask command choices"""
-        from imeteo_radar.cli import create_parser
-
+    @pytest.fixture(scope="module")
+    def cli_choices(self):
+        """Source choices of each subcommand, from one parser build"""
         parser = create_parser()
-        # Get coverage-mask subparser
-        coverage_action = None
-        for action in parser._subparsers._actions:
-            if (
-                hasattr(action, "choices")
-                and action.choices
-                and "coverage-mask" in action.choices
-            ):
-                coverage_action = action.choices["coverage-mask"]
-                break
-
-        assert coverage_action is not None
-        # Check source argument choices
-        found = False
-        for action in coverage_action._actions:
-            if hasattr(action, "dest") and action.dest == "source":
-                assert "imgw" in action.choices
-                found = True
-                break
-        assert found, "source argument not found in coverage-mask parser"
+        subcommands = next(
+            action.choices
+            for action in parser._subparsers._actions
+            if hasattr(action, "choices") and action.choices and "fetch" in action.choices
+        )
+        return {
+            name: next(
+                (action.choices for action in sub._actions if action.dest == "source"),
+                None,
+            )
+            for name, sub in subcommands.items()
+        }
+
+    @pytest.mark.parametrize("subcommand", ["fetch", "extent", "coverage-mask"])
+    def test_imgw_in_source_choices(self, cli_choices, subcommand):
+        """Test that imgw is available in the subcommand's source choices"""
+        assert subcommand in cli_choices
+        assert cli_choices[subcommand] is not None, f"source argument not found in {subcommand} parser"
+        assert "imgw" in cli_choices[subcommand]
 
 
 class TestIMGWPackageExport:
@@ -687,11 +450,6 @@ class TestIMGWFilterTimestamps:
 
     def test_filter_timestamps_by_range_returns_list(self):
         """Test that filter_timestamps_by_range returns a list"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            filter_timestamps_by_range,
-        )
-
         start = datetime(2025, 1, 27, 10, 0, tzinfo=pytz.UTC)
         end = datetime(2025, 1, 27, 12, 0, tzinfo=pytz.UTC)
         timestamps = ["20250127100000", "20250127110000", "20250127120000"]
@@ -703,11 +461,6 @@ class TestIMGWFilterTimestamps:
 
     def test_filter_timestamps_by_range_filters_correctly(self):
         """Test that timestamps outside range are filtered out"""
-        from imeteo_radar.utils.timestamps import (
-            TimestampFormat,
-            filter_timestamps_by_range,
-        )
-
         start = datetime(2025, 1, 27, 10, 0, tzinfo=pytz.UTC)
         end = datetime(2025, 1, 27, 11, 0, tzinfo=pytz.UTC)
         timestamps = [
@@ -8,6 +8,7 @@ TDD: These tests are written BEFORE the implementation.
 import io
 import json
 import logging
+import logging.handlers
 import sys
 import tempfile
 from pathlib import Path
@@ -228,6 +229,35 @@ class TestSetupLogging:
         finally:
             Path(log_file).unlink(missing_ok=True)
 
+    def test_queued_logging_writes_on_reconfigure(self):
+        """Test that queued records reach the file once logging is reconfigured"""
+        from imeteo_radar.core.logging import setup_logging
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            log_file = f.name
+
+        try:
+            logger = setup_logging(structured=True, log_file=log_file, queued=True)
+            assert all(
+                isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers
+            )
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("Queued message", extra={"source": "shmu"})
+
+            # Reconfiguring drains the queue and stops the writer thread
+            setup_logging()
+
+            with open(log_file) as f:
+                content = f.read()
+            entry = json.loads(content)
+            assert entry["message"] == "Queued message"
+            assert entry["source"] == "shmu"
+            assert "ValueError: boom" in entry["exception"]
+        finally:
+            Path(log_file).unlink(missing_ok=True)
+
     def test_console_output_by_default(self):
         """Test that console output is enabled by default"""
         from imeteo_radar.core.logging import setup_logging
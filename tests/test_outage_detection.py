@@ -351,6 +351,45 @@ class TestMultipleTimestampFinding:
 
         assert len(results) == 0
 
+    def test_returns_empty_when_too_few_sources_have_data(self, mock_sources):
+        """Test early exit when fewer sources have any data than required."""
+        timestamp_groups = {
+            f"2026012812{i:02d}00": {"dwd": {"timestamp": f"2026012812{i:02d}00"}}
+            for i in range(10)
+        }
+
+        results = _find_multiple_common_timestamps(
+            timestamp_groups,
+            {"dwd": mock_sources["dwd"], "shmu": mock_sources["shmu"]},
+            min_sources=2,
+        )
+
+        assert results == []
+
+    def test_numba_window_counts_match_numpy(self, mock_sources, monkeypatch):
+        """Test that the numba window kernel selects the same timestamps."""
+        pytest.importorskip("numba")
+        import imeteo_radar.cli_composite as cli_composite
+
+        # Staggered per-source minutes so windows hold varying source counts
+        timestamp_groups = {}
+        for offset, source in enumerate(["dwd", "shmu", "chmi", "omsz"]):
+            for minute in range(offset, 60, 5 + offset):
+                ts = f"2026012812{minute:02d}00"
+                timestamp_groups.setdefault(ts, {})[source] = {"timestamp": ts}
+
+        kwargs = dict(tolerance_minutes=2, min_sources=3, max_count=20)
+        fast = _find_multiple_common_timestamps(
+            timestamp_groups, mock_sources, **kwargs
+        )
+        monkeypatch.setattr(cli_composite, "_get_window_count_kernel", lambda: None)
+        reference = _find_multiple_common_timestamps(
+            timestamp_groups, mock_sources, **kwargs
+        )
+
+        assert fast
+        assert fast == reference
+
 
 class TestDefaultValues:
     """Tests for default configuration values."""
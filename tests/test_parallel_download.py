@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel download utilities.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from imeteo_radar.utils.parallel_download import find_available_parallel
+
+
+class TestFindAvailableParallel:
+    """Tests for find_available_parallel function."""
+
+    def test_keeps_candidate_order_and_limits_count(self):
+        """Should return the first available candidates in input order."""
+        candidates = [f"ts{i:02d}" for i in range(20)]
+        available = {"ts03", "ts01", "ts07", "ts12", "ts15"}
+
+        result = find_available_parallel(candidates, available.__contains__, 3)
+
+        assert result == ["ts01", "ts03", "ts07"]
+
+    def test_failed_checks_count_as_unavailable(self):
+        """Should skip candidates whose check raises."""
+        lock = threading.Lock()
+        calls = []
+
+        def check(timestamp):
+            with lock:
+                calls.append(timestamp)
+            if timestamp == "a":
+                raise ConnectionError("boom")
+            return True
+
+        result = find_available_parallel(["a", "b", "c"], check, 5)
+
+        assert result == ["b", "c"]
+        assert sorted(calls) == ["a", "b", "c"]
+
+    def test_reuses_given_executor_without_shutting_it_down(self):
+        """Should run probes on a caller's executor and leave it usable."""
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="probe") as pool:
+            names = []
+
+            def check(timestamp):
+                names.append(threading.current_thread().name)
+                return True
+
+            result = find_available_parallel(["a", "b"], check, 2, executor=pool)
+
+            assert result == ["a", "b"]
+            assert all(name.startswith("probe") for name in names)
+            assert pool.submit(lambda: 42).result() == 42
+
+    def test_caps_probes_in_flight_on_a_larger_executor(self):
+        """Should run at most max_workers probes at once on a shared executor."""
+        lock = threading.Lock()
+        running = peak = 0
+
+        def check(timestamp):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            result = find_available_parallel(
+                list("abcdefgh"), check, 8, max_workers=2, executor=pool
+            )
+
+        assert result == list("abcdefgh")
+        assert peak == 2
@@ -292,6 +292,22 @@ class TestProcessedDataCache:
         assert len(list(arso_dir.glob("*.npz"))) == 0
         assert len(list(shmu_dir.glob("*.npz"))) == 0
 
+    def test_cleanup_skipped_within_min_interval(
+        self, temp_cache_dir, sample_radar_data
+    ):
+        """A recent sweep should make throttled cleanups a no-op."""
+        cache = ProcessedDataCache(
+            local_dir=temp_cache_dir,
+            ttl_minutes=0,
+            s3_enabled=False,
+        )
+        cache.cleanup_expired()
+        cache.put("arso", "202501281005", "zm", sample_radar_data)
+        time.sleep(0.1)
+
+        assert cache.cleanup_expired(min_interval=300) == 0
+        assert cache.cleanup_expired() == 1
+
     def test_clear_all(self, temp_cache_dir, sample_radar_data):
         """Test clearing all cache entries."""
         cache = ProcessedDataCache(
@@ -408,6 +424,42 @@ class TestProcessedDataCache:
         assert metadata["timestamp"] == "202501281005"
         assert metadata["product"] == "zm"
 
+    def test_metadata_serializes_numpy_values(self, temp_cache_dir, sample_radar_data):
+        """Test that numpy scalars/arrays in source metadata are JSON-encoded."""
+        cache = ProcessedDataCache(
+            local_dir=temp_cache_dir,
+            ttl_minutes=60,
+            s3_enabled=False,
+        )
+
+        sample_radar_data["metadata"]["gain"] = np.float64(0.5)
+        sample_radar_data["metadata"]["nodata"] = np.array([255, 0], dtype=np.uint8)
+
+        local_path = cache.put("arso", "202501281005", "zm", sample_radar_data)
+        metadata = json.loads(local_path.with_suffix(".json").read_text())
+
+        assert metadata["source_metadata"]["gain"] == 0.5
+        assert metadata["source_metadata"]["nodata"] == [255, 0]
+
+    def test_available_timestamps_sees_new_entries(
+        self, temp_cache_dir, sample_radar_data
+    ):
+        """Test that the cached directory listing is refreshed after a put."""
+        cache = ProcessedDataCache(
+            local_dir=temp_cache_dir,
+            ttl_minutes=60,
+            s3_enabled=False,
+        )
+
+        cache.put("arso", "202501281005", "zm", sample_radar_data)
+        assert cache.get_available_timestamps("arso") == ["202501281005"]
+
+        cache.put("arso", "202501281010", "zm", sample_radar_data)
+        assert cache.get_available_timestamps("arso") == [
+            "202501281010",
+            "202501281005",
+        ]
+
     def test_timestamp_normalization(self, temp_cache_dir, sample_radar_data):
         """Test that timestamps are normalized to 12 characters."""
         cache = ProcessedDataCache(
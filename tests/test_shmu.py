@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Tests for the SHMU radar source.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import numpy as np
+import pytest
+
+from imeteo_radar.sources import shmu
+from imeteo_radar.sources.shmu import SHMURadarSource
+
+
+@pytest.fixture
+def make_source(tmp_path):
+    """Build SHMU sources whose availability cache lives under tmp_path."""
+    sources = []
+
+    def factory(**kwargs):
+        source = SHMURadarSource(**kwargs)
+        source.availability_cache_dir = tmp_path / "availability"
+        sources.append(source)
+        return source
+
+    yield factory
+    for source in sources:
+        source.session.close()
+
+
+class TestAvailabilityConcurrency:
+    """Tests for the max_avail_workers setting."""
+
+    @pytest.mark.parametrize("avail_workers", [2, 4])
+    def test_threaded_probes_respect_setting_on_shared_pool(
+        self, make_source, monkeypatch, avail_workers
+    ):
+        """Should cap threaded HEAD probes even on a larger shared executor."""
+        monkeypatch.setattr(shmu, "HTTPX_AVAILABLE", False)
+        source = make_source(max_workers=16, max_avail_workers=avail_workers)
+        lock = threading.Lock()
+        running = peak = 0
+
+        def check(timestamp, product):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return True
+
+        monkeypatch.setattr(source, "_check_timestamp_availability", check)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            result = source.get_available_timestamps(count=8, executor=pool)
+
+        assert len(result) == 8
+        assert peak == avail_workers
+
+    def test_http2_client_uses_setting_as_connection_limit(
+        self, make_source, monkeypatch
+    ):
+        """Should size the HTTP/2 connection pool from max_avail_workers."""
+        httpx = pytest.importorskip("httpx")
+        source = make_source(max_avail_workers=3)
+        limits = []
+        real_client = httpx.AsyncClient
+
+        def fake_client(**kwargs):
+            limits.append(kwargs.pop("limits"))
+            transport = httpx.MockTransport(lambda request: httpx.Response(200))
+            return real_client(transport=transport, **kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", fake_client)
+
+        found = source._check_many_availability(["20250128100000"], "zmax")
+
+        assert found == {"20250128100000"}
+        assert limits[0].max_connections == 3
+
+    def test_running_event_loop_falls_back_to_threads(
+        self, make_source, monkeypatch, recwarn
+    ):
+        """Should probe with threads inside a running loop, leaving no coroutine."""
+        source = make_source()
+        monkeypatch.setattr(
+            source, "_check_timestamp_availability", lambda timestamp, product: True
+        )
+
+        async def fetch():
+            return source.get_available_timestamps(count=2)
+
+        result = asyncio.run(fetch())
+        gc.collect()
+
+        assert len(result) == 2
+        assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+CANDIDATES = ["20250128101000", "20250128100500", "20250128100000", "20250128095500"]
+
+
+@pytest.fixture
+def fixed_candidates(monkeypatch):
+    """Make SHMU probe a fixed list of candidate timestamps."""
+    monkeypatch.setattr(
+        shmu, "generate_timestamp_candidates", lambda **kwargs: list(CANDIDATES)
+    )
+
+
+def _write_cache(source, entries, product="zmax"):
+    path = source.availability_cache_dir / f"shmu_{product}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(entries if isinstance(entries, str) else json.dumps(entries))
+    return path
+
+
+class TestAvailabilityCache:
+    """Tests for timestamps remembered across runs."""
+
+    def test_load_keeps_only_fresh_numeric_entries(self, make_source):
+        """Should drop entries older than the TTL or without a numeric time."""
+        source = make_source()
+        now = time.time()
+        _write_cache(
+            source,
+            {
+                "20250128100500": now - 60,
+                "20250128100000": now - shmu.AVAILABILITY_TTL_SECONDS - 60,
+                "20250128095500": "yesterday",
+            },
+        )
+
+        assert source._load_known_available("zmax") == {"20250128100500": now - 60}
+
+    @pytest.mark.parametrize("content", ["{not json", "[1, 2]", '"text"'])
+    def test_load_ignores_corrupt_or_non_dict_cache(self, make_source, content):
+        """Should treat an unreadable cache as empty."""
+        source = make_source()
+        _write_cache(source, content)
+
+        assert source._load_known_available("zmax") == {}
+
+    def test_remember_rewrites_only_with_new_timestamps(self, make_source, monkeypatch):
+        """Should keep known entries' times and skip the write if nothing is new."""
+        source = make_source()
+        known = {"20250128100000": 1000.0}
+        started = time.time()
+
+        source._remember_available("zmax", known, ["20250128100500", "20250128100000"])
+
+        path = source.availability_cache_dir / "shmu_zmax.json"
+        entries = json.loads(path.read_text())
+        assert entries.keys() == {"20250128100000", "20250128100500"}
+        assert entries["20250128100000"] == 1000.0
+        assert entries["20250128100500"] >= started
+
+        def fail_replace(*args):
+            raise AssertionError("cache rewritten without new timestamps")
+
+        monkeypatch.setattr(shmu.os, "replace", fail_replace)
+        source._remember_available("zmax", known, ["20250128100000"])
+
+    def test_remember_replaces_atomically(self, make_source, monkeypatch):
+        """Should leave the old cache intact and no temp file if the swap fails."""
+        source = make_source()
+        path = _write_cache(source, {"20250128100000": 1000.0})
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(shmu.os, "replace", fail_replace)
+        source._remember_available("zmax", {}, ["20250128100500"])
+
+        assert json.loads(path.read_text()) == {"20250128100000": 1000.0}
+        assert os.listdir(path.parent) == [path.name]
+
+    def test_known_timestamps_skip_threaded_probes(
+        self, make_source, monkeypatch, fixed_candidates
+    ):
+        """Should not send HEAD requests for timestamps confirmed recently."""
+        monkeypatch.setattr(shmu, "HTTPX_AVAILABLE", False)
+        source = make_source()
+        _write_cache(source, {CANDIDATES[0]: time.time()})
+        probed = []
+
+        def check(timestamp, product):
+            probed.append(timestamp)
+            return timestamp == CANDIDATES[2]
+
+        monkeypatch.setattr(source, "_check_timestamp_availability", check)
+
+        result = source.get_available_timestamps(count=2)
+
+        assert result == [CANDIDATES[0], CANDIDATES[2]]
+        assert CANDIDATES[0] not in probed
+
+    def test_known_timestamps_skip_http2_probes(
+        self, make_source, monkeypatch, fixed_candidates
+    ):
+        """Should only multiplex probes for timestamps not yet confirmed."""
+        pytest.importorskip("httpx")
+        source = make_source()
+        path = _write_cache(source, {CANDIDATES[1]: time.time()})
+        probed = []
+
+        def check_many(timestamps, product):
+            probed.extend(timestamps)
+            return {CANDIDATES[3]}
+
+        monkeypatch.setattr(source, "_check_many_availability", check_many)
+
+        result = source.get_available_timestamps(count=2)
+
+        assert result == [CANDIDATES[1], CANDIDATES[3]]
+        assert probed == [CANDIDATES[0], CANDIDATES[2], CANDIDATES[3]]
+        assert set(json.loads(path.read_text())) == {CANDIDATES[1], CANDIDATES[3]}
+
+
+@pytest.fixture(scope="module")
+def shmu_files(tmp_path_factory):
+    """Two small synthetic SHMU ODIM_H5 files with different data."""
+    directory = tmp_path_factory.mktemp("shmu")
+    paths = []
+    for i, starttime in enumerate([b"100000", b"100500"]):
+        path = directory / f"shmu_{i}.hdf"
+        with h5py.File(path, "w") as f:
+            data = ((np.arange(40 * 30) + 37 * i) % 256).astype(np.uint8)
+            f.create_dataset("dataset1/data1/data", data=data.reshape(40, 30))
+            f.create_group("dataset1/what").attrs.update(
+                {
+                    "gain": 0.5,
+                    "offset": -32.0,
+                    "nodata": 255.0,
+                    "undetect": 0.0,
+                    "quantity": b"DBZH",
+                    "product": b"MAX",
+                    "startdate": b"20250128",
+                    "starttime": starttime,
+                }
+            )
+            f.create_group("where").attrs.update(
+                {"LL_lon": 13.6, "LL_lat": 46.0, "UR_lon": 23.8, "UR_lat": 50.7}
+            )
+        paths.append(str(path))
+    return paths
+
+
+class TestProcessMany:
+    """Tests for SHMURadarSource.process_many."""
+
+    def test_pool_results_match_in_process(self, make_source, shmu_files):
+        """Should return the same results, in order, as process_to_array."""
+        source = make_source()
+
+        results = source.process_many(shmu_files, max_workers=2, dtype="int8")
+
+        assert len(results) == len(shmu_files)
+        for path, result in zip(shmu_files, results):
+            expected = source.process_to_array(path, dtype="int8")
+            assert result["data"].dtype == np.int8
+            np.testing.assert_array_equal(result["data"], expected["data"])
+            assert result["timestamp"] == expected["timestamp"]
+            assert result["extent"] == expected["extent"]
+            assert (
+                result["metadata"]["quantization"]
+                == expected["metadata"]["quantization"]
+            )
+        assert results[0]["timestamp"] != results[1]["timestamp"]
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for SpacesUploader batch operations against a stubbed S3 client.
+"""
+
+import pytest
+from botocore.exceptions import ClientError
+
+from imeteo_radar.utils.spaces_uploader import SpacesUploader
+
+
+class _StubPaginator:
+    """list_objects_v2 paginator over a fixed key set, counting pages served."""
+
+    def __init__(self, keys, page_size):
+        self.keys = sorted(keys)
+        self.page_size = page_size
+        self.pages_served = 0
+        self.kwargs = None
+
+    def paginate(self, Bucket, Prefix="", StartAfter=""):
+        self.kwargs = {"Prefix": Prefix, "StartAfter": StartAfter}
+        keys = [k for k in self.keys if k.startswith(Prefix) and k > StartAfter]
+        for i in range(0, len(keys), self.page_size):
+            self.pages_served += 1
+            yield {"Contents": [{"Key": k} for k in keys[i : i + self.page_size]]}
+
+
+class _StubS3Client:
+    """Records delete_objects calls; fails the batches listed in fail_batches."""
+
+    def __init__(self, paginator=None, fail_batches=()):
+        self.paginator = paginator
+        self.fail_batches = set(fail_batches)
+        self.delete_calls = []
+
+    def get_paginator(self, operation):
+        assert operation == "list_objects_v2"
+        return self.paginator
+
+    def delete_objects(self, Bucket, Delete):
+        self.delete_calls.append(Delete["Objects"])
+        if len(self.delete_calls) - 1 in self.fail_batches:
+            raise ClientError({"Error": {"Code": "500"}}, "DeleteObjects")
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        return {
+            "Deleted": [{"Key": key} for key in keys[1:]],
+            "Errors": [{"Key": keys[0], "Message": "AccessDenied"}],
+        }
+
+
+def _uploader(s3_client):
+    uploader = SpacesUploader.__new__(SpacesUploader)
+    uploader.bucket = "bucket"
+    uploader.s3_client = s3_client
+    return uploader
+
+
+class TestExistingFiles:
+    """Tests for SpacesUploader.existing_files."""
+
+    @pytest.fixture
+    def paginator(self):
+        """Five-minute composites and variants spanning a decimal boundary."""
+        keys = []
+        for ts in range(1738000000, 1738400000, 300):
+            for suffix in (".png", ".avif", "@1000m.png", "@1000m.avif"):
+                keys.append(f"iradar/composite/{ts}{suffix}")
+        return _StubPaginator(keys, page_size=1000)
+
+    def test_lists_only_the_requested_range(self, paginator):
+        """Should start at the smallest name and stop past the largest."""
+        uploader = _uploader(_StubS3Client(paginator))
+        stored = ["1738199800.png", "1738200100.png", "1738200400.png"]
+
+        found = uploader.existing_files("composite", stored + ["1738200000.png"])
+
+        assert found == set(stored)
+        assert paginator.kwargs["Prefix"] == "iradar/composite/1738"
+        assert paginator.kwargs["StartAfter"] == "iradar/composite/1738199800.pn"
+        assert paginator.pages_served == 1
+
+    def test_empty_request_skips_listing(self):
+        """Should not list anything when no filenames are given."""
+        assert _uploader(_StubS3Client()).existing_files("composite", []) == set()
+
+
+class TestDeleteFiles:
+    """Tests for SpacesUploader.delete_files."""
+
+    def test_deletes_in_batches_of_1000(self):
+        """Should send one DeleteObjects request per 1000 keys."""
+        client = _StubS3Client()
+        names = [f"{1738000000 + 300 * i}.png" for i in range(1500)]
+
+        deleted = _uploader(client).delete_files("composite", names)
+
+        assert [len(batch) for batch in client.delete_calls] == [1000, 500]
+        assert client.delete_calls[0][0] == {"Key": "iradar/composite/1738000000.png"}
+        # Each stub batch reports its first key as an error
+        assert deleted == 1498
+
+    def test_failed_batch_does_not_stop_the_rest(self):
+        """Should skip a batch that raises ClientError and keep going."""
+        client = _StubS3Client(fail_batches={0})
+        names = [f"{i}.png" for i in range(1001)]
+
+        deleted = _uploader(client).delete_files("composite", names)
+
+        assert len(client.delete_calls) == 2
+        assert deleted == 0
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Tests for utils.timestamps module - shared timestamp parsing and matching."""
+
+from datetime import datetime, timezone
+
+from imeteo_radar.utils.timestamps import (
+    TimestampFormat,
+    build_normalized_cache,
+    filter_timestamps_by_range,
+    find_common_timestamp,
+    is_timestamp_in_cache,
+    parse_timestamp,
+    round_to_interval,
+    timestamp_to_unix,
+)
+
+
+class TestParseTimestamp:
+    """Test parse_timestamp auto-detection and explicit formats."""
+
+    def test_parses_full_format(self):
+        """14-digit timestamps should include seconds."""
+        assert parse_timestamp("20250128100530") == datetime(2025, 1, 28, 10, 5, 30)
+
+    def test_parses_short_format(self):
+        """12-digit timestamps should parse to minute precision."""
+        assert parse_timestamp("202501281005") == datetime(2025, 1, 28, 10, 5)
+
+    def test_parses_underscore_format(self):
+        """DWD/OMSZ YYYYMMDD_HHMM timestamps should be auto-detected."""
+        assert parse_timestamp("20250128_1005") == datetime(2025, 1, 28, 10, 5)
+
+    def test_explicit_format(self):
+        """An explicit format should be used as-is."""
+        assert parse_timestamp("20250128_1005", TimestampFormat.UNDERSCORE) == datetime(
+            2025, 1, 28, 10, 5
+        )
+
+    def test_invalid_returns_none(self):
+        """Unparseable strings should return None rather than raise."""
+        assert parse_timestamp("not-a-timestamp") is None
+        assert parse_timestamp("202501") is None
+        assert parse_timestamp("20250128_1005", TimestampFormat.FULL) is None
+
+    def test_repeated_calls_return_equal_results(self):
+        """Memoized results should be identical across calls."""
+        first = parse_timestamp("202501281005")
+        assert parse_timestamp("202501281005") is first
+
+    def test_out_of_range_seconds_fall_back_to_short(self):
+        """Invalid seconds should fall back to the 12-digit interpretation."""
+        assert parse_timestamp("20250128100560") == datetime(2025, 1, 28, 10, 5)
+
+    def test_longer_strings_parse_leading_digits(self):
+        """Strings longer than 14 chars should parse their leading timestamp."""
+        assert parse_timestamp("2025012810053099") == datetime(2025, 1, 28, 10, 5, 30)
+
+
+class TestFindCommonTimestamp:
+    """Test composite timestamp matching across sources."""
+
+    def test_returns_newest_window_with_all_sources(self):
+        """The newest candidate covering every required source should win."""
+        groups = {
+            "202501281000": {"dwd": "d1000", "shmu": "s1000"},
+            "202501281005": {"dwd": "d1005"},
+            "202501281006": {"shmu": "s1006"},
+            "202501281015": {"dwd": "d1015"},
+        }
+
+        ts, files = find_common_timestamp(groups, {"dwd", "shmu"}, 2)
+
+        assert ts == "202501281006"
+        assert files == {"dwd": "d1005", "shmu": "s1006"}
+
+    def test_prefers_closest_file_per_source(self):
+        """Within the window, each source should use its closest timestamp."""
+        groups = {
+            "202501281003": {"dwd": "d1003"},
+            "202501281005": {"shmu": "s1005"},
+            "202501281006": {"dwd": "d1006"},
+        }
+
+        ts, files = find_common_timestamp(groups, {"dwd", "shmu"}, 2)
+
+        assert ts == "202501281006"
+        assert files == {"dwd": "d1006", "shmu": "s1005"}
+
+    def test_no_match_returns_none(self):
+        """Sources further apart than the tolerance should not match."""
+        groups = {
+            "202501281000": {"dwd": "d1000"},
+            "202501281010": {"shmu": "s1010"},
+        }
+
+        assert find_common_timestamp(groups, {"dwd", "shmu"}, 2) == (None, None)
+
+
+class TestTimestampCache:
+    """Test cache membership checks across timestamp formats."""
+
+    def test_matches_across_formats(self):
+        """Underscore, 12- and 14-digit forms should all match one entry."""
+        cached = build_normalized_cache(["202501281005", "20250128101000"])
+
+        assert is_timestamp_in_cache("202501281005", cached)
+        assert is_timestamp_in_cache("20250128100500", cached)
+        assert is_timestamp_in_cache("20250128_1005", cached)
+        assert is_timestamp_in_cache("20250128_1010", cached)
+
+    def test_missing_timestamp(self):
+        """Timestamps not in the cache should not match."""
+        cached = build_normalized_cache(["202501281005"])
+
+        assert not is_timestamp_in_cache("202501281015", cached)
+        assert not is_timestamp_in_cache("202501281005", build_normalized_cache([]))
+
+
+class TestTimestampToUnix:
+    """Test conversion of timestamp strings to Unix time."""
+
+    def test_utc_default(self):
+        """Naive timestamps should be interpreted as UTC by default."""
+        assert timestamp_to_unix("202501281005") == 1738058700
+
+    def test_named_timezone_handles_dst(self):
+        """Named zones should apply the offset valid at that date."""
+        assert timestamp_to_unix("202501281005", "Europe/Bratislava") == 1738055100
+        assert timestamp_to_unix("202507281005", "Europe/Bratislava") == 1753689900
+
+
+class TestFilterTimestampsByRange:
+    """Test range filtering across bound timezones."""
+
+    TIMESTAMPS = ["202501280955", "202501281000", "20250128_1030", "202501281100"]
+
+    def test_aware_bounds_are_inclusive(self):
+        """Timestamps equal to either bound should be kept."""
+        start = datetime(2025, 1, 28, 10, 0, tzinfo=timezone.utc)
+        end = datetime(2025, 1, 28, 10, 30, tzinfo=timezone.utc)
+
+        result = filter_timestamps_by_range(self.TIMESTAMPS, start, end)
+
+        assert result == ["202501281000", "20250128_1030"]
+
+    def test_naive_bounds_are_treated_as_utc(self):
+        """Naive bounds should behave like UTC-aware bounds."""
+        start = datetime(2025, 1, 28, 10, 0)
+        end = datetime(2025, 1, 28, 11, 0)
+
+        result = filter_timestamps_by_range(self.TIMESTAMPS + ["garbage"], start, end)
+
+        assert result == ["202501281000", "20250128_1030", "202501281100"]
+
+
+class TestRoundToInterval:
+    """Test flooring datetimes to product intervals."""
+
+    def test_rounds_down_and_drops_seconds(self):
+        """Minutes should floor to the interval with seconds cleared."""
+        dt = datetime(2025, 1, 28, 10, 7, 42, 123)
+        assert round_to_interval(dt) == datetime(2025, 1, 28, 10, 5)
+        assert round_to_interval(dt, 15) == datetime(2025, 1, 28, 10, 0)
+
+    def test_aligned_datetime_is_returned_unchanged(self):
+        """Already-aligned datetimes should be returned as-is."""
+        dt = datetime(2025, 1, 28, 10, 5, tzinfo=timezone.utc)
+        assert round_to_interval(dt) is dt